@@ -0,0 +1,100 @@
+# benchmarks/fidelity_batch.py
+"""Compare scalar and batch FidelitySystem scoring
+
+Run with: python -m benchmarks.fidelity_batch
+"""
+import time
+import numpy as np
+
+from src.core.fidelity_system import FidelitySystem
+
+SCALES = 2
+
+def make_inputs(rows: int, rng: np.random.Generator):
+    """Random inputs for `rows` districts"""
+    def u(*shape):
+        return rng.random(shape)
+    return {
+        'physics': {
+            'scale_weights': np.full((rows, SCALES), 1.0 / SCALES),
+            'physical_accuracy': u(rows, SCALES),
+            'interaction_complexity': u(rows, SCALES),
+            'energy_drift': u(rows, SCALES) + 0.1
+        },
+        'structural': {
+            'material_correctness': u(rows),
+            'architectural_fidelity': u(rows),
+            'deviation_reference': u(rows) + 0.1
+        },
+        'behavioral': {
+            'social_response': u(rows),
+            'cultural_dynamics': u(rows),
+            'human_baseline': u(rows) + 0.1,
+            'emergent_factor': u(rows)
+        },
+        'cognitive': {
+            'reasoning_capability': u(rows),
+            'learning_efficiency': u(rows),
+            'consciousness_emergence': u(rows),
+            'theoretical_ceiling': u(rows) + 0.5
+        },
+        'data': {
+            'data_accuracy': u(rows),
+            'update_frequency': u(rows),
+            'error_rate': u(rows),
+            'quality_factor': u(rows)
+        }
+    }
+
+def run_scalar(system: FidelitySystem, inputs, rows: int) -> np.ndarray:
+    """Score every row through the scalar calculate_* methods"""
+    p, s, b, c, d = (inputs[k] for k in ('physics', 'structural', 'behavioral', 'cognitive', 'data'))
+    totals = np.empty(rows)
+    for i in range(rows):
+        system.calculate_physics_fidelity(
+            dict(enumerate(p['scale_weights'][i])),
+            dict(enumerate(p['physical_accuracy'][i])),
+            dict(enumerate(p['interaction_complexity'][i])),
+            dict(enumerate(p['energy_drift'][i]))
+        )
+        system.calculate_structural_fidelity(
+            s['material_correctness'][i], s['architectural_fidelity'][i],
+            s['deviation_reference'][i], 1
+        )
+        system.calculate_behavioral_fidelity(
+            b['social_response'][i], b['cultural_dynamics'][i],
+            b['human_baseline'][i], b['emergent_factor'][i]
+        )
+        system.calculate_cognitive_fidelity(
+            c['reasoning_capability'][i], c['learning_efficiency'][i],
+            c['consciousness_emergence'][i], c['theoretical_ceiling'][i]
+        )
+        system.calculate_data_fidelity(
+            d['data_accuracy'][i], d['update_frequency'][i],
+            d['error_rate'][i], d['quality_factor'][i]
+        )
+        totals[i] = system.calculate_total_fidelity()
+    return totals
+
+def main(sizes=(10_000, 100_000, 1_000_000), scalar_limit: int = 10_000):
+    rng = np.random.default_rng(0)
+    system = FidelitySystem()
+    for rows in sizes:
+        inputs = make_inputs(rows, rng)
+
+        start = time.perf_counter()
+        batch_totals = system.calculate_batch(**inputs)['total']
+        batch_time = time.perf_counter() - start
+
+        # The scalar path is timed on a prefix and extrapolated for large sizes
+        sample = min(rows, scalar_limit)
+        start = time.perf_counter()
+        scalar_totals = run_scalar(system, inputs, sample)
+        scalar_time = (time.perf_counter() - start) * rows / sample
+
+        assert np.allclose(scalar_totals, batch_totals[:sample])
+        print(f"{rows:>9} rows  scalar {scalar_time:8.3f}s  batch {batch_time:8.4f}s  "
+              f"speedup {scalar_time / batch_time:8.1f}x")
+
+if __name__ == "__main__":
+    main()
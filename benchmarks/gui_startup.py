@@ -0,0 +1,90 @@
+# benchmarks/gui_startup.py
+"""Cold-start time of the GUI, from process launch to first paint
+
+Each run is a fresh interpreter, so imports are measured cold. Without a
+display, Qt's offscreen platform is used.
+
+Run with: python -m benchmarks.gui_startup [--runs 5] [--max-ms 1500]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+def child():
+    """Launch the main window and report timings (ms since launch) as JSON"""
+    launched = float(os.environ['STARTUP_LAUNCHED'])
+    marks = {}
+
+    def mark(name):
+        marks[name] = (time.time() - launched) * 1000.0
+
+    mark('interpreter')
+    from PyQt6.QtCore import QEvent, QObject, QTimer
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication(sys.argv)
+    from src.ui.main_window import MainWindow
+    mark('imports')
+    window = MainWindow()
+    mark('constructed')
+
+    class FirstPaint(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint and 'first_paint' not in marks:
+                mark('first_paint')
+                poll.start()
+            return False
+
+    def engine_ready():
+        # The engine is created after the first paint; wait for it, then stop
+        if window.simulation_engine is not None:
+            mark('engine_ready')
+            poll.stop()
+            app.quit()
+
+    poll = QTimer()
+    poll.setInterval(0)
+    poll.timeout.connect(engine_ready)
+    watcher = FirstPaint()
+    app.installEventFilter(watcher)
+    window.show()
+    app.exec()
+    print(json.dumps(marks))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure GUI cold start to first paint")
+    parser.add_argument('--runs', type=int, default=5, help="number of cold starts")
+    parser.add_argument('--max-ms', type=float, default=None,
+                        help="exit with status 1 if the median first paint is slower")
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.child:
+        child()
+        return
+
+    env = dict(os.environ)
+    if not env.get('DISPLAY') and not env.get('WAYLAND_DISPLAY'):
+        env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    runs = []
+    for _ in range(args.runs):
+        env['STARTUP_LAUNCHED'] = repr(time.time())
+        output = subprocess.run([sys.executable, '-m', 'benchmarks.gui_startup', '--child'],
+                                env=env, capture_output=True, text=True, check=True).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+
+    summary = {name: statistics.median(run[name] for run in runs) for name in runs[0]}
+    if args.json:
+        print(json.dumps({'runs': runs, 'median_ms': summary}, indent=2))
+    else:
+        for name, ms in summary.items():
+            print(f"{name:<14}{ms:8.1f} ms")
+    if args.max_ms is not None and summary['first_paint'] > args.max_ms:
+        print(f"first paint {summary['first_paint']:.1f} ms exceeds {args.max_ms:.1f} ms")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
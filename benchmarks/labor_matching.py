@@ -0,0 +1,32 @@
+# benchmarks/labor_matching.py
+"""Matching throughput of LaborSystem
+
+Run with: python -m benchmarks.labor_matching
+"""
+import time
+import numpy as np
+
+from src.economy.labor_system import LaborSystem
+
+def main(sizes=((100_000, 10_000), (1_000_000, 100_000)), city_size: float = 1000.0):
+    rng = np.random.default_rng(0)
+    for workers, employers in sizes:
+        labor = LaborSystem(cell_size=city_size / np.sqrt(employers / 40))
+        labor.set_employers(
+            rng.random(employers) * city_size, rng.random(employers) * city_size,
+            rng.random(employers), rng.uniform(10.0, 50.0, employers),
+            rng.integers(1, 10, employers)
+        )
+        vacancies = labor.vacancies()
+
+        start = time.perf_counter()
+        result = labor.match(
+            rng.random(workers) * city_size, rng.random(workers) * city_size,
+            rng.random(workers), rng.uniform(5.0, 40.0, workers)
+        )
+        elapsed = time.perf_counter() - start
+        print(f"{workers:>8} workers x {employers:>7} employers  {elapsed:6.3f}s  "
+              f"matched {result.matched:>7} of {vacancies} vacancies")
+
+if __name__ == "__main__":
+    main()
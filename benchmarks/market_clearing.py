@@ -0,0 +1,40 @@
+# benchmarks/market_clearing.py
+"""Order submission and batch auction throughput of Market
+
+Run with: python -m benchmarks.market_clearing
+"""
+import time
+import numpy as np
+
+from src.economy.market import Market
+
+def main(order_counts=(10_000, 100_000, 500_000), goods: int = 16, ticks: int = 5):
+    rng = np.random.default_rng(0)
+    for orders in order_counts:
+        market = Market(goods)
+        submit_time = clear_time = 0.0
+        traded = 0.0
+        for _ in range(ticks):
+            agents = rng.integers(0, orders, orders)
+            good_ids = rng.integers(0, goods, orders)
+            sides = rng.integers(0, 2, orders)
+            prices = np.round(rng.normal(100.0, 5.0, orders), 2)
+            quantities = rng.integers(1, 10, orders).astype(float)
+
+            start = time.perf_counter()
+            market.submit(agents, good_ids, sides, prices, quantities)
+            submit_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            results = market.clear()
+            clear_time += time.perf_counter() - start
+            traded += sum(r.volume for r in results.values())
+
+        total = submit_time + clear_time
+        print(f"{orders:>8} orders/tick  submit {submit_time / ticks * 1000:7.1f}ms  "
+              f"clear {clear_time / ticks * 1000:7.1f}ms  "
+              f"{orders * ticks / total:12.0f} orders/sec  "
+              f"resting {market.depth().sum():>8}  volume {traded:.0f}")
+
+if __name__ == "__main__":
+    main()
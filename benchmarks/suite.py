@@ -0,0 +1,292 @@
+# benchmarks/suite.py
+"""Regression benchmarks for the simulation core
+
+Times SimulationEngine.step() at several entity counts, every
+FidelitySystem.calculate_*_fidelity path (cache hit and recompute), entity
+add/remove churn and memory per entity. Results are written as JSON.
+Comparing against a saved baseline fails on any regression above the
+threshold.
+
+It also checks step() allocations in steady state. After a traced warm-up
+of one MetricsHistory ring, memory traced over many steps must not grow
+by more than a fixed handful of bytes: objects replaced in place, never
+one object per tick. The largest transient of any single step must stay
+under a fixed cap for the empty engine; with entities it also holds
+compliance masks of about 17 bytes per entity and is only reported. A
+failure exits with status 1 without needing a baseline.
+
+Run with:
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --compare baseline.json --threshold 0.10
+"""
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.core.fidelity_system import FidelitySystem
+from src.core.run import populate
+from src.core.simulation_engine import SimulationEngine
+
+STEP_ENTITY_COUNTS = (0, 1_000, 10_000, 100_000)
+# (entities, with an event subscriber) configurations checked for allocations
+ALLOCATION_CASES = ((0, False), (10_000, True))
+RETAINED_BYTES_LIMIT = 256    # per run of steps, not per step
+EMPTY_STEP_PEAK_LIMIT = 2048  # metric floats plus one MetricsHistory cascade
+
+# name -> zero-argument function returning (value, unit); lower is better
+BENCHMARKS: Dict[str, Callable[[], Tuple[float, str]]] = {}
+
+def benchmark(name: str):
+    def register(func):
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+def time_per_call(func: Callable[[], None], number: int, repeat: int = 5) -> float:
+    """Best-of-`repeat` seconds per call over `number` calls"""
+    func()  # warm up caches and lazy state
+    best = float('inf')
+    for _ in range(repeat):
+        gc.disable()
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        gc.enable()
+        best = min(best, elapsed / number)
+    return best
+
+def _register_step(entities: int):
+    @benchmark(f"step/{entities}_entities")
+    def step():
+        engine = SimulationEngine(seed=0)
+        populate(engine, entities, engine.stream('entities'))
+        engine.start()
+        number = max(20, 200_000 // max(entities, 1_000))
+        return time_per_call(engine.step, number), 's'
+
+for _count in STEP_ENTITY_COUNTS:
+    _register_step(_count)
+
+# Two input sets per component; alternating between them defeats the
+# FidelitySystem input cache so the compute path is measured
+FIDELITY_INPUTS = {
+    'physics': (
+        ({1: 0.5, 2: 0.5}, {1: 0.8, 2: 0.9}, {1: 0.7, 2: 0.6}, {1: 0.1, 2: 0.2}),
+        ({1: 0.4, 2: 0.6}, {1: 0.7, 2: 0.9}, {1: 0.7, 2: 0.5}, {1: 0.2, 2: 0.2}),
+    ),
+    'structural': ((0.8, 0.7, 0.2, 1), (0.7, 0.8, 0.3, 1)),
+    'behavioral': ((0.75, 0.8, 0.3, 0.2), (0.7, 0.85, 0.3, 0.25)),
+    'cognitive': ((0.7, 0.8, 0.1, 1.0), (0.75, 0.7, 0.2, 1.0)),
+    'data': ((0.9, 0.8, 0.1, 0.9), (0.85, 0.8, 0.2, 0.9)),
+}
+
+def _register_fidelity(component: str):
+    @benchmark(f"fidelity/{component}")
+    def compute():
+        system = FidelitySystem()
+        calculate = getattr(system, f"calculate_{component}_fidelity")
+        first, second = FIDELITY_INPUTS[component]
+
+        def call():
+            calculate(*first)
+            calculate(*second)
+        return time_per_call(call, 5_000) / 2, 's'
+
+    @benchmark(f"fidelity/{component}_cached")
+    def cached():
+        system = FidelitySystem()
+        calculate = getattr(system, f"calculate_{component}_fidelity")
+        inputs = FIDELITY_INPUTS[component][0]
+        return time_per_call(lambda: calculate(*inputs), 20_000), 's'
+
+for _component in FIDELITY_INPUTS:
+    _register_fidelity(_component)
+
+@benchmark("fidelity/total")
+def fidelity_total():
+    system = FidelitySystem()
+    for component, (inputs, _) in FIDELITY_INPUTS.items():
+        getattr(system, f"calculate_{component}_fidelity")(*inputs)
+
+    def call():
+        system._total = None  # force the weighted sum to be recomputed
+        system.calculate_total_fidelity()
+    return time_per_call(call, 20_000), 's'
+
+@benchmark("entities/add_remove")
+def entity_churn():
+    """Seconds per add+remove pair on an engine already holding 10k entities"""
+    engine = SimulationEngine(seed=0)
+    populate(engine, 10_000, engine.stream('entities'))
+    ids = [f"churn_{i}" for i in range(1_000)]
+    entity = {'x': 1.0, 'y': 2.0, 'vx': 0.5, 'vy': -0.5, 'wealth': 10.0}
+
+    def churn():
+        for entity_id in ids:
+            engine.add_entity(entity_id, entity)
+        for entity_id in ids:
+            engine.remove_entity(entity_id)
+    return time_per_call(churn, 10) / len(ids), 's'
+
+@benchmark("entities/memory_per_entity")
+def memory_per_entity():
+    """Traced bytes per entity added through SimulationEngine.add_entity"""
+    count = 100_000
+    ids = [f"entity_{i}" for i in range(count)]  # ids are created outside the trace
+    engine = SimulationEngine(seed=0)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for entity_id in ids:
+            engine.add_entity(entity_id, None)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / count, 'bytes'
+
+def steady_state_allocations(entities: int, subscribe: bool,
+                             warmup: int = 4096, steps: int = 10_000) -> dict:
+    """Traced memory retained over `steps` step() calls and the largest single-step transient
+
+    The subscriber, if any, is never drained, so its mailbox keeps merging.
+    """
+    engine = SimulationEngine(seed=0)
+    populate(engine, entities, engine.stream('entities'))
+    engine.start()
+    if subscribe:
+        subscription = engine.subscribe()
+    tracemalloc.start()
+    try:
+        for _ in range(warmup):
+            engine.step()
+        before = tracemalloc.get_traced_memory()[0]
+        peak = 0
+        for _ in range(steps):
+            tracemalloc.reset_peak()
+            start = tracemalloc.get_traced_memory()[0]
+            engine.step()
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - start)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return {'entities': entities, 'subscriber': subscribe, 'steps': steps,
+            'retained_bytes': after - before, 'peak_bytes': peak}
+
+def check_allocations() -> Tuple[List[dict], bool]:
+    cases = [steady_state_allocations(entities, subscribe)
+             for entities, subscribe in ALLOCATION_CASES]
+    ok = True
+    for case in cases:
+        problems = []
+        if case['retained_bytes'] > RETAINED_BYTES_LIMIT:
+            problems.append('LEAK')
+        if case['entities'] == 0 and case['peak_bytes'] >= EMPTY_STEP_PEAK_LIMIT:
+            problems.append('PEAK')
+        ok = ok and not problems
+        print(f"step() allocations, {case['entities']} entities"
+              f"{' + subscriber' if case['subscriber'] else ''}: "
+              f"{case['retained_bytes']:+d} B retained over {case['steps']} steps, "
+              f"{case['peak_bytes']} B peak step{''.join('  ' + p for p in problems)}",
+              file=sys.stderr)
+    return cases, ok
+
+def run(names: Optional[List[str]] = None) -> Dict[str, dict]:
+    results = {}
+    for name, func in BENCHMARKS.items():
+        if names and not any(part in name for part in names):
+            continue
+        value, unit = func()
+        results[name] = {'value': value, 'unit': unit}
+        print(f"{name:<36}{_format(value, unit):>14}", file=sys.stderr)
+    return results
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    """Names of benchmarks more than `threshold` slower (or larger) than baseline"""
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None or reference['value'] <= 0:
+            continue
+        change = result['value'] / reference['value'] - 1.0
+        marker = ''
+        if change > threshold:
+            regressions.append(name)
+            marker = '  REGRESSION'
+        print(f"{name:<36}{_format(reference['value'], result['unit']):>14} -> "
+              f"{_format(result['value'], result['unit']):>12} {change:+7.1%}{marker}", file=sys.stderr)
+    return regressions
+
+def metadata() -> dict:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+    }
+
+def _format(value: float, unit: str) -> str:
+    if unit == 'bytes':
+        return f"{value:.1f} B"
+    for scale, suffix in ((1e-6, 'us'), (1e-3, 'ms')):
+        if value < scale * 1000:
+            return f"{value / scale:.3f} {suffix}"
+    return f"{value:.3f} s"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the simulation core")
+    parser.add_argument('--output', help="write results JSON here (default: stdout)")
+    parser.add_argument('--compare', metavar='BASELINE', help="results JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="allowed slowdown before failing, as a fraction (default 0.10)")
+    parser.add_argument('--only', action='append', metavar='SUBSTRING',
+                        help="run only benchmarks whose name contains this (repeatable)")
+    parser.add_argument('--list', action='store_true', help="list benchmark names and exit")
+    parser.add_argument('--no-allocations', action='store_true',
+                        help="skip the steady-state allocation check")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return
+    report = {'meta': metadata(), 'results': run(args.only)}
+    allocations_ok = True
+    if not args.no_allocations:
+        report['allocations'], allocations_ok = check_allocations()
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    failed = not allocations_ok
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(report['results'], baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) over {args.threshold:.0%}: {', '.join(regressions)}",
+                  file=sys.stderr)
+            failed = True
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
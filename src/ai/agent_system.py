@@ -0,0 +1,145 @@
+# src/ai/agent_system.py
+import threading
+from typing import Dict, Optional
+import numpy as np
+
+class UtilityPolicy:
+    """Linear utility scoring: action = argmax(state @ W + b)"""
+
+    def __init__(self, n_features: int, n_actions: int, rng: np.random.Generator):
+        self.weights = rng.normal(0.0, 1.0, (n_features, n_actions)).astype(np.float32)
+        self.bias = np.zeros(n_actions, dtype=np.float32)
+
+    def scores(self, states: np.ndarray) -> np.ndarray:
+        return states @ self.weights + self.bias
+
+class MLPPolicy:
+    """One-hidden-layer network: action = argmax(tanh(state @ W1 + b1) @ W2 + b2)"""
+
+    def __init__(self, n_features: int, n_actions: int, rng: np.random.Generator,
+                 hidden: int = 32):
+        scale = 1.0 / np.sqrt(n_features)
+        self.w1 = rng.normal(0.0, scale, (n_features, hidden)).astype(np.float32)
+        self.b1 = np.zeros(hidden, dtype=np.float32)
+        self.w2 = rng.normal(0.0, 1.0 / np.sqrt(hidden), (hidden, n_actions)).astype(np.float32)
+        self.b2 = np.zeros(n_actions, dtype=np.float32)
+
+    def scores(self, states: np.ndarray) -> np.ndarray:
+        return np.tanh(states @ self.w1 + self.b1) @ self.w2 + self.b2
+
+class PolicyGroup:
+    """State matrix and agent ids of all agents sharing one policy"""
+
+    def __init__(self, policy, n_features: int, capacity: int = 256):
+        self.policy = policy
+        self.states = np.zeros((capacity, n_features), dtype=np.float32)
+        self.agent_ids = np.zeros(capacity, dtype=np.int64)
+        self.size = 0
+
+    def append(self, agent_ids: np.ndarray, states: np.ndarray) -> np.ndarray:
+        """Add rows and return their row indices"""
+        end = self.size + len(agent_ids)
+        if end > len(self.agent_ids):
+            capacity = max(end, 2 * len(self.agent_ids))
+            self.states = np.resize(self.states, (capacity, self.states.shape[1]))
+            self.agent_ids = np.resize(self.agent_ids, capacity)
+        rows = np.arange(self.size, end)
+        self.states[rows] = states
+        self.agent_ids[rows] = agent_ids
+        self.size = end
+        return rows
+
+class AgentSystem:
+    """Batched decision making for AI agents
+
+    Agents are grouped by policy. Each group keeps its agents' states in one
+    float32 matrix, so a tick's decisions are one policy evaluation per
+    group (state matrix -> scores -> argmax) instead of a call per agent.
+    """
+
+    def __init__(self, n_features: int = 8, n_actions: int = 4,
+                 rng: Optional[np.random.Generator] = None):
+        self.n_features = n_features
+        self.n_actions = n_actions
+        self.rng = rng or np.random.default_rng()
+        self.groups: Dict[str, PolicyGroup] = {}
+        self.actions = np.zeros(0, dtype=np.int64)  # last action per agent id
+        self._group_of: list = []                    # policy name per agent id
+        self._row_of = np.zeros(0, dtype=np.int64)    # row in its group per agent id
+        self._alive = np.zeros(0, dtype=bool)
+        self._lock = threading.Lock()
+        self.register_policy('utility', UtilityPolicy(n_features, n_actions, self.rng))
+        self.register_policy('mlp', MLPPolicy(n_features, n_actions, self.rng))
+
+    def __len__(self) -> int:
+        return sum(group.size for group in self.groups.values())
+
+    def register_policy(self, name: str, policy):
+        """Add a policy type; it must provide scores(states) -> (n, n_actions)"""
+        if name in self.groups:
+            raise ValueError(f"Policy '{name}' already registered")
+        self.groups[name] = PolicyGroup(policy, self.n_features)
+
+    def add_agents(self, policy: str, states: np.ndarray) -> np.ndarray:
+        """Add agents using `policy` with the given (n, n_features) states"""
+        states = np.atleast_2d(np.asarray(states, dtype=np.float32))
+        if states.shape[1] != self.n_features:
+            raise ValueError(f"Agent states must have {self.n_features} features")
+        group = self.groups[policy]
+        with self._lock:
+            first = len(self._group_of)
+            ids = np.arange(first, first + len(states))
+            rows = group.append(ids, states)
+            self._group_of.extend([policy] * len(ids))
+            self._row_of = np.append(self._row_of, rows)
+            self._alive = np.append(self._alive, np.ones(len(ids), dtype=bool))
+            self.actions = np.append(self.actions, np.zeros(len(ids), dtype=np.int64))
+        return ids
+
+    def add_agent(self, policy: str = 'utility', state: Optional[np.ndarray] = None) -> int:
+        """Add one agent, with a random state when none is given"""
+        if state is None:
+            state = self.rng.normal(0.0, 1.0, self.n_features)
+        return int(self.add_agents(policy, state)[0])
+
+    def remove_agent(self, agent_id: int):
+        """Remove an agent by moving its group's last row into its slot"""
+        with self._lock:
+            group, row = self._locate(agent_id)
+            last = group.size - 1
+            moved = group.agent_ids[last]
+            group.states[row] = group.states[last]
+            group.agent_ids[row] = moved
+            self._row_of[moved] = row
+            group.size = last
+            self._alive[agent_id] = False
+
+    def states(self, policy: str) -> np.ndarray:
+        """View of the state matrix of one policy group"""
+        group = self.groups[policy]
+        return group.states[:group.size]
+
+    def set_state(self, agent_id: int, state: np.ndarray):
+        """Replace the state of a live agent (KeyError for unknown or removed ids)"""
+        state = np.asarray(state, dtype=np.float32)
+        if state.shape != (self.n_features,):
+            raise ValueError(f"Agent states must have {self.n_features} features")
+        with self._lock:
+            group, row = self._locate(agent_id)
+            group.states[row] = state
+
+    def _locate(self, agent_id: int):
+        """Group and current row of a live agent; rows move when others are removed"""
+        if not 0 <= agent_id < len(self._alive) or not self._alive[agent_id]:
+            raise KeyError(agent_id)
+        return self.groups[self._group_of[agent_id]], self._row_of[agent_id]
+
+    def decide(self) -> np.ndarray:
+        """Compute every live agent's action; returns actions indexed by agent id"""
+        with self._lock:
+            for group in self.groups.values():
+                if group.size == 0:
+                    continue
+                scores = group.policy.scores(group.states[:group.size])
+                self.actions[group.agent_ids[:group.size]] = np.argmax(scores, axis=1)
+        return self.actions
@@ -0,0 +1,90 @@
+# src/ai/consciousness_system.py
+from typing import Optional
+import numpy as np
+from scipy import sparse
+
+class ConsciousnessSystem:
+    """Awareness propagation over a sparse social-influence graph
+
+    The graph is a row-normalised CSR matrix W where W[i, j] is how much
+    node i listens to node j. Each tick, with neighbourhood influence
+    h = W @ a:
+
+        a <- clip((1 - λ) * a + λ * h + r * a * (1 - a) * h, 0, 1)
+
+    λ is the social learning rate and r the self-reinforcement rate. The
+    update is one sparse mat-vec, so the cost per tick is O(edges).
+
+    emergence is the mean awareness and learning_efficiency the mean
+    agreement with the neighbourhood (1 - |a - h|). Before a graph is
+    loaded both report their baseline values.
+    """
+
+    def __init__(self, learning_rate: float = 0.1, reinforcement: float = 0.05,
+                 baseline_learning: float = 0.8, baseline_emergence: float = 0.1,
+                 rng: Optional[np.random.Generator] = None):
+        self.learning_rate = learning_rate
+        self.reinforcement = reinforcement
+        self.rng = rng or np.random.default_rng()
+        self.graph: Optional[sparse.csr_matrix] = None
+        self.awareness = np.zeros(0, dtype=np.float32)
+        self.emergence = baseline_emergence
+        self.learning_efficiency = baseline_learning
+
+    @property
+    def nodes(self) -> int:
+        return len(self.awareness)
+
+    @property
+    def edges(self) -> int:
+        return 0 if self.graph is None else self.graph.nnz
+
+    def set_graph(self, sources, targets, weights=None, nodes: Optional[int] = None,
+                  awareness: Optional[np.ndarray] = None):
+        """Load the graph from edge arrays (source listens to target)
+
+        Rows are normalised so each node's incoming influence sums to 1.
+        Initial awareness defaults to uniform random values.
+        """
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        if nodes is None:
+            nodes = int(max(sources.max(initial=-1), targets.max(initial=-1))) + 1
+        if weights is None:
+            weights = np.ones(len(sources), dtype=np.float32)
+        graph = sparse.csr_matrix(
+            (np.asarray(weights, dtype=np.float32), (sources, targets)), shape=(nodes, nodes)
+        )
+        row_sums = np.asarray(graph.sum(axis=1)).ravel()
+        scale = np.divide(1.0, row_sums, out=np.zeros_like(row_sums), where=row_sums > 0)
+        self.graph = (sparse.diags(scale.astype(np.float32)) @ graph).tocsr()
+
+        if awareness is None:
+            awareness = self.rng.random(nodes)
+        self.awareness = np.asarray(awareness, dtype=np.float32).copy()
+        self._measure(self.graph @ self.awareness)
+
+    def random_graph(self, nodes: int, degree: int):
+        """Load a random graph where every node listens to `degree` others"""
+        sources = np.repeat(np.arange(nodes), degree)
+        targets = self.rng.integers(0, nodes, nodes * degree)
+        self.set_graph(sources, targets, nodes=nodes)
+
+    def step(self):
+        """Propagate awareness one tick"""
+        if self.graph is None:
+            return
+        a = self.awareness
+        influence = self.graph @ a
+        reinforcement = self.reinforcement * a * (1.0 - a) * influence
+        a *= 1.0 - self.learning_rate
+        a += self.learning_rate * influence
+        a += reinforcement
+        np.clip(a, 0.0, 1.0, out=a)
+        self._measure(influence)
+
+    def _measure(self, influence: np.ndarray):
+        if self.nodes == 0:
+            return
+        self.emergence = float(self.awareness.mean())
+        self.learning_efficiency = float(1.0 - np.abs(self.awareness - influence).mean())
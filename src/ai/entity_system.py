@@ -0,0 +1,228 @@
+# src/ai/entity_system.py
+from typing import Optional, Tuple
+import numpy as np
+from scipy.spatial import cKDTree
+
+class SpatialGrid:
+    """Uniform-grid spatial index over a set of 2D points
+
+    Points are bucketed into square cells of `cell_size`; the index is a
+    sort of point ids by cell key plus the start of every occupied cell.
+    `move` recomputes cell keys only for the points given and the sort is
+    redone lazily, on the next query, and only if some point changed cell.
+    `set_points` copies the coordinates and defers all work to the next
+    query.
+    """
+
+    def __init__(self, cell_size: float = 10.0):
+        self.cell_size = cell_size
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+        self.active = np.empty(0, dtype=bool)
+        self.keys = np.empty(0, dtype=np.int64)
+        self._dirty = True
+        self._order = np.empty(0, dtype=np.int64)
+        self._cells = np.empty(0, dtype=np.int64)
+        self._starts = np.empty(0, dtype=np.int64)
+        self._ends = np.empty(0, dtype=np.int64)
+        self._keys_stale = False
+        self._tree: Optional[cKDTree] = None
+
+    def __len__(self) -> int:
+        return int(self.active.sum())
+
+    def set_points(self, x: np.ndarray, y: np.ndarray, active: Optional[np.ndarray] = None):
+        """Replace all points; inactive points are ignored by queries"""
+        # Copies, so move() never writes through into the caller's arrays
+        self.x = np.array(x, dtype=np.float64)
+        self.y = np.array(y, dtype=np.float64)
+        self.active = np.ones(len(self.x), dtype=bool) if active is None else np.array(active, dtype=bool)
+        self._keys_stale = True
+        self._invalidate()
+
+    def move(self, ids: np.ndarray, x: np.ndarray, y: np.ndarray):
+        """Update the positions of some points"""
+        self._refresh_keys()
+        self.x[ids] = x
+        self.y[ids] = y
+        self._tree = None
+        keys = self._cell_keys(self.x[ids], self.y[ids])
+        if np.any(keys != self.keys[ids]):
+            self.keys[ids] = keys
+            self._dirty = True
+
+    def query_radius(self, qx: np.ndarray, qy: np.ndarray, radius: float) -> Tuple[np.ndarray, np.ndarray]:
+        """All (query, point) pairs closer than `radius`
+
+        Returns two equal-length arrays: the query index and the point id of
+        every pair, grouped by query.
+        """
+        self._build()
+        qx = np.asarray(qx, dtype=np.float64)
+        qy = np.asarray(qy, dtype=np.float64)
+        if len(self._cells) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        reach = int(np.ceil(radius / self.cell_size))
+        cx = np.floor(qx / self.cell_size).astype(np.int64)
+        cy = np.floor(qy / self.cell_size).astype(np.int64)
+
+        queries, points = [], []
+        for dx in range(-reach, reach + 1):
+            for dy in range(-reach, reach + 1):
+                keys = self._pack(cx + dx, cy + dy)
+                cell = np.minimum(np.searchsorted(self._cells, keys), len(self._cells) - 1)
+                found = self._cells[cell] == keys
+                starts = np.where(found, self._starts[cell], 0)
+                counts = np.where(found, self._ends[cell] - starts, 0)
+                q, p = _expand_ranges(starts, counts)
+                queries.append(q)
+                points.append(self._order[p])
+
+        queries = np.concatenate(queries)
+        points = np.concatenate(points)
+        d2 = (self.x[points] - qx[queries]) ** 2 + (self.y[points] - qy[queries]) ** 2
+        keep = d2 <= radius * radius
+        queries, points = queries[keep], points[keep]
+        order = np.argsort(queries, kind='stable')
+        return queries[order], points[order]
+
+    def neighbors(self, radius: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Radius query for every active point, excluding self-pairs"""
+        ids = np.flatnonzero(self.active)
+        queries, points = self.query_radius(self.x[ids], self.y[ids], radius)
+        queries = ids[queries]
+        keep = queries != points
+        return queries[keep], points[keep]
+
+    def query_knn(self, qx: np.ndarray, qy: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Distances and point ids of the k nearest active points per query
+
+        Uses a KD-tree built on first use and reused until points move.
+        Missing neighbours (fewer than k points) have id -1.
+        """
+        if self._tree is None:
+            ids = np.flatnonzero(self.active)
+            self._tree = cKDTree(np.column_stack((self.x[ids], self.y[ids])))
+            self._tree_ids = ids
+        count = len(self._tree_ids)
+        if count == 0:
+            return np.full((len(qx), k), np.inf), np.full((len(qx), k), -1, dtype=np.int64)
+        distances, idx = self._tree.query(np.column_stack((qx, qy)), k=k)
+        idx = np.asarray(idx).reshape(len(qx), k)
+        missing = idx >= count
+        points = np.where(missing, -1, self._tree_ids[np.minimum(idx, count - 1)])
+        return np.asarray(distances).reshape(len(qx), k), points
+
+    def _invalidate(self):
+        self._dirty = True
+        self._tree = None
+
+    def _refresh_keys(self):
+        if self._keys_stale:
+            self.keys = self._cell_keys(self.x, self.y)
+            self._keys_stale = False
+
+    def _build(self):
+        if not self._dirty:
+            return
+        self._refresh_keys()
+        ids = np.flatnonzero(self.active)
+        keys = self.keys[ids]
+        order = np.argsort(keys, kind='stable')
+        self._order = ids[order]
+        self._cells, self._starts = np.unique(keys[order], return_index=True)
+        self._ends = np.append(self._starts[1:], len(order)).astype(np.int64)
+        self._dirty = False
+
+    def _cell_keys(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        return self._pack(np.floor(x / self.cell_size).astype(np.int64),
+                          np.floor(y / self.cell_size).astype(np.int64))
+
+    @staticmethod
+    def _pack(cx: np.ndarray, cy: np.ndarray) -> np.ndarray:
+        return (cx << 32) ^ (cy & 0xFFFFFFFF)
+
+def _expand_ranges(starts: np.ndarray, counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Flatten ranges [starts[i], starts[i] + counts[i]) into (i, position) pairs"""
+    total = int(counts.sum())
+    owners = np.repeat(np.arange(len(starts)), counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    return owners, starts[owners] + offsets
+
+class EntitySystem:
+    """Neighbourhood queries over the entities of an EntityStore
+
+    `sync` records the store after its positions have been updated for
+    the tick; the grid is brought up to date only when a query runs. The
+    grid keeps its own copy of the points: a change of rows replaces them,
+    otherwise only the rows whose position changed are moved, so the index
+    is re-sorted only when some entity left its cell.
+    """
+
+    def __init__(self, cell_size: float = 10.0):
+        self.grid = SpatialGrid(cell_size)
+        self._store = None
+        self._synced = None  # store the grid's points were taken from
+        self._structure_version = -1
+        self._x_version = -1
+        self._y_version = -1
+
+    def sync(self, store):
+        """Track the current positions and live rows of an EntityStore"""
+        self._store = store
+
+    def _update(self):
+        store = self._store
+        if store is None:
+            return
+        x, y = store.column('x'), store.column('y')
+        x_version, y_version = store.column_versions['x'], store.column_versions['y']
+        grid = self.grid
+        if store is not self._synced or store.structure_version != self._structure_version:
+            grid.set_points(x, y, store.alive[:store.size])
+            self._synced = store
+            self._structure_version = store.structure_version
+        elif x_version != self._x_version or y_version != self._y_version:
+            moved = np.flatnonzero((x != grid.x) | (y != grid.y))
+            if len(moved):
+                grid.move(moved, x[moved], y[moved])
+        self._x_version = x_version
+        self._y_version = y_version
+
+    def neighbors(self, radius: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Row pairs (entity, neighbour) closer than `radius`"""
+        self._update()
+        return self.grid.neighbors(radius)
+
+    def neighbor_counts(self, radius: float) -> np.ndarray:
+        """Number of neighbours within `radius` for every row"""
+        rows, _ = self.neighbors(radius)
+        return np.bincount(rows, minlength=len(self.grid.x))
+
+    def nearest(self, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """k nearest other entities for every row (distances, rows)
+
+        Free rows, and neighbours missing because there are too few
+        entities, have row -1 and an infinite distance.
+        """
+        self._update()
+        grid = self.grid
+        live = np.flatnonzero(grid.active)
+        found_distances, found = grid.query_knn(grid.x[live], grid.y[live], k + 1)
+        # Drop each entity's own row wherever it landed among ties at
+        # distance 0, or the farthest result if a tie pushed it out
+        is_self = found == live[:, None]
+        drop = np.where(is_self.any(axis=1), is_self.argmax(axis=1), k)
+        keep = np.ones(found.shape, dtype=bool)
+        keep[np.arange(len(live)), drop] = False
+        distances = np.full((len(grid.x), k), np.inf)
+        rows = np.full((len(grid.x), k), -1, dtype=np.int64)
+        distances[live] = found_distances[keep].reshape(len(live), k)
+        rows[live] = found[keep].reshape(len(live), k)
+        return distances, rows
+
+    def within(self, x: float, y: float, radius: float) -> np.ndarray:
+        """Rows of the entities within `radius` of a point"""
+        self._update()
+        _, rows = self.grid.query_radius(np.array([x]), np.array([y]), radius)
+        return rows
@@ -0,0 +1,321 @@
+# src/core/checkpoint.py
+"""Binary checkpoints of a SimulationEngine
+
+A checkpoint is a directory holding one .npy file per entity column, the
+alive mask and entity ids, plus header.json with the scalar state (time
+step, metrics, fidelity components, weights and inputs, random stream
+states). The subsystems that carry state from tick to tick are saved the
+same way, their arrays as <subsystem>_<name>.npy files and their scalars
+in a header section: the consciousness graph and awareness, the agent
+groups and policies, and the economy (ledger rows and aggregates, rolling
+indicators, order books and the labor market). Entity columns can be
+loaded memory-mapped, so restoring large states does not have to read
+everything up front.
+"""
+import json
+import os
+import shutil
+from dataclasses import asdict
+from typing import Any, Dict, Optional
+
+import numpy as np
+from scipy import sparse
+
+from .entity_store import EntityStore
+from .simulation_engine import SimulationEngine
+from ..economy.transactions import COLUMNS, TransactionLedger
+
+FORMAT_VERSION = 2
+
+def save_checkpoint(engine: SimulationEngine, path: str, include_payloads: bool = False):
+    """Write the engine state to the directory `path`
+
+    Entity payload objects are only pickled when `include_payloads` is set;
+    otherwise entities are restored from their columns with no payload.
+    The checkpoint is written to a temporary directory and renamed into
+    place, so an interrupted save never leaves a half-written checkpoint.
+    """
+    state = engine.state
+    store = state.entities
+    size = store.size
+    tmp_path = f"{path}.tmp"
+    if os.path.exists(tmp_path):
+        shutil.rmtree(tmp_path)
+    os.makedirs(tmp_path)
+
+    for name, column in store.columns.items():
+        np.save(os.path.join(tmp_path, f"col_{name}.npy"), column[:size])
+    np.save(os.path.join(tmp_path, "alive.npy"), store.alive[:size])
+    ids = np.array([i or '' for i in store._ids[:size]], dtype=str)
+    np.save(os.path.join(tmp_path, "ids.npy"), ids)
+    if include_payloads:
+        payloads = np.empty(size, dtype=object)
+        payloads[:] = store._payloads[:size]
+        np.save(os.path.join(tmp_path, "payloads.npy"), payloads, allow_pickle=True)
+
+    header = {
+        'version': FORMAT_VERSION,
+        'time_step': state.time_step,
+        'running': state.running,
+        'metrics': {k: float(v) for k, v in state.metrics.items()},
+        'fidelity_components': {k: float(v) for k, v in asdict(engine.fidelity_system.components).items()},
+        'fidelity_weights': engine.fidelity_system.weights,
+        'fidelity_params': engine.fidelity_params,
+        'physics_params': {str(scale): params for scale, params in engine.physics_params.items()},
+        'rng': {name: generator.bit_generator.state for name, generator in engine.rng.items()},
+        'schema': {name: [np.dtype(dtype).str, default] for name, (dtype, default) in store.schema.items()},
+        'payloads': include_payloads
+    }
+    for name, save in SUBSYSTEMS.items():
+        arrays, header[name] = save(engine)
+        for key, array in arrays.items():
+            np.save(os.path.join(tmp_path, f"{name}_{key}.npy"), array)
+    with open(os.path.join(tmp_path, "header.json"), 'w') as f:
+        json.dump(header, f)
+
+    if os.path.exists(path):
+        shutil.rmtree(path)
+    os.replace(tmp_path, path)
+
+def load_checkpoint(path: str, engine: Optional[SimulationEngine] = None,
+                    mmap: bool = False) -> SimulationEngine:
+    """Restore engine state from a checkpoint directory
+
+    Restores into `engine` when given, otherwise into a new SimulationEngine.
+    With `mmap` the column files are mapped copy-on-write instead of read.
+    Version 1 checkpoints hold no subsystem state; those subsystems are
+    left as they are.
+    """
+    with open(os.path.join(path, "header.json")) as f:
+        header = json.load(f)
+    if header['version'] not in (1, FORMAT_VERSION):
+        raise ValueError(f"Unsupported checkpoint version: {header['version']}")
+
+    mmap_mode = 'c' if mmap else None
+    schema = {name: (np.dtype(dtype).type, default) for name, (dtype, default) in header['schema'].items()}
+    columns = {name: np.load(os.path.join(path, f"col_{name}.npy"), mmap_mode=mmap_mode)
+               for name in schema}
+    alive = np.load(os.path.join(path, "alive.npy"))
+    ids = np.load(os.path.join(path, "ids.npy")).tolist()
+    payloads = None
+    if header['payloads']:
+        payloads = np.load(os.path.join(path, "payloads.npy"), allow_pickle=True)
+
+    engine = engine or SimulationEngine()
+    state = engine.state
+    state.entities = EntityStore.from_arrays(columns, alive, ids, payloads, schema)
+    state.time_step = header['time_step']
+    state.running = header['running']
+    state.metrics.update(header['metrics'])
+
+    for name, rng_state in header.get('rng', {}).items():
+        engine.stream(name).bit_generator.state = rng_state
+
+    fidelity = engine.fidelity_system
+    for name, value in header['fidelity_components'].items():
+        setattr(fidelity.components, name, value)
+    fidelity.weights = header['fidelity_weights']
+    fidelity.invalidate()
+    if 'fidelity_params' in header:
+        engine.fidelity_params = header['fidelity_params']
+        engine.physics_params = {int(scale): params for scale, params in header['physics_params'].items()}
+        engine._update_fidelity_inputs()
+
+    for name, restore in RESTORERS.items():
+        if name in header:
+            restore(engine, _ArrayFiles(path, name), header[name])
+    # History past the checkpoint belongs to a timeline that no longer exists
+    engine.history.clear()
+    return engine
+
+class _ArrayFiles:
+    """Lazy access to the <subsystem>_<name>.npy files of a checkpoint"""
+
+    def __init__(self, path: str, prefix: str):
+        self.path = path
+        self.prefix = prefix
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return np.load(os.path.join(self.path, f"{self.prefix}_{name}.npy"))
+
+def _save_consciousness(engine: SimulationEngine):
+    consciousness = engine.consciousness
+    arrays = {'awareness': consciousness.awareness}
+    graph = consciousness.graph
+    if graph is not None:
+        arrays.update(data=graph.data, indices=graph.indices, indptr=graph.indptr)
+    return arrays, {
+        'graph': graph is not None,
+        'emergence': consciousness.emergence,
+        'learning_efficiency': consciousness.learning_efficiency,
+    }
+
+def _restore_consciousness(engine: SimulationEngine, arrays: _ArrayFiles, values: Dict[str, Any]):
+    consciousness = engine.consciousness
+    consciousness.awareness = arrays['awareness']
+    nodes = len(consciousness.awareness)
+    consciousness.graph = None
+    if values['graph']:
+        consciousness.graph = sparse.csr_matrix(
+            (arrays['data'], arrays['indices'], arrays['indptr']), shape=(nodes, nodes))
+    consciousness.emergence = values['emergence']
+    consciousness.learning_efficiency = values['learning_efficiency']
+
+def _save_agents(engine: SimulationEngine):
+    agents = engine.agents
+    names = list(agents.groups)
+    arrays = {
+        'actions': agents.actions,
+        'row_of': agents._row_of,
+        'alive': agents._alive,
+        'group_of': np.array([names.index(name) for name in agents._group_of], dtype=np.int64),
+    }
+    groups = {}
+    for name, group in agents.groups.items():
+        arrays[f"{name}_states"] = group.states[:group.size]
+        arrays[f"{name}_ids"] = group.agent_ids[:group.size]
+        # Every array attribute of a policy is a parameter (weights, biases)
+        groups[name] = [key for key, value in vars(group.policy).items() if isinstance(value, np.ndarray)]
+        for key in groups[name]:
+            arrays[f"{name}_policy_{key}"] = getattr(group.policy, key)
+    return arrays, {'groups': groups}
+
+def _restore_agents(engine: SimulationEngine, arrays: _ArrayFiles, values: Dict[str, Any]):
+    agents = engine.agents
+    missing = [name for name in values['groups'] if name not in agents.groups]
+    if missing:
+        raise ValueError(f"Checkpoint uses unregistered policies: {', '.join(missing)}")
+    names = list(values['groups'])
+    with agents._lock:
+        for group in agents.groups.values():
+            group.size = 0
+        for name, parameters in values['groups'].items():
+            group = agents.groups[name]
+            ids = arrays[f"{name}_ids"]
+            group.append(ids, arrays[f"{name}_states"])
+            for key in parameters:
+                setattr(group.policy, key, arrays[f"{name}_policy_{key}"])
+        agents.actions = arrays['actions']
+        agents._row_of = arrays['row_of']
+        agents._alive = arrays['alive']
+        agents._group_of = [names[index] for index in arrays['group_of'].tolist()]
+
+def _save_economy(engine: SimulationEngine):
+    economy = engine.economy
+    ledger, market, labor = economy.ledger, economy.market, economy.labor
+    arrays = {f"ledger_{name}": ledger.column(name) for name in COLUMNS}
+    arrays.update(
+        balances=ledger._balances[:ledger._agents],
+        tick_volume=ledger._tick_volume,
+        tick_count=ledger._tick_count,
+        output_window=economy._output.buffer,
+        employer_x=labor.employer_x,
+        employer_y=labor.employer_y,
+        required_skill=labor.required_skill,
+        wage=labor.wage,
+        openings=labor.openings,
+    )
+    if economy._base_prices is not None:
+        arrays['base_prices'] = economy._base_prices
+    for book in market.books:
+        for name, _ in book._FIELDS:
+            arrays[f"book{book.good}_{name}"] = getattr(book, name)
+    return arrays, {
+        'indicators': asdict(economy.indicators),
+        'ledger_last_tick': ledger.last_tick,
+        'output': [economy._output.total, economy._output.count],
+        'growth': [economy._growth.value, economy._growth.count],
+        'inflation': [economy._inflation.value, economy._inflation.count],
+        'previous_output': economy._previous_output,
+        'base_prices': economy._base_prices is not None,
+        'prices_seen': economy._prices_seen,
+        'last_prices': [book.last_price for book in market.books],
+        'next_order_id': market._next_id,
+        'clear_count': market.clear_count,
+        'price_version': market.price_version,
+        'employed': labor.employed,
+        'seeking': labor.seeking,
+    }
+
+def _restore_economy(engine: SimulationEngine, arrays: _ArrayFiles, values: Dict[str, Any]):
+    economy = engine.economy
+    old = economy.ledger
+    old.close()
+    ledger = economy.ledger = TransactionLedger(old.chunk_size, old.max_memory_chunks, old.spill_dir)
+    rows = {name: arrays[f"ledger_{name}"] for name in COLUMNS}
+    ledger.record_batch(rows['tick'], rows['payer'], rows['payee'], rows['amount'], rows['kind'])
+    # The saved aggregates, not sums recomputed in a different order
+    balances = arrays['balances']
+    ledger._balances[:len(balances)] = balances
+    ledger._agents = len(balances)
+    ledger._tick_volume = arrays['tick_volume']
+    ledger._tick_count = arrays['tick_count']
+    ledger.last_tick = values['ledger_last_tick']
+
+    economy._reset_aggregates()
+    for name, value in values['indicators'].items():
+        setattr(economy.indicators, name, value)
+    economy._output.buffer = arrays['output_window']
+    economy._output.total, economy._output.count = values['output']
+    economy._growth.value, economy._growth.count = values['growth']
+    economy._inflation.value, economy._inflation.count = values['inflation']
+    economy._previous_output = values['previous_output']
+    economy._base_prices = arrays['base_prices'] if values['base_prices'] else None
+
+    market = economy.market
+    for book, last_price in zip(market.books, values['last_prices']):
+        for name, _ in book._FIELDS:
+            setattr(book, name, arrays[f"book{book.good}_{name}"])
+        book.last_price = last_price
+    market._next_id = values['next_order_id']
+    market.clear_count = values['clear_count']
+    market.price_version = values['price_version']
+    economy._prices_seen = values['prices_seen']
+
+    labor = economy.labor
+    labor.set_employers(arrays['employer_x'], arrays['employer_y'], arrays['required_skill'],
+                        arrays['wage'], arrays['openings'])
+    labor.employed = values['employed']
+    labor.seeking = values['seeking']
+
+# Subsystem header section -> function returning (arrays, scalar values)
+SUBSYSTEMS = {
+    'consciousness': _save_consciousness,
+    'agents': _save_agents,
+    'economy': _save_economy,
+}
+RESTORERS = {
+    'consciousness': _restore_consciousness,
+    'agents': _restore_agents,
+    'economy': _restore_economy,
+}
+
+class AutoCheckpointer:
+    """Engine phase that saves a checkpoint every `every` steps
+
+    Checkpoints are written as `<directory>/step_<time_step>` and only the
+    newest `keep` are retained.
+    """
+
+    def __init__(self, engine: SimulationEngine, directory: str, every: int, keep: int = 3):
+        if every <= 0:
+            raise ValueError("Checkpoint interval must be positive")
+        self.engine = engine
+        self.directory = directory
+        self.every = every
+        self.keep = keep
+        self.saved = []
+
+    def __call__(self):
+        time_step = self.engine.state.time_step
+        if time_step % self.every:
+            return
+        path = os.path.join(self.directory, f"step_{time_step:012d}")
+        save_checkpoint(self.engine, path)
+        self.saved.append(path)
+        while len(self.saved) > self.keep:
+            shutil.rmtree(self.saved.pop(0), ignore_errors=True)
+
+    def latest(self) -> Optional[str]:
+        """Path of the most recent checkpoint, if any"""
+        return self.saved[-1] if self.saved else None
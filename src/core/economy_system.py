@@ -0,0 +1,186 @@
+# src/core/economy_system.py
+import math
+from dataclasses import dataclass
+from typing import Dict, Optional
+import numpy as np
+
+from ..economy.market import ClearingResult, Market
+from ..economy.transactions import PURCHASE, TransactionLedger
+from ..economy.labor_system import LaborSystem
+
+class EWMA:
+    """Exponentially weighted moving average, O(1) per update"""
+
+    def __init__(self, alpha: float, initial: float = 0.0):
+        self.alpha = alpha
+        self.value = initial
+        self.count = 0
+
+    def update(self, x: float) -> float:
+        if self.count == 0:
+            self.value = x
+        else:
+            self.value += self.alpha * (x - self.value)
+        self.count += 1
+        return self.value
+
+class RollingSum:
+    """Sum over the last `window` values, kept in a ring buffer"""
+
+    def __init__(self, window: int):
+        self.buffer = np.zeros(window)
+        self.total = 0.0
+        self.count = 0
+
+    def update(self, x: float) -> float:
+        slot = self.count % len(self.buffer)
+        self.total += x - float(self.buffer[slot])
+        self.buffer[slot] = x
+        self.count += 1
+        return self.total
+
+@dataclass
+class EconomicIndicators:
+    """Latest values of the macro indicators"""
+    gdp: float = 0.0             # transaction value over the rolling window
+    gdp_growth: float = 0.0      # smoothed per-tick growth of output
+    money_supply: float = 0.0
+    velocity: float = 0.0        # gdp / money supply
+    unemployment: float = 0.0
+    price_index: float = 1.0     # base-weighted index of market prices
+    inflation: float = 0.0       # smoothed per-tick change of the price index
+    economic_health: float = 0.0
+
+class EconomySystem:
+    """Streaming macro aggregates over the ledger, market and labor state
+
+    Every update first runs the tick's batch auction and records its trades
+    in the ledger as PURCHASE rows, then reads only the current tick's totals
+    (the ledger maintains per-tick volume on append) and folds them into
+    rolling sums and EWMAs, so the cost per tick does not depend on the
+    length of the history.
+
+    economic_health = w_g * G + w_u * (1 - u) + w_p * P, where
+    G = 1 / (1 + exp(-g / growth_scale)) for smoothed output growth g,
+    u is the unemployment rate and P = exp(-|π| / inflation_tolerance)
+    for smoothed inflation π. Output and prices come from the settled
+    trades; u counts the labor system's employed workers against the
+    seekers its latest match left unmatched.
+
+    The money supply is not derived from ledger balances: it is
+    `initial_money` plus whatever issue_money() added since the last
+    reset(). It defaults to 0, and velocity (gdp / money supply) reads 0
+    until money is issued.
+    """
+
+    def __init__(self, goods: int = 8, window: int = 100, alpha: float = 0.05,
+                 initial_money: float = 0.0, ledger: Optional[TransactionLedger] = None,
+                 market: Optional[Market] = None, labor: Optional[LaborSystem] = None):
+        self.ledger = ledger or TransactionLedger()
+        self.market = market or Market(goods)
+        self.labor = labor or LaborSystem()
+        self.health_weights = {'growth': 0.3, 'employment': 0.4, 'prices': 0.3}
+        self.growth_scale = 0.01
+        self.inflation_tolerance = 0.01
+        self.window = window
+        self.alpha = alpha
+        self.initial_money = initial_money
+        self._reset_aggregates()
+
+    def reset(self):
+        """Start a new ledger and restart the rolling aggregates
+
+        For a run that starts again from tick 0; market orders and labor
+        state are kept.
+        """
+        old = self.ledger
+        old.close()
+        self.ledger = TransactionLedger(old.chunk_size, old.max_memory_chunks, old.spill_dir)
+        self._reset_aggregates()
+
+    def _reset_aggregates(self):
+        self.indicators = EconomicIndicators(money_supply=self.initial_money)
+        self._output = RollingSum(self.window)
+        self._growth = EWMA(self.alpha)
+        self._inflation = EWMA(self.alpha)
+        self._previous_output = None
+        self._base_prices = None
+        self._prices_seen = self.market.price_version
+
+    def issue_money(self, amount: float):
+        """Add (or with a negative amount, remove) money from circulation"""
+        self.indicators.money_supply += amount
+
+    def update(self, tick: int) -> EconomicIndicators:
+        """Clear the market and fold tick `tick` into the rolling aggregates"""
+        results = self.market.clear()
+        if results:
+            self._settle(tick, results)
+        ind = self.indicators
+
+        output = self.ledger.tick_volume(tick)
+        ind.gdp = self._output.update(output)
+        if self._previous_output:
+            ind.gdp_growth = self._growth.update(output / self._previous_output - 1.0)
+        self._previous_output = output or self._previous_output
+        ind.velocity = ind.gdp / ind.money_supply if ind.money_supply > 0 else 0.0
+
+        labor = self.labor
+        labor_force = labor.employed + labor.seeking
+        if labor_force > 0:
+            ind.unemployment = labor.seeking / labor_force
+
+        self._update_prices()
+        ind.economic_health = self._health()
+        return ind
+
+    def get_indicators(self) -> Dict[str, float]:
+        """Get all indicators as a dict"""
+        ind = self.indicators
+        return {name: getattr(ind, name) for name in EconomicIndicators.__dataclass_fields__}
+
+    def _settle(self, tick: int, results: Dict[int, ClearingResult]):
+        """Record every trade of a tick's auctions as one ledger batch"""
+        payers, payees, amounts = [], [], []
+        for result in results.values():
+            buyers, sellers, quantities = result.trades()
+            payers.append(buyers)
+            payees.append(sellers)
+            amounts.append(quantities * result.price)
+        self.ledger.record_batch(tick, np.concatenate(payers), np.concatenate(payees),
+                                 np.concatenate(amounts), PURCHASE)
+
+    def _update_prices(self):
+        if self.market.price_version == self._prices_seen:
+            # No trades since the last update: the index is unchanged
+            self._inflation.update(0.0)
+            self.indicators.inflation = self._inflation.value
+            return
+        self._prices_seen = self.market.price_version
+        prices = self.market.last_prices
+        traded = np.isfinite(prices)
+        if not traded.any():
+            return
+        if self._base_prices is None:
+            self._base_prices = np.where(traded, prices, np.nan)
+        # Goods first traded after the base period enter at their first price
+        new = traded & np.isnan(self._base_prices)
+        self._base_prices[new] = prices[new]
+
+        weights = np.isfinite(self._base_prices)
+        index = float(np.where(weights & traded, prices, self._base_prices)[weights].sum()
+                      / self._base_prices[weights].sum())
+        ind = self.indicators
+        self._inflation.update(index / ind.price_index - 1.0)
+        ind.inflation = self._inflation.value
+        ind.price_index = index
+
+    def _health(self) -> float:
+        ind = self.indicators
+        # Plain floats and math keep this per-tick path free of NumPy scalar overhead
+        growth = 1.0 / (1.0 + math.exp(-max(min(ind.gdp_growth / self.growth_scale, 50.0), -50.0)))
+        employment = 1.0 - ind.unemployment
+        prices = math.exp(-abs(ind.inflation) / self.inflation_tolerance)
+        w = self.health_weights
+        health = w['growth'] * growth + w['employment'] * employment + w['prices'] * prices
+        return min(max(health, 0.0), 1.0)
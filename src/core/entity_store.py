@@ -0,0 +1,206 @@
+# src/core/entity_store.py
+import itertools
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+import numpy as np
+
+# Source of EntityStore.generation; never reused, unlike id() of a freed store
+_generations = itertools.count()
+
+# Column name -> (dtype, default value) for every entity
+DEFAULT_SCHEMA = {
+    'x': (np.float64, 0.0),
+    'y': (np.float64, 0.0),
+    'vx': (np.float64, 0.0),
+    'vy': (np.float64, 0.0),
+    'wealth': (np.float64, 0.0),
+    'district': (np.int32, 0),
+}
+
+class EntityStore:
+    """Structure-of-arrays storage for simulation entities
+
+    Each attribute lives in its own NumPy column; an entity id maps to a row.
+    Rows freed by `remove` are reused by later `add` calls, so columns only
+    grow when every slot is taken.
+    """
+
+    def __init__(self, capacity: int = 1024, schema: Optional[Mapping[str, tuple]] = None):
+        self.schema = dict(DEFAULT_SCHEMA if schema is None else schema)
+        self.capacity = max(int(capacity), 1)
+        self.columns: Dict[str, np.ndarray] = {
+            name: np.full(self.capacity, default, dtype=dtype)
+            for name, (dtype, default) in self.schema.items()
+        }
+        self.alive = np.zeros(self.capacity, dtype=bool)
+        self.size = 0  # high-water mark: rows [0, size) have been used
+        self._index: Dict[str, int] = {}
+        self._ids: List[Optional[str]] = [None] * self.capacity
+        self._payloads: List[Any] = [None] * self.capacity
+        self._free: List[int] = []
+        # Bumped when rows are added/removed or a column is written through
+        # touch(); lets consumers cache results derived from the columns
+        self.structure_version = 0
+        self.column_versions: Dict[str, int] = {name: 0 for name in self.schema}
+        # Unique per store in this process, so the versions above can be
+        # told apart from those of another (e.g. a restored) store
+        self.generation = next(_generations)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __getitem__(self, entity_id: str) -> Any:
+        return self._payloads[self._index[entity_id]]
+
+    def items(self):
+        """Iterate over (entity_id, payload) pairs"""
+        for entity_id, row in self._index.items():
+            yield entity_id, self._payloads[row]
+
+    def add_column(self, name: str, dtype, default=0):
+        """Add a new attribute column, filled with `default` for existing rows"""
+        if name in self.columns:
+            raise ValueError(f"Column '{name}' already exists")
+        self.schema[name] = (dtype, default)
+        self.columns[name] = np.full(self.capacity, default, dtype=dtype)
+        self.column_versions[name] = 0
+
+    def add(self, entity_id: str, entity: Any = None) -> int:
+        """Insert an entity and return its row
+
+        Attribute values are read from `entity` when it is a mapping or has
+        attributes named after the schema columns; anything else keeps the
+        column default. The original object is kept as the row payload.
+        """
+        if entity_id in self._index:
+            row = self._index[entity_id]
+        else:
+            row = self._free.pop() if self._free else self._next_row()
+            self._index[entity_id] = row
+            self._ids[row] = entity_id
+            self.alive[row] = True
+
+        self._payloads[row] = entity
+        self.structure_version += 1
+        for name, column in self.columns.items():
+            value = self._read_attribute(entity, name)
+            if value is not None:
+                column[row] = value
+        return row
+
+    def remove(self, entity_id: str) -> bool:
+        """Remove an entity and return its row to the free list"""
+        row = self._index.pop(entity_id, None)
+        if row is None:
+            return False
+        self.alive[row] = False
+        self.structure_version += 1
+        self._ids[row] = None
+        self._payloads[row] = None
+        for name, (dtype, default) in self.schema.items():
+            self.columns[name][row] = default
+        self._free.append(row)
+        return True
+
+    def row(self, entity_id: str) -> int:
+        """Get the row index of an entity"""
+        return self._index[entity_id]
+
+    def rows(self, entity_ids) -> np.ndarray:
+        """Get the row indices of several entities"""
+        return np.fromiter((self._index[i] for i in entity_ids), dtype=np.int64)
+
+    def entity_id(self, row: int) -> Optional[str]:
+        """Get the entity id stored at a row (None for free rows)"""
+        return self._ids[row]
+
+    def column(self, name: str) -> np.ndarray:
+        """View of a column over all used rows (free rows hold defaults)"""
+        return self.columns[name][:self.size]
+
+    def touch(self, *names: str):
+        """Record that columns were modified in place"""
+        for name in names:
+            self.column_versions[name] += 1
+
+    def active_rows(self) -> np.ndarray:
+        """Indices of rows currently holding an entity"""
+        return np.flatnonzero(self.alive[:self.size])
+
+    def get(self, entity_id: str) -> Dict[str, Any]:
+        """Get the column values of one entity as a dict"""
+        row = self._index[entity_id]
+        return {name: column[row].item() for name, column in self.columns.items()}
+
+    def clear(self):
+        """Remove all entities, keeping allocated capacity"""
+        for name, (dtype, default) in self.schema.items():
+            self.columns[name][:self.size] = default
+        self.alive[:] = False
+        self._index.clear()
+        self._ids = [None] * self.capacity
+        self._payloads = [None] * self.capacity
+        self._free.clear()
+        self.size = 0
+        self.structure_version += 1
+
+    @classmethod
+    def from_arrays(cls, columns: Mapping[str, np.ndarray], alive: np.ndarray,
+                    ids, payloads=None, schema: Optional[Mapping[str, tuple]] = None) -> 'EntityStore':
+        """Rebuild a store from saved column arrays
+
+        `ids` holds the entity id of every row ('' or None for free rows).
+        """
+        size = len(alive)
+        if schema is None:
+            schema = {name: (column.dtype.type, DEFAULT_SCHEMA.get(name, (None, 0))[1])
+                      for name, column in columns.items()}
+        store = cls(capacity=size, schema=schema)
+        # Adopt the arrays as-is (they may be copy-on-write memory maps); an
+        # empty store keeps its own one-row columns so they match capacity
+        if size:
+            for name, column in columns.items():
+                store.columns[name] = column
+        store.alive[:size] = alive
+        store.size = size
+        store._ids = [i if flag else None for i, flag in zip(ids, alive.tolist())]
+        store._ids.extend([None] * (store.capacity - size))
+        live = np.flatnonzero(store.alive[:size]).tolist()
+        store._index = dict(zip([store._ids[row] for row in live], live))
+        store._free = np.flatnonzero(~store.alive[:size]).tolist()[::-1]
+        if payloads is not None:
+            store._payloads[:size] = list(payloads)
+        return store
+
+    def _next_row(self) -> int:
+        if self.size == self.capacity:
+            self._grow(self.capacity * 2)
+        row = self.size
+        self.size += 1
+        return row
+
+    def _grow(self, new_capacity: int):
+        for name, (dtype, default) in self.schema.items():
+            column = np.full(new_capacity, default, dtype=dtype)
+            column[:self.capacity] = self.columns[name]
+            self.columns[name] = column
+        alive = np.zeros(new_capacity, dtype=bool)
+        alive[:self.capacity] = self.alive
+        self.alive = alive
+        extra = new_capacity - self.capacity
+        self._ids.extend([None] * extra)
+        self._payloads.extend([None] * extra)
+        self.capacity = new_capacity
+
+    @staticmethod
+    def _read_attribute(entity: Any, name: str):
+        if entity is None:
+            return None
+        if isinstance(entity, Mapping):
+            return entity.get(name)
+        return getattr(entity, name, None)
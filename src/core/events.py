@@ -0,0 +1,135 @@
+# src/core/events.py
+"""Publish/subscribe events from the engine, coalesced per subscriber
+
+The engine publishes as things happen (possibly on the scheduler's worker
+thread). Each subscriber has a mailbox that merges everything published
+since its last drain() into a single Update:
+
+- metrics: the latest value of every metric that changed
+- added / removed: entity ids; an entity added and removed again within
+  one batch is dropped, one removed and re-added is in both (apply
+  removals first)
+- time_step and ticks: the newest tick and how many ticks completed
+
+A UI drains once per frame and so handles at most one merged update per
+frame however fast the engine ticks. Unchanged metrics are never sent.
+"""
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+TICK = 'tick'
+METRICS = 'metrics'
+ENTITIES = 'entities'
+TOPICS = (TICK, METRICS, ENTITIES)
+
+@dataclass
+class Update:
+    """Everything a subscriber has not yet seen, merged"""
+    time_step: int = 0
+    ticks: int = 0
+    metrics: Dict[str, float] = field(default_factory=dict)
+    added: Set[str] = field(default_factory=set)
+    removed: Set[str] = field(default_factory=set)
+
+    # Merge steps applied by the publishers; plain methods rather than
+    # per-event closures, so publishing builds no function objects
+
+    def add_tick(self, time_step: int):
+        self.time_step = time_step
+        self.ticks += 1
+
+    def add_metrics(self, changed: Dict[str, float]):
+        self.metrics.update(changed)
+
+    def add_entity(self, entity_id: str):
+        self.added.add(entity_id)
+
+    def remove_entity(self, entity_id: str):
+        if entity_id in self.added:
+            self.added.discard(entity_id)
+        else:
+            self.removed.add(entity_id)
+
+class Subscription:
+    """Mailbox of one subscriber
+
+    `notify` is called (from the publishing thread) when the mailbox goes
+    from empty to pending, i.e. once per batch, not once per event; use it
+    to schedule a drain on the consumer's own thread.
+    """
+
+    def __init__(self, bus: 'EventBus', topics: Iterable[str],
+                 notify: Optional[Callable[[], None]] = None):
+        self.bus = bus
+        self.topics = frozenset(topics)
+        self.notify = notify
+        self._lock = threading.Lock()
+        self._pending: Optional[Update] = None
+
+    @property
+    def pending(self) -> bool:
+        return self._pending is not None
+
+    def drain(self) -> Optional[Update]:
+        """Take the merged update, or None if nothing happened since the last drain"""
+        with self._lock:
+            update, self._pending = self._pending, None
+        return update
+
+    def close(self):
+        self.bus.unsubscribe(self)
+
+    def _deliver(self, merge: Callable[[Update, Any], None], value):
+        """Apply `merge(update, value)` to the pending update, creating it if needed"""
+        with self._lock:
+            first = self._pending is None
+            if first:
+                self._pending = Update()
+            merge(self._pending, value)
+        if first and self.notify is not None:
+            self.notify()
+
+class EventBus:
+    """Fan engine events out to coalescing subscriber mailboxes"""
+
+    def __init__(self):
+        self._subscribers: Dict[str, List[Subscription]] = {topic: [] for topic in TOPICS}
+
+    def subscribe(self, topics: Iterable[str] = TOPICS,
+                  notify: Optional[Callable[[], None]] = None) -> Subscription:
+        topics = list(topics)
+        unknown = set(topics) - set(TOPICS)
+        if unknown:
+            raise ValueError(f"Unknown event topics: {sorted(unknown)}")
+        subscription = Subscription(self, topics, notify)
+        for topic in topics:
+            # Copy-on-write, so publishers can iterate without a lock
+            self._subscribers[topic] = self._subscribers[topic] + [subscription]
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        for topic in subscription.topics:
+            self._subscribers[topic] = [s for s in self._subscribers[topic] if s is not subscription]
+
+    def has_subscribers(self, topic: str) -> bool:
+        return bool(self._subscribers[topic])
+
+    def publish_tick(self, time_step: int):
+        for subscription in self._subscribers[TICK]:
+            subscription._deliver(Update.add_tick, time_step)
+
+    def publish_metrics(self, changed: Dict[str, float]):
+        """Publish metrics whose values changed; `changed` is not retained"""
+        if not changed:
+            return
+        for subscription in self._subscribers[METRICS]:
+            subscription._deliver(Update.add_metrics, changed)
+
+    def publish_entity_added(self, entity_id: str):
+        for subscription in self._subscribers[ENTITIES]:
+            subscription._deliver(Update.add_entity, entity_id)
+
+    def publish_entity_removed(self, entity_id: str):
+        for subscription in self._subscribers[ENTITIES]:
+            subscription._deliver(Update.remove_entity, entity_id)
@@ -2,7 +2,7 @@ import numpy as np
 from dataclasses import dataclass
 from typing import Dict, List
 
-@dataclass
+@dataclass(slots=True)
 class FidelityComponents:
     """Store individual fidelity components"""
     physics: float = 0.0
@@ -21,6 +21,23 @@ class FidelitySystem:
             'cognitive': 0.2,
             'data': 0.2
         }
+        # Last inputs seen per component and the cached weighted total;
+        # a component is only recomputed when its inputs change
+        self._inputs: Dict[str, tuple] = {}
+        self._total = None
+
+    def _unchanged(self, component: str, inputs: tuple) -> bool:
+        """Check inputs against the cache, marking the component dirty if they differ"""
+        if self._inputs.get(component) == inputs:
+            return True
+        self._inputs[component] = inputs
+        self._total = None
+        return False
+
+    def invalidate(self):
+        """Force every component and the total to be recomputed on next call"""
+        self._inputs.clear()
+        self._total = None
         
     def calculate_physics_fidelity(self, scale_weights: Dict[int, float], 
         physical_accuracy: Dict[int, float],
@@ -29,13 +46,18 @@ class FidelitySystem:
         """Calculate physics engine fidelity
         F_p(t) = Σ(w_s * (P_a * I_c) / E_d)
         """
-        fidelity = 0.0
-        for scale, weight in scale_weights.items():
-            numerator = physical_accuracy[scale] * interaction_complexity[scale]
-            denominator = max(energy_drift[scale], 0.001)  # Prevent division by zero
-            fidelity += weight * (numerator / denominator)
-            
-        self.components.physics = np.clip(fidelity, 0, 1)
+        inputs = (scale_weights, physical_accuracy, interaction_complexity, energy_drift)
+        if self._unchanged('physics', inputs):
+            return self.components.physics
+        # Keep copies so in-place edits of the caller's dicts are detected
+        self._inputs['physics'] = tuple(dict(d) for d in inputs)
+        scales = list(scale_weights)
+        self.components.physics = float(self.batch_physics_fidelity(
+            np.array([scale_weights[s] for s in scales], dtype=float),
+            np.array([physical_accuracy[s] for s in scales], dtype=float),
+            np.array([interaction_complexity[s] for s in scales], dtype=float),
+            np.array([energy_drift[s] for s in scales], dtype=float)
+        ))
         return self.components.physics
 
     def calculate_structural_fidelity(self, material_correctness: float,
@@ -45,10 +67,14 @@ class FidelitySystem:
         """Calculate structural fidelity
         F_s(l) = (M_c * A_f) / D_r
         """
-        numerator = material_correctness * architectural_fidelity
-        denominator = max(deviation_reference, 0.001)
-        
-        self.components.structural = np.clip(numerator / denominator, 0, 1)
+        if self._unchanged('structural', (material_correctness, architectural_fidelity,
+                                          deviation_reference)):
+            return self.components.structural
+        # Plain floats keep the per-tick scalar path free of NumPy scalars;
+        # the operations match batch_structural_fidelity
+        fidelity = (material_correctness * architectural_fidelity
+                    / max(deviation_reference, 0.001))
+        self.components.structural = min(max(fidelity, 0.0), 1.0)
         return self.components.structural
 
     def calculate_behavioral_fidelity(self, social_response: float,
@@ -59,13 +85,12 @@ class FidelitySystem:
         """Calculate behavioral fidelity
         F_b(t) = β * (S_r * C_d / V_h) * (1 + E_f)
         """
-        base_fidelity = (social_response * cultural_dynamics) / max(human_baseline, 0.001)
-        
-        self.components.behavioral = np.clip(
-            beta * base_fidelity * (1 + emergent_factor), 
-            0, 
-            1
-        )
+        if self._unchanged('behavioral', (social_response, cultural_dynamics, human_baseline,
+                                          emergent_factor, beta)):
+            return self.components.behavioral
+        base_fidelity = social_response * cultural_dynamics / max(human_baseline, 0.001)
+        fidelity = beta * base_fidelity * (1 + emergent_factor)
+        self.components.behavioral = min(max(fidelity, 0.0), 1.0)
         return self.components.behavioral
 
     def calculate_cognitive_fidelity(self, reasoning_capability: float,
@@ -75,10 +100,12 @@ class FidelitySystem:
         """Calculate cognitive fidelity
         F_c(t) = (R_c * L_e * (1 + C_e)) / T_c
         """
+        if self._unchanged('cognitive', (reasoning_capability, learning_efficiency,
+                                         consciousness_emergence, theoretical_ceiling)):
+            return self.components.cognitive
         numerator = reasoning_capability * learning_efficiency * (1 + consciousness_emergence)
-        denominator = max(theoretical_ceiling, 0.001)
-        
-        self.components.cognitive = np.clip(numerator / denominator, 0, 1)
+        fidelity = numerator / max(theoretical_ceiling, 0.001)
+        self.components.cognitive = min(max(fidelity, 0.0), 1.0)
         return self.components.cognitive
 
     def calculate_data_fidelity(self, data_accuracy: float,
@@ -88,29 +115,103 @@ class FidelitySystem:
         """Calculate data fidelity
         F_d(t) = (D_a * U_f) / (1 + E_r) * Q_f
         """
-        base_fidelity = (data_accuracy * update_frequency) / (1 + error_rate)
-        
-        self.components.data = np.clip(base_fidelity * quality_factor, 0, 1)
+        if self._unchanged('data', (data_accuracy, update_frequency, error_rate,
+                                    quality_factor)):
+            return self.components.data
+        base_fidelity = data_accuracy * update_frequency / (1 + error_rate)
+        self.components.data = min(max(base_fidelity * quality_factor, 0.0), 1.0)
         return self.components.data
 
     def calculate_total_fidelity(self) -> float:
         """Calculate total system fidelity
         F_total(t) = Σ(α_k * F_k(t))
         """
-        total = (
-            self.weights['physics'] * self.components.physics +
-            self.weights['structural'] * self.components.structural +
-            self.weights['behavioral'] * self.components.behavioral +
-            self.weights['cognitive'] * self.components.cognitive +
-            self.weights['data'] * self.components.data
-        )
+        if self._total is None:
+            components = self.components
+            total = 0.0
+            for name, weight in self.weights.items():
+                total += weight * getattr(components, name)
+            self._total = min(max(total, 0.0), 1.0)
+        return self._total
+
+    # Batch evaluation: every input may be a NumPy array (one entry per
+    # district/scenario/entity) and the result is an array of scores.
+
+    @staticmethod
+    def batch_physics_fidelity(scale_weights: np.ndarray,
+                               physical_accuracy: np.ndarray,
+                               interaction_complexity: np.ndarray,
+                               energy_drift: np.ndarray) -> np.ndarray:
+        """Physics fidelity for many rows; scales are along the last axis"""
+        terms = (np.asarray(scale_weights) * np.asarray(physical_accuracy)
+                 * np.asarray(interaction_complexity)
+                 / np.maximum(energy_drift, 0.001))
+        return np.clip(terms.sum(axis=-1), 0, 1)
+
+    @staticmethod
+    def batch_structural_fidelity(material_correctness, architectural_fidelity,
+                                  deviation_reference) -> np.ndarray:
+        """Structural fidelity for many rows"""
+        numerator = np.multiply(material_correctness, architectural_fidelity)
+        return np.clip(numerator / np.maximum(deviation_reference, 0.001), 0, 1)
+
+    @staticmethod
+    def batch_behavioral_fidelity(social_response, cultural_dynamics,
+                                  human_baseline, emergent_factor,
+                                  beta=0.5) -> np.ndarray:
+        """Behavioral fidelity for many rows"""
+        base_fidelity = (np.multiply(social_response, cultural_dynamics)
+                         / np.maximum(human_baseline, 0.001))
+        return np.clip(np.multiply(beta, base_fidelity) * (1 + np.asarray(emergent_factor)), 0, 1)
+
+    @staticmethod
+    def batch_cognitive_fidelity(reasoning_capability, learning_efficiency,
+                                 consciousness_emergence,
+                                 theoretical_ceiling) -> np.ndarray:
+        """Cognitive fidelity for many rows"""
+        numerator = (np.multiply(reasoning_capability, learning_efficiency)
+                     * (1 + np.asarray(consciousness_emergence)))
+        return np.clip(numerator / np.maximum(theoretical_ceiling, 0.001), 0, 1)
+
+    @staticmethod
+    def batch_data_fidelity(data_accuracy, update_frequency, error_rate,
+                            quality_factor) -> np.ndarray:
+        """Data fidelity for many rows"""
+        base_fidelity = np.multiply(data_accuracy, update_frequency) / (1 + np.asarray(error_rate))
+        return np.clip(base_fidelity * quality_factor, 0, 1)
+
+    def batch_total_fidelity(self, components: Dict[str, np.ndarray]) -> np.ndarray:
+        """Weighted total fidelity for many rows of component scores"""
+        total = sum(self.weights[name] * np.asarray(components[name]) for name in self.weights)
         return np.clip(total, 0, 1)
 
+    def calculate_batch(self, physics: Dict[str, np.ndarray],
+                        structural: Dict[str, np.ndarray],
+                        behavioral: Dict[str, np.ndarray],
+                        cognitive: Dict[str, np.ndarray],
+                        data: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Score many rows in one pass
+
+        Each argument holds the keyword arguments of the matching
+        batch_*_fidelity method as arrays. Returns one array per component
+        plus 'total'. Does not modify the stored components.
+        """
+        scores = {
+            'physics': self.batch_physics_fidelity(**physics),
+            'structural': self.batch_structural_fidelity(**structural),
+            'behavioral': self.batch_behavioral_fidelity(**behavioral),
+            'cognitive': self.batch_cognitive_fidelity(**cognitive),
+            'data': self.batch_data_fidelity(**data)
+        }
+        scores['total'] = self.batch_total_fidelity(scores)
+        return scores
+
     def update_weights(self, new_weights: Dict[str, float]):
         """Update component weights"""
         if sum(new_weights.values()) != 1.0:
             raise ValueError("Weights must sum to 1.0")
         self.weights = new_weights
+        self._total = None
 
     def get_component_scores(self) -> Dict[str, float]:
         """Get all component scores"""
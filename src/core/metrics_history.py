@@ -0,0 +1,175 @@
+# src/core/metrics_history.py
+"""Bounded time-series history of simulation metrics
+
+Every metric is a column of a fixed-size ring buffer, so appends are a
+single row write and memory does not grow with run length. Coarser tiers
+keep min/mean/max over blocks of ticks (10x, 100x, ... by default). Each
+tier is built from the one below it when a block completes, which costs one
+small reduction every `ratio` appends. Fine tiers hold recent ticks and
+coarse tiers reach much further back.
+"""
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+@dataclass
+class Series:
+    """Chronological samples of one metric at one resolution
+
+    For the raw tier min, mean and max are the same array.
+    """
+    ticks: np.ndarray
+    mean: np.ndarray
+    min: np.ndarray
+    max: np.ndarray
+    factor: int
+
+class _Tier:
+    """Ring buffer of per-block (tick, min, mean, max) rows for all metrics"""
+
+    def __init__(self, factor: int, capacity: int, width: int):
+        self.factor = factor
+        self.capacity = capacity
+        self.count = 0
+        self.ticks = np.zeros(capacity, dtype=np.int64)
+        self.mean = np.zeros((capacity, width))
+        if factor == 1:
+            self.min = self.max = self.mean
+        else:
+            self.min = np.zeros((capacity, width))
+            self.max = np.zeros((capacity, width))
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def order(self) -> np.ndarray:
+        """Row positions from oldest to newest"""
+        n = len(self)
+        return (self.count - n + np.arange(n)) % self.capacity
+
+    def last(self, n: int):
+        """Row positions (slice when contiguous) of the newest n rows"""
+        start = (self.count - n) % self.capacity
+        if start + n <= self.capacity:
+            return slice(start, start + n)
+        return (start + np.arange(n)) % self.capacity
+
+class MetricsHistory:
+    """Multi-resolution ring-buffer history of named metrics
+
+    `factors` are the ticks per sample of each tier and must each divide
+    the next; every tier keeps its newest `capacity` samples.
+    """
+
+    def __init__(self, names: Sequence[str], capacity: int = 4096,
+                 factors: Sequence[int] = (1, 10, 100, 1000)):
+        if factors[0] != 1:
+            raise ValueError("the first tier must be raw (factor 1)")
+        for finer, coarser in zip(factors, factors[1:]):
+            if coarser % finer or coarser // finer > capacity:
+                raise ValueError(f"tier factor {coarser} must be a multiple of {finer} "
+                                 f"within {capacity} samples")
+        self.names: List[str] = list(names)
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.capacity = capacity
+        self.tiers = [_Tier(factor, capacity, len(self.names)) for factor in factors]
+        self._ratios = [coarser // finer for finer, coarser in zip(factors, factors[1:])]
+        self._values = itemgetter(*self.names)
+
+    def __len__(self) -> int:
+        """Number of ticks recorded"""
+        return self.tiers[0].count
+
+    @property
+    def factors(self) -> List[int]:
+        return [tier.factor for tier in self.tiers]
+
+    def append(self, tick: int, metrics: Mapping[str, float]):
+        """Record one tick of metrics (names missing from `metrics` raise KeyError)"""
+        raw = self.tiers[0]
+        position = raw.count % raw.capacity
+        raw.ticks[position] = tick
+        raw.mean[position] = self._values(metrics)
+        raw.count += 1
+
+        # Cascade: a completed block of tier i becomes one sample of tier i + 1
+        for finer, coarser, ratio in zip(self.tiers, self.tiers[1:], self._ratios):
+            if finer.count % ratio:
+                break
+            # The block is one slice, or two when it wraps around the ring;
+            # slices avoid the index arrays and copies of fancy indexing
+            start = (finer.count - ratio) % finer.capacity
+            end = start + ratio - finer.capacity
+            position = coarser.count % coarser.capacity
+            coarser.ticks[position] = finer.ticks[start]
+            if end <= 0:
+                block = slice(start, start + ratio)
+                coarser.mean[position] = np.add.reduce(finer.mean[block]) / ratio
+                coarser.min[position] = np.minimum.reduce(finer.min[block])
+                coarser.max[position] = np.maximum.reduce(finer.max[block])
+            else:
+                head, tail = slice(start, None), slice(0, end)
+                coarser.mean[position] = (np.add.reduce(finer.mean[head])
+                                          + np.add.reduce(finer.mean[tail])) / ratio
+                coarser.min[position] = np.minimum(np.minimum.reduce(finer.min[head]),
+                                                   np.minimum.reduce(finer.min[tail]))
+                coarser.max[position] = np.maximum(np.maximum.reduce(finer.max[head]),
+                                                   np.maximum.reduce(finer.max[tail]))
+            coarser.count += 1
+
+    def series(self, name: str, tier: int = 0, since: Optional[int] = None) -> Series:
+        """History of one metric at one tier, optionally only samples from tick `since` on"""
+        column = self.index[name]
+        level = self.tiers[tier]
+        if since is None or not len(level):
+            rows = level.order()
+        else:
+            # Ticks increase along the ring, so only the newest samples can qualify
+            newest = level.ticks[(level.count - 1) % level.capacity]
+            needed = min(len(level), max(int(newest - since) // level.factor + 2, 0))
+            rows = level.last(needed)
+            if isinstance(rows, slice):
+                rows = np.arange(rows.start, rows.stop)
+            rows = rows[level.ticks[rows] >= since]
+        return Series(level.ticks[rows], level.mean[rows, column], level.min[rows, column],
+                      level.max[rows, column], level.factor)
+
+    def tier_for(self, span: int, max_points: int) -> int:
+        """Finest tier that covers the last `span` ticks in at most `max_points` samples
+
+        Falls back to the coarsest tier when no tier both fits and reaches
+        back far enough.
+        """
+        for i, level in enumerate(self.tiers):
+            samples = -(-span // level.factor)
+            covered = level.count == len(level) or len(level) >= samples
+            if samples <= max_points and covered:
+                return i
+        return len(self.tiers) - 1
+
+    def window(self, name: str, span: Optional[int] = None, max_points: int = 2000) -> Series:
+        """The last `span` ticks of a metric (all history if None) at a plottable resolution"""
+        if span is None:
+            span = len(self)
+        tier = self.tier_for(span, max_points)
+        last = self.tiers[0].ticks[(len(self) - 1) % self.capacity] if len(self) else 0
+        return self.series(name, tier, since=last - span + 1)
+
+    def latest(self) -> Dict[str, float]:
+        """Most recent value of every metric"""
+        if not len(self):
+            return {}
+        raw = self.tiers[0]
+        return dict(zip(self.names, raw.mean[(raw.count - 1) % raw.capacity].tolist()))
+
+    def clear(self):
+        for level in self.tiers:
+            level.count = 0
+
+    @property
+    def nbytes(self) -> int:
+        return sum(level.ticks.nbytes + level.mean.nbytes +
+                   (0 if level.factor == 1 else level.min.nbytes + level.max.nbytes)
+                   for level in self.tiers)
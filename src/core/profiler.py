@@ -0,0 +1,150 @@
+# src/core/profiler.py
+import cProfile
+import io
+import pstats
+import sys
+import time
+import tracemalloc
+from typing import Dict, Optional
+
+import numpy as np
+
+class PhaseTimings:
+    """Fixed-size ring buffer of wall times (seconds) for one tick phase"""
+
+    def __init__(self, size: int):
+        self.samples = np.zeros(size)
+        self.count = 0
+
+    def add(self, seconds: float):
+        self.samples[self.count % len(self.samples)] = seconds
+        self.count += 1
+
+    def values(self) -> np.ndarray:
+        return self.samples[:min(self.count, len(self.samples))]
+
+    def ordered(self) -> np.ndarray:
+        """Retained samples from oldest to newest"""
+        size = len(self.samples)
+        if self.count <= size:
+            return self.samples[:self.count]
+        return np.roll(self.samples, -(self.count % size))
+
+class TickProfiler:
+    """Per-phase wall-time and allocation statistics for simulation ticks
+
+    Keeps the last `window` samples of every phase and of the whole tick.
+    `block_growth` is the net change in live interpreter memory blocks over
+    a tick (sys.getallocatedblocks()): positive when a tick retains objects,
+    negative when it frees more than it allocates. It is not an allocation
+    count; use a tracemalloc capture to see where memory is allocated.
+    `capture()` arms a cProfile or tracemalloc session for the next
+    N ticks; the report is available from `last_capture` afterwards.
+    """
+
+    def __init__(self, window: int = 1024, enabled: bool = False):
+        self.window = window
+        self.enabled = enabled
+        self.phases: Dict[str, PhaseTimings] = {}
+        self.ticks = PhaseTimings(window)
+        self.block_growth = PhaseTimings(window)
+        self.last_capture: Optional[str] = None
+
+        self._tick_start = 0.0
+        self._blocks_start = 0
+        self._capture_mode: Optional[str] = None
+        self._capture_remaining = 0
+        self._cprofile: Optional[cProfile.Profile] = None
+        self._tracing = False
+        self._owns_trace = False     # tracemalloc was started by the capture
+        self._enabled_before = enabled
+
+    def reset(self):
+        """Drop all collected samples"""
+        self.phases.clear()
+        self.ticks = PhaseTimings(self.window)
+        self.block_growth = PhaseTimings(self.window)
+
+    def capture(self, ticks: int = 100, mode: str = 'cprofile'):
+        """Profile the next `ticks` ticks with cProfile or tracemalloc
+
+        Timing is enabled for the capture window only; `enabled` returns to
+        its previous value when the capture finishes.
+        """
+        if mode not in ('cprofile', 'tracemalloc'):
+            raise ValueError(f"Unknown capture mode: {mode}")
+        if not self.capturing:
+            self._enabled_before = self.enabled
+        self._capture_mode = mode
+        self._capture_remaining = ticks
+        self.enabled = True
+
+    @property
+    def capturing(self) -> bool:
+        return self._capture_remaining > 0
+
+    def begin_tick(self):
+        if self._capture_remaining and self._cprofile is None and not self._tracing:
+            self._start_capture()
+        self._blocks_start = sys.getallocatedblocks()
+        self._tick_start = time.perf_counter()
+
+    def record(self, phase: str, seconds: float):
+        timings = self.phases.get(phase)
+        if timings is None:
+            timings = self.phases[phase] = PhaseTimings(self.window)
+        timings.add(seconds)
+
+    def end_tick(self):
+        self.ticks.add(time.perf_counter() - self._tick_start)
+        self.block_growth.add(sys.getallocatedblocks() - self._blocks_start)
+        if self._capture_remaining:
+            self._capture_remaining -= 1
+            if not self._capture_remaining:
+                self._finish_capture()
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """p50/p95/p99/mean wall time in milliseconds per phase, plus 'tick'"""
+        result = {}
+        for name, timings in list(self.phases.items()) + [('tick', self.ticks)]:
+            values = timings.values()
+            if len(values) == 0:
+                continue
+            p50, p95, p99 = np.percentile(values, (50, 95, 99)) * 1000.0
+            result[name] = {
+                'p50': p50, 'p95': p95, 'p99': p99,
+                'mean': values.mean() * 1000.0,
+                'count': timings.count
+            }
+        growth = self.block_growth.values()
+        if len(growth):
+            result['tick']['block_growth'] = float(growth.mean())
+        return result
+
+    def _start_capture(self):
+        if self._capture_mode == 'cprofile':
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        else:
+            # Leave a trace someone else started (e.g. a test harness) running
+            self._owns_trace = not tracemalloc.is_tracing()
+            if self._owns_trace:
+                tracemalloc.start()
+            self._tracing = True
+
+    def _finish_capture(self):
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            stream = io.StringIO()
+            pstats.Stats(self._cprofile, stream=stream).sort_stats('cumulative').print_stats(30)
+            self.last_capture = stream.getvalue()
+            self._cprofile = None
+        elif self._tracing:
+            snapshot = tracemalloc.take_snapshot()
+            if self._owns_trace:
+                tracemalloc.stop()
+            self._tracing = self._owns_trace = False
+            top = snapshot.statistics('lineno')[:30]
+            self.last_capture = "\n".join(str(stat) for stat in top)
+        self._capture_mode = None
+        self.enabled = self._enabled_before
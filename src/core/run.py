@@ -0,0 +1,88 @@
+# src/core/run.py
+"""Headless simulation runner
+
+Usage: python -m src.core.run --steps 10000 --seed 42
+"""
+import argparse
+import logging
+import time
+from typing import Dict, Optional
+
+import numpy as np
+
+from .simulation_engine import SimulationEngine
+
+def populate(engine: SimulationEngine, count: int, rng: np.random.Generator):
+    """Fill the engine with `count` randomly placed entities"""
+    positions = rng.random((count, 2)) * 1000.0
+    velocities = rng.normal(0.0, 1.0, (count, 2))
+    for i in range(count):
+        engine.add_entity(f"entity_{i}", {
+            'x': positions[i, 0], 'y': positions[i, 1],
+            'vx': velocities[i, 0], 'vy': velocities[i, 1]
+        })
+
+def run(steps: int, seed: Optional[int] = None, entities: int = 0,
+        report_every: int = 0, engine: Optional[SimulationEngine] = None,
+        shards: int = 0) -> Dict[str, float]:
+    """Advance an engine `steps` times with no UI and return timing stats
+
+    With `shards` > 0 the entities are split across that many worker
+    processes (see src.core.sharding).
+    """
+    engine = engine or SimulationEngine(seed)
+    populate(engine, entities, engine.stream('entities'))
+    engine.start()
+
+    sharded = None
+    if shards:
+        from .sharding import ShardedSimulation
+        sharded = ShardedSimulation(engine, shards)
+        sharded.start()
+        step = sharded.step
+    else:
+        step = engine.step
+    start = last = time.perf_counter()
+    try:
+        for i in range(1, steps + 1):
+            step()
+            if report_every and i % report_every == 0:
+                now = time.perf_counter()
+                logging.info("step %d: %.0f steps/sec", i, report_every / (now - last))
+                last = now
+        elapsed = time.perf_counter() - start
+    finally:
+        # Workers and their shared memory must not outlive a failed run
+        if sharded is not None:
+            sharded.stop()
+    engine.pause()
+    return {
+        'steps': steps,
+        'elapsed': elapsed,
+        'steps_per_sec': steps / elapsed if elapsed > 0 else float('inf'),
+        **engine.get_metrics()
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the simulation without a display")
+    parser.add_argument('--steps', type=int, default=1000, help="number of steps to run")
+    parser.add_argument('--seed', type=int, default=None, help="random seed")
+    parser.add_argument('--entities', type=int, default=0, help="number of entities to spawn")
+    parser.add_argument('--report-every', type=int, default=0,
+                        help="log throughput every N steps (0 disables)")
+    parser.add_argument('--shards', type=int, default=0,
+                        help="run entities across N worker processes (0 runs in-process)")
+    parser.add_argument('--verbose', action='store_true', help="enable info logging")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO if args.verbose or args.report_every else logging.WARNING,
+                        format="%(message)s")
+    result = run(args.steps, args.seed, args.entities, args.report_every, shards=args.shards)
+
+    print(f"{result['steps']} steps in {result['elapsed']:.3f}s "
+          f"({result['steps_per_sec']:.0f} steps/sec)")
+    for name in ('fidelity_index', 'economic_health', 'ai_evolution', 'legal_compliance'):
+        print(f"{name}: {result[name]:.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+# src/core/scheduler.py
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .simulation_engine import SimulationEngine
+
+class FixedStepScheduler:
+    """Run a SimulationEngine on a worker thread at a fixed tick rate
+
+    The engine advances in fixed steps of 1/sim_hz seconds. When the worker
+    falls behind it runs up to `max_substeps` catch-up steps per frame and
+    drops the rest of the backlog rather than spiralling. Snapshots are
+    published at most `ui_hz` times per second, independently of the tick
+    rate, through `on_snapshot` and `latest_snapshot()`.
+    """
+
+    def __init__(self, engine: SimulationEngine, sim_hz: float = 60.0,
+                 ui_hz: float = 30.0, max_substeps: int = 8,
+                 on_snapshot: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.engine = engine
+        self.sim_hz = sim_hz  # 0 or None runs as fast as possible
+        self.ui_hz = ui_hz
+        self.max_substeps = max_substeps
+        self.on_snapshot = on_snapshot
+        self.dropped_steps = 0
+
+        self._lock = threading.Lock()
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._resume = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._resume.is_set() and not self._stop.is_set()
+
+    def start(self):
+        """Start ticking from a fresh engine start, or resume when paused"""
+        if self._thread is not None and self._stop.is_set():
+            # stop() timed out mid-tick; never let two workers step the engine
+            self._thread.join()
+            self._thread = None
+        if self._thread is None:
+            self.engine.start()
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+            self._resume.set()
+            self._thread.start()
+        else:
+            self.resume()
+
+    def pause(self):
+        """Stop ticking but keep the worker thread alive"""
+        self._resume.clear()
+        self.engine.pause()
+
+    def resume(self):
+        """Continue ticking after pause()"""
+        self.engine.state.running = True
+        self._resume.set()
+
+    def stop(self, timeout: float = 1.0) -> bool:
+        """Stop ticking and join the worker thread
+
+        Returns False when the worker is still inside a tick after `timeout`
+        (e.g. a long checkpoint); it exits once that tick ends, and start()
+        waits for it before spawning a new one.
+        """
+        self._stop.set()
+        self._resume.set()  # wake a paused worker so it can exit
+        stopped = True
+        if self._thread is not None:
+            self._thread.join(timeout)
+            stopped = not self._thread.is_alive()
+            if stopped:
+                self._thread = None
+        self._resume.clear()
+        self.engine.pause()
+        self._publish()
+        return stopped
+
+    def latest_snapshot(self) -> Optional[Dict[str, Any]]:
+        """Most recently published snapshot (safe to call from any thread)"""
+        with self._lock:
+            return self._snapshot
+
+    def _publish(self):
+        snapshot = {
+            'time_step': self.engine.state.time_step,
+            'dropped_steps': self.dropped_steps,
+            'metrics': dict(self.engine.get_metrics())  # a copy; the view is live
+        }
+        if self.engine.profiler.enabled:
+            snapshot['profile'] = self.engine.profiler.summary()
+        with self._lock:
+            self._snapshot = snapshot
+        if self.on_snapshot is not None:
+            self.on_snapshot(snapshot)
+
+    def _run(self):
+        step = self.engine.step
+        clock = time.perf_counter
+        ui_interval = 1.0 / self.ui_hz if self.ui_hz else 0.0
+        previous = last_publish = clock()
+        accumulator = 0.0
+
+        while not self._stop.is_set():
+            if not self._resume.is_set():
+                self._publish()
+                self._resume.wait()
+                previous = clock()
+                accumulator = 0.0
+                continue
+
+            now = clock()
+            if self.sim_hz:
+                dt = 1.0 / self.sim_hz
+                accumulator += now - previous
+                substeps = 0
+                while accumulator >= dt and substeps < self.max_substeps:
+                    step()
+                    accumulator -= dt
+                    substeps += 1
+                if accumulator >= dt:
+                    # Too far behind: drop the backlog instead of catching up forever
+                    self.dropped_steps += int(accumulator / dt)
+                    accumulator %= dt
+            else:
+                for _ in range(self.max_substeps):
+                    step()
+            previous = now
+
+            if now - last_publish >= ui_interval:
+                self._publish()
+                last_publish = now
+
+            if self.sim_hz:
+                remaining = 1.0 / self.sim_hz - accumulator - (clock() - now)
+                if remaining > 0:
+                    self._stop.wait(remaining)
@@ -0,0 +1,304 @@
+# src/core/sharding.py
+"""Multi-process sharded simulation
+
+Entities are partitioned by district across worker processes, each running
+its own SimulationEngine. Districts are vertical strips of the city
+(district = floor(x / district_width)) and district d belongs to shard
+d % shards. Every tick, workers step in parallel; entities that crossed
+into another shard's district are written to the worker's shared-memory
+outbox and picked up by their new shard at the tick boundary. Per-shard
+metrics are written to a shared metrics table and merged, weighted by
+entity count, into the parent engine's SimulationState.metrics. Entity
+payload objects never leave the parent; they are reattached by id when
+the entities are gathered back.
+
+Limitations: shards are assigned from these x strips only; the store's
+`district` column is neither read nor updated. While sharded only entity
+state advances: the parent engine's agents, market, labor and
+consciousness state stay frozen until stop().
+"""
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .entity_store import EntityStore
+from .simulation_engine import SimulationEngine
+
+class ShardBuffers:
+    """Shared-memory outboxes and metrics table for all shards
+
+    Outbox of shard s: `capacity` rows of entity columns (as float64), the
+    target shard and the UTF-8 entity id (at most `id_bytes` long) of every
+    row, plus a row count.
+    """
+
+    def __init__(self, shards: int, columns: List[str], metrics: List[str],
+                 capacity: int, id_bytes: int = 32, names: Optional[Dict[str, str]] = None):
+        self.shards = shards
+        self.columns = columns
+        self.metric_names = metrics
+        self.capacity = capacity
+        self.id_bytes = id_bytes
+        shapes = {
+            'rows': ((shards, capacity, len(columns)), np.float64),
+            'targets': ((shards, capacity), np.int32),
+            'ids': ((shards, capacity), f"S{id_bytes}"),
+            'counts': ((shards,), np.int64),
+            'metrics': ((shards, len(metrics) + 1), np.float64),  # last column: entity count
+        }
+        self._blocks = {}
+        self.names = {}
+        for key, (shape, dtype) in shapes.items():
+            size = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+            if names is None:
+                block = shared_memory.SharedMemory(create=True, size=size)
+            else:
+                block = shared_memory.SharedMemory(name=names[key])
+            self._blocks[key] = block
+            self.names[key] = block.name
+            setattr(self, key, np.ndarray(shape, dtype=dtype, buffer=block.buf))
+        if names is None:
+            self.counts[:] = 0
+
+    def spec(self) -> dict:
+        """Arguments needed to attach to these buffers from another process"""
+        return {'shards': self.shards, 'columns': self.columns, 'metrics': self.metric_names,
+                'capacity': self.capacity, 'id_bytes': self.id_bytes, 'names': self.names}
+
+    def close(self):
+        for key in list(self._blocks):
+            setattr(self, key, None)
+        for block in self._blocks.values():
+            block.close()
+
+    def unlink(self):
+        for block in self._blocks.values():
+            block.unlink()
+
+def shard_of(x: np.ndarray, district_width: float, shards: int) -> np.ndarray:
+    """Shard owning each x position"""
+    district = np.floor(np.asarray(x) / district_width).astype(np.int64)
+    return np.maximum(district, 0) % shards
+
+def _worker(shard: int, spec: dict, district_width: float, seed, initial, conn):
+    buffers = ShardBuffers(**spec)
+    engine = SimulationEngine(seed)
+    engine.state.entities = EntityStore.from_arrays(*initial)
+    engine.start()
+    columns = buffers.columns
+    try:
+        while True:
+            command = conn.recv()
+            if command == 'step':
+                engine.step()
+                _export(engine, buffers, shard, district_width)
+                metrics = engine.state.metrics
+                row = buffers.metrics[shard]
+                row[:-1] = [metrics[name] for name in buffers.metric_names]
+                row[-1] = len(engine.state.entities)
+                conn.send('stepped')
+            elif command == 'exchange':
+                _import(engine, buffers, shard, columns)
+                conn.send('exchanged')
+            elif command == 'gather':
+                store = engine.state.entities
+                conn.send(_store_arrays(store))
+            elif command == 'stop':
+                conn.send('stopped')
+                break
+    finally:
+        buffers.close()
+        conn.close()
+
+def _export(engine: SimulationEngine, buffers: ShardBuffers, shard: int, district_width: float):
+    """Move entities that left this shard into the outbox"""
+    store = engine.state.entities
+    rows = store.active_rows()
+    targets = shard_of(store.columns['x'][rows], district_width, buffers.shards)
+    leaving = rows[targets != shard][:buffers.capacity]  # the rest waits a tick
+    count = len(leaving)
+    buffers.counts[shard] = count
+    if count == 0:
+        return
+    out = buffers.rows[shard]
+    for j, name in enumerate(buffers.columns):
+        out[:count, j] = store.columns[name][leaving]
+    buffers.targets[shard, :count] = shard_of(out[:count, buffers.columns.index('x')],
+                                              district_width, buffers.shards)
+    ids = [store.entity_id(row) for row in leaving.tolist()]
+    buffers.ids[shard, :count] = [entity_id.encode('utf-8') for entity_id in ids]
+    for entity_id in ids:
+        store.remove(entity_id)
+
+def _import(engine: SimulationEngine, buffers: ShardBuffers, shard: int, columns: List[str]):
+    """Adopt entities other shards sent to this one"""
+    store = engine.state.entities
+    for source in range(buffers.shards):
+        count = int(buffers.counts[source])
+        if source == shard or count == 0:
+            continue
+        mine = np.flatnonzero(buffers.targets[source, :count] == shard)
+        for i in mine.tolist():
+            values = dict(zip(columns, buffers.rows[source, i].tolist()))
+            store.add(buffers.ids[source, i].decode('utf-8'), values)
+
+def _store_arrays(store: EntityStore):
+    size = store.size
+    columns = {name: np.array(store.column(name)) for name in store.columns}
+    ids = [i or '' for i in store._ids[:size]]
+    return columns, store.alive[:size].copy(), ids, None, store.schema
+
+class ShardedSimulation:
+    """Run an engine's entities across worker processes, one shard per core
+
+    The parent engine keeps the merged metrics and time step; its entities
+    are handed to the workers on start() and collected back on stop(), with
+    their payloads, which stay in the parent meanwhile.
+    """
+
+    def __init__(self, engine: SimulationEngine, shards: int = None,
+                 district_width: float = 100.0, exchange_capacity: int = 65536):
+        self.engine = engine
+        self.shards = shards or mp.cpu_count()
+        self.district_width = district_width
+        self.exchange_capacity = exchange_capacity
+        self.metric_names = list(engine.state.metrics)
+        self._buffers: Optional[ShardBuffers] = None
+        self._payloads: Dict[str, object] = {}
+        # The engine's own store, put back if the run fails before the
+        # entities are gathered
+        self._parked: Optional[EntityStore] = None
+        self._workers = []
+        self._conns = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    def start(self):
+        """Partition the engine's entities and launch one worker per shard"""
+        store = self.engine.state.entities
+        columns = list(store.columns)
+        rows = store.active_rows()
+        ids = [store.entity_id(row) for row in rows.tolist()]
+        # Ids cross processes as fixed-width bytes, which drop trailing NULs
+        if any('\0' in entity_id for entity_id in ids):
+            raise ValueError("Entity ids containing NUL characters cannot be sharded")
+        id_bytes = max([len(entity_id.encode('utf-8')) for entity_id in ids], default=0)
+        self._payloads = {entity_id: store._payloads[row]
+                          for entity_id, row in zip(ids, rows.tolist())
+                          if store._payloads[row] is not None}
+        self._buffers = ShardBuffers(self.shards, columns, self.metric_names,
+                                     self.exchange_capacity, max(id_bytes, 1))
+        self._parked = store
+
+        owner = shard_of(store.columns['x'][rows], self.district_width, self.shards)
+        seeds = self.engine.spawn_seeds(self.shards)
+        try:
+            for shard in range(self.shards):
+                mine = rows[owner == shard]
+                initial = (
+                    {name: np.array(store.columns[name][mine]) for name in columns},
+                    np.ones(len(mine), dtype=bool),
+                    [store.entity_id(row) for row in mine.tolist()],
+                    None,
+                    store.schema,
+                )
+                parent, child = mp.Pipe()
+                process = mp.Process(
+                    target=_worker, name=f"shard-{shard}", daemon=True,
+                    args=(shard, self._buffers.spec(), self.district_width, seeds[shard], initial, child)
+                )
+                process.start()
+                child.close()
+                self._workers.append(process)
+                self._conns.append(parent)
+        except BaseException:
+            self._shutdown(stopped=False)
+            raise
+        self.engine.state.entities = EntityStore(schema=store.schema)
+        self.engine.state.running = True
+
+    def step(self, steps: int = 1):
+        """Advance every shard in lockstep and merge their metrics
+
+        If a worker or its pipe fails, all workers are shut down and the
+        engine gets back the entities it had at start().
+        """
+        try:
+            for _ in range(steps):
+                self._broadcast('step')
+                self._broadcast('exchange')
+                self.engine.state.time_step += 1
+        except BaseException:
+            self._shutdown(stopped=False)
+            raise
+        self._merge_metrics()
+        state = self.engine.state
+        self.engine.history.append(state.time_step, state.metrics)
+
+    def gather(self) -> EntityStore:
+        """Collect all shards' entities, with their payloads, into one store"""
+        self._broadcast('gather', reply=False)
+        parts = [conn.recv() for conn in self._conns]
+        schema = parts[0][4]
+        columns = {name: np.concatenate([part[0][name] for part in parts]) for name in schema}
+        alive = np.concatenate([part[1] for part in parts])
+        ids = [entity_id for part in parts for entity_id in part[2]]
+        payloads = [self._payloads.get(entity_id) for entity_id in ids]
+        return EntityStore.from_arrays(columns, alive, ids, payloads, schema=schema)
+
+    def stop(self):
+        """Bring entities back into the parent engine and shut workers down
+
+        The workers are ended and the shared memory is released even when
+        gathering fails; the engine then gets back the entities it had at
+        start(), so none are lost.
+        """
+        if not self._workers:
+            return
+        stopped = False
+        try:
+            self.engine.state.entities = self.gather()
+            self._parked = None
+            self._broadcast('stop')
+            stopped = True
+        finally:
+            self._shutdown(stopped)
+
+    def _shutdown(self, stopped: bool):
+        for process in self._workers:
+            if not stopped:
+                process.terminate()
+            process.join()
+        for conn in self._conns:
+            conn.close()
+        self._workers, self._conns = [], []
+        self._payloads = {}
+        if self._parked is not None:
+            self.engine.state.entities, self._parked = self._parked, None
+        buffers, self._buffers = self._buffers, None
+        buffers.close()
+        buffers.unlink()
+
+    def entity_counts(self) -> np.ndarray:
+        """Entities per shard as of the last step"""
+        return self._buffers.metrics[:, -1].astype(np.int64)
+
+    def _broadcast(self, command: str, reply: bool = True):
+        for conn in self._conns:
+            conn.send(command)
+        if reply:
+            for conn in self._conns:
+                conn.recv()
+
+    def _merge_metrics(self):
+        table = self._buffers.metrics
+        counts = table[:, -1]
+        weights = counts / counts.sum() if counts.sum() > 0 else np.full(len(counts), 1.0 / len(counts))
+        merged = weights @ table[:, :-1]
+        metrics = self.engine.state.metrics
+        for name, value in zip(self.metric_names, merged.tolist()):
+            metrics[name] = value
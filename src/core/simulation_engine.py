@@ -1,39 +1,115 @@
 # src/core/simulation_engine.py
 from dataclasses import dataclass
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Union
+import logging
+import time
 import numpy as np
 from .fidelity_system import FidelitySystem
+from .entity_store import EntityStore
+from .profiler import TickProfiler
+from .metrics_history import MetricsHistory
+from .events import EventBus, Subscription, Update, TOPICS, METRICS, TICK, ENTITIES
+from .economy_system import EconomySystem
+from ..ai.agent_system import AgentSystem
+from ..ai.entity_system import EntitySystem
+from ..ai.consciousness_system import ConsciousnessSystem
+from ..legal.compliance import ComplianceEngine
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# Subsystems that get their own random stream, spawned in this order
+RNG_STREAMS = ('entities', 'economy', 'ai', 'legal')
+
+# fidelity_params entries in calculate_*_fidelity argument order; the
+# cognitive learning/emergence arguments are read from the consciousness system
+FIDELITY_ARGUMENTS = (
+    ('structural', ('material_correctness', 'architectural_fidelity', 'deviation_reference', 'level')),
+    ('behavioral', ('social_response', 'cultural_dynamics', 'human_baseline', 'emergent_factor')),
+    ('cognitive', ('reasoning_capability', 'theoretical_ceiling')),
+    ('data', ('data_accuracy', 'update_frequency', 'error_rate', 'quality_factor')),
+)
+
+@dataclass(slots=True)
 class SimulationState:
     """Represents the current state of the simulation"""
     time_step: int = 0
     running: bool = False
-    entities: Dict[str, Any] = None
+    entities: EntityStore = None
     metrics: Dict[str, float] = None
 
 class SimulationEngine:
-    def __init__(self):
+    def __init__(self, seed: Union[int, np.random.SeedSequence, None] = None):
         self.state = SimulationState()
-        self.state.entities = {}
+        self.state.entities = EntityStore()
         self.state.metrics = {
             'fidelity_index': 0.0,
             'economic_health': 0.0,
             'ai_evolution': 0.0,
             'legal_compliance': 0.0
         }
+        # Metrics are updated in place (never replaced), so one view stays live
+        self._metrics_view = MappingProxyType(self.state.metrics)
         self.fidelity_system = FidelitySystem()
+        self.economy = EconomySystem()
+        # One independent Generator per subsystem, all derived from `seed`
+        if isinstance(seed, np.random.SeedSequence):
+            self.seed_sequence = seed
+        else:
+            self.seed_sequence = np.random.SeedSequence(seed)
+        self.rng: Dict[str, np.random.Generator] = {}
+        for name in RNG_STREAMS:
+            self.stream(name)
+        self.agents = AgentSystem(rng=self.rng['ai'])
+        self.entity_system = EntitySystem()
+        self.consciousness = ConsciousnessSystem(rng=self.stream('consciousness'))
+        self.compliance = ComplianceEngine()
+        self.profiler = TickProfiler()
+        self.history = MetricsHistory(list(self.state.metrics))
+        self.events = EventBus()
+        self._published_metrics: Dict[str, float] = {}
+        self._changed_metrics: Dict[str, float] = {}
+        # Example per-scale physics parameters
+        self.physics_params = {
+            1: {'weight': 0.5, 'accuracy': 0.8, 'complexity': 0.7, 'drift': 0.1},
+            2: {'weight': 0.5, 'accuracy': 0.9, 'complexity': 0.6, 'drift': 0.2}
+        }
+        # Example coefficients for the other calculate_*_fidelity calls; the
+        # cognitive learning/emergence inputs come from the consciousness system
+        self.fidelity_params = {
+            'structural': {'material_correctness': 0.8, 'architectural_fidelity': 0.7,
+                           'deviation_reference': 0.2, 'level': 1},
+            'behavioral': {'social_response': 0.75, 'cultural_dynamics': 0.8,
+                           'human_baseline': 0.3, 'emergent_factor': 0.2},
+            'cognitive': {'reasoning_capability': 0.7, 'theoretical_ceiling': 1.0},
+            'data': {'data_accuracy': 0.9, 'update_frequency': 0.8,
+                     'error_rate': 0.1, 'quality_factor': 0.9}
+        }
+        self._update_fidelity_inputs()
+        # Ordered (name, callable) pairs run once per step
+        self.phases = [
+            ('economy', self._update_economy),
+            ('consciousness', self.consciousness.step),
+            ('metrics', self._update_metrics),
+            ('entities', self._process_entities),
+            ('agents', self.agents.decide),
+            ('legal', self._check_compliance),
+            ('history', self._record_history),
+            ('events', self._publish_events)
+        ]
         
     def start(self):
         """Start the simulation"""
         self.state.running = True
         self.state.time_step = 0
-        print("Simulation started")
+        self.history.clear()
+        self.economy.reset()
+        logger.info("Simulation started")
         
     def pause(self):
         """Pause the simulation"""
         self.state.running = False
-        print("Simulation paused")
+        logger.info("Simulation paused")
         
     def step(self):
         """Advance simulation by one time step"""
@@ -41,54 +117,185 @@ class SimulationEngine:
             return
             
         self.state.time_step += 1
-        self._update_metrics()
-        self._process_entities()
+        if self.profiler.enabled:
+            self._profiled_step()
+        else:
+            for _, phase in self.phases:
+                phase()
+
+    def _profiled_step(self):
+        """Run all phases, recording wall time per phase"""
+        profiler = self.profiler
+        clock = time.perf_counter
+        profiler.begin_tick()
+        for name, phase in self.phases:
+            start = clock()
+            phase()
+            profiler.record(name, clock() - start)
+        profiler.end_tick()
         
     def _update_metrics(self):
         """Update simulation metrics"""
-        # Example parameters for fidelity calculation
-        physics_params = {
-            1: {'weight': 0.5, 'accuracy': 0.8, 'complexity': 0.7, 'drift': 0.1},
-            2: {'weight': 0.5, 'accuracy': 0.9, 'complexity': 0.6, 'drift': 0.2}
-        }
+        fidelity = self.fidelity_system
+        # Inputs are unchanged between ticks, so FidelitySystem serves these from cache
+        fidelity.calculate_physics_fidelity(*self._physics_inputs)
         
-        # Calculate physics fidelity
-        physics_fidelity = self.fidelity_system.calculate_physics_fidelity(
-            scale_weights={k: v['weight'] for k, v in physics_params.items()},
-            physical_accuracy={k: v['accuracy'] for k, v in physics_params.items()},
-            interaction_complexity={k: v['complexity'] for k, v in physics_params.items()},
-            energy_drift={k: v['drift'] for k, v in physics_params.items()}
+        structural, behavioral, cognitive, data = self._fidelity_inputs
+        fidelity.calculate_structural_fidelity(*structural)
+        fidelity.calculate_behavioral_fidelity(*behavioral)
+        consciousness = self.consciousness
+        fidelity.calculate_cognitive_fidelity(
+            cognitive[0], consciousness.learning_efficiency, consciousness.emergence, cognitive[1]
         )
-        
-        # Calculate other fidelities with example values
-        self.fidelity_system.calculate_structural_fidelity(0.8, 0.7, 0.2, 1)
-        self.fidelity_system.calculate_behavioral_fidelity(0.75, 0.8, 0.3, 0.2)
-        self.fidelity_system.calculate_cognitive_fidelity(0.7, 0.8, 0.1, 1.0)
-        self.fidelity_system.calculate_data_fidelity(0.9, 0.8, 0.1, 0.9)
+        fidelity.calculate_data_fidelity(*data)
         
         # Update metrics
-        self.state.metrics['fidelity_index'] = self.fidelity_system.calculate_total_fidelity()
+        self.state.metrics['fidelity_index'] = fidelity.calculate_total_fidelity()
         
         # Placeholder for other metrics
-        self.state.metrics['economic_health'] = np.random.random()
-        self.state.metrics['ai_evolution'] = np.random.random()
-        self.state.metrics['legal_compliance'] = np.random.random()
+        rng = self.rng
+        self.state.metrics['ai_evolution'] = rng['ai'].random()
         
+    def _update_fidelity_inputs(self):
+        """Turn physics_params and fidelity_params into positional calculate_* arguments
+
+        Built once per parameter change, so a tick passes prebuilt tuples
+        instead of unpacking keyword dicts.
+        """
+        self._physics_inputs = tuple(
+            {k: v[key] for k, v in self.physics_params.items()}
+            for key in ('weight', 'accuracy', 'complexity', 'drift')
+        )
+        params = self.fidelity_params
+        self._fidelity_inputs = tuple(
+            tuple(params[component][name] for name in names)
+            for component, names in FIDELITY_ARGUMENTS
+        )
+
+    def set_fidelity_param(self, name: str, value: float):
+        """Set a fidelity input by dotted name
+
+        'weights.<component>' sets a FidelitySystem weight (weights are not
+        renormalised), 'physics.<scale>.<field>' a per-scale physics
+        parameter and '<component>.<argument>' a calculate_*_fidelity
+        argument, e.g. 'data.error_rate'.
+        """
+        parts = name.split('.')
+        if parts[0] == 'weights' and len(parts) == 2:
+            weights = self.fidelity_system.weights
+            if parts[1] not in weights:
+                raise KeyError(name)
+            weights[parts[1]] = value
+            self.fidelity_system.invalidate()
+        elif parts[0] == 'physics' and len(parts) == 3:
+            self.physics_params[int(parts[1])][parts[2]] = value
+            self._update_fidelity_inputs()
+        elif len(parts) == 2 and parts[1] in self.fidelity_params.get(parts[0], {}):
+            self.fidelity_params[parts[0]][parts[1]] = value
+            self._update_fidelity_inputs()
+        else:
+            raise KeyError(name)
+
+    def _update_economy(self):
+        """Fold this tick's ledger and market activity into the economy metrics"""
+        indicators = self.economy.update(self.state.time_step)
+        self.state.metrics['economic_health'] = indicators.economic_health
+
     def _process_entities(self):
         """Process all entities in the simulation"""
-        for entity_id, entity in self.state.entities.items():
-            # Placeholder for entity processing
-            pass
+        entities = self.state.entities
+        if len(entities) > 0:
+            # Integrate positions over whole columns; free rows have zero velocity
+            x, y = entities.column('x'), entities.column('y')
+            x += entities.column('vx')
+            y += entities.column('vy')
+            entities.touch('x', 'y')
+        # Moves only the rows that changed; the spatial index is re-sorted
+        # lazily, only if a neighbour query runs
+        self.entity_system.sync(entities)
+
+    def _check_compliance(self):
+        """Evaluate regulations over entities and this tick's transactions"""
+        self.state.metrics['legal_compliance'] = self.compliance.evaluate(
+            self.state.entities, self.economy.ledger, self.state.time_step
+        )
+
+    def _record_history(self):
+        """Append this tick's metrics to the history"""
+        self.history.append(self.state.time_step, self.state.metrics)
+
+    def _publish_events(self):
+        """Publish changed metrics and the completed tick to subscribers"""
+        events = self.events
+        if events.has_subscribers(METRICS):
+            published = self._published_metrics
+            changed = self._changed_metrics
+            changed.clear()
+            for name, value in self.state.metrics.items():
+                if published.get(name) != value:
+                    changed[name] = value
+            if changed:
+                published.update(changed)
+                events.publish_metrics(changed)
+        if events.has_subscribers(TICK):
+            events.publish_tick(self.state.time_step)
+
+    def subscribe(self, topics=TOPICS, notify=None) -> Subscription:
+        """Subscribe to engine events, starting from the current metrics
+
+        The first drain() includes every current metric value; after that
+        only changes are delivered. See src.core.events.
+        """
+        subscription = self.events.subscribe(topics, notify)
+        if METRICS in subscription.topics:
+            subscription._deliver(Update.add_metrics, self.state.metrics)
+        return subscription
+
+    def stream(self, name: str) -> np.random.Generator:
+        """Get the random stream of a subsystem, spawning it on first use"""
+        generator = self.rng.get(name)
+        if generator is None:
+            generator = self.rng[name] = np.random.default_rng(self.seed_sequence.spawn(1)[0])
+        return generator
+
+    def spawn_seeds(self, count: int) -> List[np.random.SeedSequence]:
+        """Independent seed sequences for parallel workers"""
+        return self.seed_sequence.spawn(count)
+
+    def save_checkpoint(self, path: str, include_payloads: bool = False):
+        """Write the full simulation state to a checkpoint directory"""
+        from .checkpoint import save_checkpoint
+        save_checkpoint(self, path, include_payloads)
+
+    def load_checkpoint(self, path: str, mmap: bool = False):
+        """Replace the simulation state with a saved checkpoint"""
+        from .checkpoint import load_checkpoint
+        load_checkpoint(path, self, mmap)
+
+    def enable_auto_checkpoint(self, directory: str, every: int, keep: int = 3):
+        """Save a checkpoint every `every` steps, keeping the newest `keep`"""
+        from .checkpoint import AutoCheckpointer
+        self.phases = [p for p in self.phases if p[0] != 'checkpoint']
+        checkpointer = AutoCheckpointer(self, directory, every, keep)
+        self.phases.append(('checkpoint', checkpointer))
+        return checkpointer
 
     def add_entity(self, entity_id: str, entity: Any):
         """Add a new entity to the simulation"""
-        self.state.entities[entity_id] = entity
+        self.state.entities.add(entity_id, entity)
+        if self.events.has_subscribers(ENTITIES):
+            self.events.publish_entity_added(entity_id)
         
     def remove_entity(self, entity_id: str):
         """Remove an entity from the simulation"""
-        if entity_id in self.state.entities:
-            del self.state.entities[entity_id]
+        removed = self.state.entities.remove(entity_id)
+        if removed and self.events.has_subscribers(ENTITIES):
+            self.events.publish_entity_removed(entity_id)
             
-    def get_metrics(self) -> Dict[str, float]:
-        """Get current simulation metrics"""
-        return self.state.metrics.copy()
\ No newline at end of file
+    def get_metrics(self) -> Mapping[str, float]:
+        """Get current simulation metrics
+
+        Returns a read-only live view, not a copy: it reflects later steps.
+        Use dict(engine.get_metrics()) to keep a snapshot.
+        """
+        return self._metrics_view
\ No newline at end of file
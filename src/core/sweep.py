@@ -0,0 +1,204 @@
+# src/core/sweep.py
+"""Parameter sweeps and Monte Carlo batches of headless runs
+
+A configuration maps dotted parameter names (see
+SimulationEngine.set_fidelity_param) to values:
+
+    {'weights.physics': 0.4, 'data.error_rate': 0.2, 'physics.1.drift': 0.05}
+
+Every configuration runs `replicates` times, each in its own engine with
+`entities` entities, on a process pool. Replicates of one configuration
+share a base seed and run on independent streams spawned from it (as
+SimulationEngine.spawn_seeds does). Results are appended to a CSV file, one
+row per run, as runs finish; on restart, runs already in the file are
+skipped.
+
+Usage: python -m src.core.sweep --param weights.physics=0.2,0.3,0.4 \\
+           --sample data.error_rate=0.0:0.3 --samples 100 --replicates 10 \\
+           --entities 1000 --steps 500 --output sweep.csv
+"""
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from .simulation_engine import SimulationEngine
+
+logger = logging.getLogger(__name__)
+
+RESULT_FIELDS = ['run_id', 'seed', 'replicate', 'entities', 'steps', 'elapsed', 'fidelity_index', 'economic_health',
+                 'ai_evolution', 'legal_compliance']
+
+def grid(**values: Sequence[float]) -> Iterator[Dict[str, float]]:
+    """Cartesian product of per-parameter value lists"""
+    names = list(values)
+    for combination in itertools.product(*(values[name] for name in names)):
+        yield dict(zip(names, combination))
+
+def random_samples(count: int, ranges: Dict[str, Tuple[float, float]],
+                   seed: Optional[int] = None) -> Iterator[Dict[str, float]]:
+    """`count` configurations drawn uniformly from per-parameter (low, high) ranges"""
+    rng = np.random.default_rng(seed)
+    names = list(ranges)
+    low = np.array([ranges[name][0] for name in names], dtype=np.float64)
+    high = np.array([ranges[name][1] for name in names], dtype=np.float64)
+    for row in rng.uniform(low, high, (count, len(names))).tolist():
+        yield dict(zip(names, row))
+
+def run_id(config: Dict[str, float], steps: int, seed: Optional[int] = None,
+           replicate: int = 0, entities: int = 0) -> str:
+    """Stable identifier of one run, used to skip finished runs on resume"""
+    key = json.dumps({'config': config, 'steps': steps, 'seed': seed,
+                      'replicate': replicate, 'entities': entities}, sort_keys=True)
+    return hashlib.sha1(key.encode()).hexdigest()[:16]
+
+def replicate_seed(seed: int, replicate: int) -> np.random.SeedSequence:
+    """Seed of one replicate: child `replicate` of SeedSequence(seed).spawn(...)"""
+    return np.random.SeedSequence(seed, spawn_key=(replicate,))
+
+def run_config(config: Dict[str, float], steps: int, seed: Optional[int] = None,
+               replicate: int = 0, entities: int = 0) -> Dict[str, float]:
+    """Run one replicate of `config` headless and return its final metrics
+
+    The base seed defaults to one derived from the configuration (without
+    the replicate), so all replicates of a configuration share it and
+    re-running any of them reproduces it.
+    """
+    from .run import run
+
+    identifier = run_id(config, steps, seed, replicate, entities)
+    if seed is None:
+        seed = int(run_id(config, steps), 16)
+    engine = SimulationEngine(replicate_seed(seed, replicate))
+    for name, value in config.items():
+        engine.set_fidelity_param(name, value)
+    result = run(steps, entities=entities, engine=engine)
+    return {
+        'run_id': identifier,
+        'seed': seed,
+        'replicate': replicate,
+        'entities': entities,
+        **config,
+        **{name: result[name] for name in RESULT_FIELDS[4:]},
+    }
+
+def _run_job(job):
+    return run_config(*job)
+
+def completed_runs(path: str) -> Set[str]:
+    """Run ids already present in a results file"""
+    if not os.path.exists(path):
+        return set()
+    with open(path, newline='') as f:
+        return {row['run_id'] for row in csv.DictReader(f) if row.get('run_id')}
+
+class SweepRunner:
+    """Run configurations on a process pool, streaming results to CSV
+
+    Rows are written and flushed as runs finish, in completion order, so an
+    interrupted sweep loses at most the runs that were in flight.
+    """
+
+    def __init__(self, output: str, steps: int = 1000, workers: Optional[int] = None,
+                 seed: Optional[int] = None, replicates: int = 1, entities: int = 1000):
+        self.output = output
+        self.steps = steps
+        self.workers = workers or os.cpu_count()
+        self.seed = seed
+        self.replicates = replicates
+        self.entities = entities
+
+    def run(self, configs: Iterable[Dict[str, float]]) -> int:
+        """Run every configuration not already in the output; returns runs completed"""
+        configs = list(configs)
+        done = completed_runs(self.output)
+        runs = [(config, self.steps, self.seed, replicate, self.entities)
+                for config in configs for replicate in range(self.replicates)]
+        jobs = [job for job in runs if run_id(*job) not in done]
+        if len(jobs) < len(runs):
+            logger.info("resuming: %d of %d runs already done", len(runs) - len(jobs), len(runs))
+        if not jobs:
+            return 0
+
+        params = sorted({name for config in configs for name in config})
+        fields = RESULT_FIELDS[:4] + params + RESULT_FIELDS[4:]
+        fields = self._check_header(fields)
+        new_file = not os.path.exists(self.output) or os.path.getsize(self.output) == 0
+        finished = 0
+        with open(self.output, 'a', newline='') as f, ProcessPoolExecutor(self.workers) as pool:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            if new_file:
+                writer.writeheader()
+            futures = [pool.submit(_run_job, job) for job in jobs]
+            for future in as_completed(futures):
+                writer.writerow(future.result())
+                f.flush()
+                finished += 1
+                logger.info("%d/%d runs done", finished, len(jobs))
+        return finished
+
+    def _check_header(self, fields: List[str]) -> List[str]:
+        """Reuse an existing file's columns; they must cover this sweep's"""
+        if not os.path.exists(self.output) or os.path.getsize(self.output) == 0:
+            return fields
+        with open(self.output, newline='') as f:
+            existing = next(csv.reader(f), [])
+        missing = set(fields) - set(existing)
+        if missing:
+            raise ValueError(f"{self.output} has no columns for {sorted(missing)}; use a new output file")
+        return existing
+
+def _parse_values(spec: str) -> Tuple[str, List[float]]:
+    name, _, values = spec.partition('=')
+    return name, [float(v) for v in values.split(',')]
+
+def _parse_range(spec: str) -> Tuple[str, Tuple[float, float]]:
+    name, _, bounds = spec.partition('=')
+    low, _, high = bounds.partition(':')
+    return name, (float(low), float(high))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a parameter sweep of headless simulations")
+    parser.add_argument('--param', action='append', default=[], metavar='NAME=V1,V2,...',
+                        help="grid values for a parameter (repeatable)")
+    parser.add_argument('--sample', action='append', default=[], metavar='NAME=LOW:HIGH',
+                        help="uniform range for a parameter (repeatable)")
+    parser.add_argument('--samples', type=int, default=0,
+                        help="random draws from the --sample ranges per grid point")
+    parser.add_argument('--sample-seed', type=int, default=0,
+                        help="seed of the --sample draws; keep it fixed to resume a sweep")
+    parser.add_argument('--steps', type=int, default=1000, help="steps per run")
+    parser.add_argument('--entities', type=int, default=1000, help="entities spawned per run")
+    parser.add_argument('--replicates', type=int, default=1,
+                        help="runs per configuration, each on its own spawned seed")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="base seed shared by all configurations (default: derived from each config)")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--output', default='sweep.csv', help="results CSV, appended to on resume")
+    parser.add_argument('--verbose', action='store_true', help="enable info logging")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format="%(message)s")
+    points = list(grid(**dict(_parse_values(spec) for spec in args.param)))
+    if args.sample:
+        ranges = dict(_parse_range(spec) for spec in args.sample)
+        samples = list(random_samples(args.samples or 1, ranges, args.sample_seed))
+        configs = [{**point, **sample} for point in points for sample in samples]
+    else:
+        configs = points
+
+    runner = SweepRunner(args.output, args.steps, args.workers, args.seed,
+                         args.replicates, args.entities)
+    finished = runner.run(configs)
+    total = len(configs) * args.replicates
+    print(f"{finished} runs written to {args.output} ({total - finished} skipped)")
+
+if __name__ == "__main__":
+    main()
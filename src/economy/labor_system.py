@@ -0,0 +1,285 @@
+# src/economy/labor_system.py
+from dataclasses import dataclass
+from typing import Optional
+import numpy as np
+
+@dataclass
+class MatchResult:
+    """Outcome of one matching round for a batch of job seekers"""
+    employer: np.ndarray  # employer index per seeker, -1 when unmatched
+    wage: np.ndarray      # accepted wage per seeker, 0 when unmatched
+    matched: int = 0
+
+def _by_target_then_score(targets: np.ndarray, scores: np.ndarray) -> np.ndarray:
+    """Sort key ordering proposals by target, then by descending float32 score"""
+    bits = scores.astype(np.float32).view(np.int32).astype(np.int64)
+    bits ^= (bits >> 31) & 0x7FFFFFFF  # float order as signed integer order
+    return (targets.astype(np.int64) << 32) | (0x7FFFFFFF - bits)
+
+class LaborSystem:
+    """Batched matching of job seekers to employer openings
+
+    Employers are bucketed on a uniform grid; within each cell they are
+    ordered by required skill, so the employers a seeker qualifies for form
+    a prefix of that order. For every prefix the index keeps its `candidates`
+    best-paying open employers. A seeker looks up its qualifying prefix in
+    its own and the 8 neighbouring cells, drops offers below its
+    reservation wage and ranks what remains, so one tick costs
+    O(seekers * 9 * candidates) rather than O(seekers * employers).
+    Conflicts over limited openings are resolved in rounds of proposals:
+    each employer keeps its highest-scoring proposers and rejected seekers
+    move on to their next offer, asking the index again once all of theirs
+    are taken.
+
+    The index is built once per match() and only the cells of employers
+    that filled up are re-ranked after each round. Every round either
+    fills an employer or matches every proposer, so proposals stop after at
+    most one round per hiring employer; `rounds` optionally caps them lower,
+    leaving the remaining seekers unmatched.
+    """
+
+    CHUNK = 1 << 16  # seekers scored at a time, bounding temporary memory
+
+    def __init__(self, cell_size: float = 50.0, candidates: int = 8, rounds: Optional[int] = None,
+                 wage_weight: float = 1.0, distance_weight: float = 0.01,
+                 skill_weight: float = 1.0, skill_tolerance: float = 0.0):
+        self.cell_size = cell_size
+        self.candidates = candidates
+        self.rounds = rounds
+        self.wage_weight = wage_weight
+        self.distance_weight = distance_weight
+        self.skill_weight = skill_weight
+        self.skill_tolerance = skill_tolerance
+        self.set_employers(np.empty(0), np.empty(0), np.empty(0), np.empty(0), np.empty(0))
+
+    def set_employers(self, x, y, required_skill, wage, openings):
+        """Replace the employer table, forgetting who was hired from the old one"""
+        self.employer_x = np.asarray(x, dtype=np.float64)
+        self.employer_y = np.asarray(y, dtype=np.float64)
+        self.required_skill = np.asarray(required_skill, dtype=np.float64)
+        self.wage = np.asarray(wage, dtype=np.float64)
+        self.openings = np.asarray(openings, dtype=np.int64).copy()
+        self.employed = 0  # positions filled by match() and not yet released
+        self.seeking = 0   # seekers the latest match() left without a job
+
+    def vacancies(self) -> int:
+        """Total open positions across all employers"""
+        return int(self.openings.sum())
+
+    def release(self, employers):
+        """Return positions to employers, e.g. when workers quit"""
+        employers = np.asarray(employers, dtype=np.int64)
+        employers = employers[employers >= 0]
+        np.add.at(self.openings, employers, 1)
+        self.employed -= len(employers)
+
+    def match(self, x, y, skill, reservation_wage) -> MatchResult:
+        """Match a batch of seekers to openings, filling positions taken"""
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        skill = np.asarray(skill, dtype=np.float64)
+        reservation_wage = np.asarray(reservation_wage, dtype=np.float64)
+        n = len(x)
+        employer = np.full(n, -1, dtype=np.int64)
+        if n == 0 or not np.any(self.openings > 0):
+            self.seeking = n
+            return MatchResult(employer, np.zeros(n))
+
+        self._build_index()
+        # Seekers are taken in cell and skill order, so neighbouring rows
+        # read the same index entries; their qualifying prefixes are fixed
+        # for the whole match, so they are looked up once
+        seekers = np.lexsort((skill, self._cell_keys(x, y)))
+        x, y = x[seekers], y[seekers]
+        skill, reservation_wage = skill[seekers], reservation_wage[seekers]
+        position = (x + 1j * y).astype(np.complex64)
+        prefixes = self._prefixes(x, y, skill)
+
+        # Every seeker holds its offers best first and a pointer to the next
+        # one; an offer is passed over once its employer has filled up
+        offers, count, more = self._candidates(prefixes, position, skill, reservation_wage)
+        pointer = np.zeros(n, dtype=np.int64)
+        hired = np.full(n, -1, dtype=np.int64)
+        seeking = np.arange(n)
+        full = self.openings <= 0
+        rounds = 0
+        while len(seeking) and (self.rounds is None or rounds < self.rounds):
+            rounds += 1
+            # Skip offers from employers that filled since they were listed
+            target = self._current(offers, count, pointer, seeking)
+            stale = np.flatnonzero(target >= 0)
+            stale = stale[full[target[stale]]]
+            while len(stale):
+                pointer[seeking[stale]] += 1
+                target[stale] = self._current(offers, count, pointer, seeking[stale])
+                stale = stale[target[stale] >= 0]
+                stale = stale[full[target[stale]]]
+
+            # Every rejection came from an employer that filled up, so a seeker
+            # that ran out of offers asks the index again for open ones
+            exhausted = seeking[target < 0]
+            again = exhausted[more[exhausted]]
+            if len(again) and not full.all():
+                offers[again], count[again], more[again] = self._candidates(
+                    prefixes[again], position[again], skill[again], reservation_wage[again])
+                pointer[again] = 0
+                target[target < 0] = self._current(offers, count, pointer, exhausted)
+            proposing = np.flatnonzero(target >= 0)
+            seeking, target = seeking[proposing], target[proposing]
+            if len(seeking) == 0:
+                break
+
+            # Employers accept proposers in score order up to their openings
+            score = self._score(target[:, None], position[seeking], skill[seeking])[:, 0]
+            order = np.argsort(_by_target_then_score(target, score))
+            target_sorted = target[order]
+            group_start = np.searchsorted(target_sorted, target_sorted, side='left')
+            accepted = np.arange(len(order)) - group_start < self.openings[target_sorted]
+            hired_by = target_sorted[accepted]
+            hired[seeking[order[accepted]]] = hired_by
+            hires = np.bincount(hired_by, minlength=len(self.openings))
+            self.openings -= hires
+            full = self.openings <= 0
+            filled = np.flatnonzero(full & (hires > 0))
+            if len(filled):
+                self._rank(np.unique(self._cell_of[filled]))
+            # The rejected move past the offer that turned them down
+            seeking = seeking[hired[seeking] < 0]
+            pointer[seeking] += 1
+
+        employer[seekers] = hired
+        wage = np.where(employer >= 0, self.wage[np.maximum(employer, 0)], 0.0)
+        matched = int((employer >= 0).sum())
+        self.employed += matched
+        self.seeking = n - matched
+        return MatchResult(employer, wage, matched)
+
+    def _candidates(self, prefixes, position, skill, reservation_wage):
+        """Offers best first, their count and whether more may be left, per seeker"""
+        parts = [self._score_candidates(prefixes[i:i + self.CHUNK], position[i:i + self.CHUNK],
+                                        skill[i:i + self.CHUNK], reservation_wage[i:i + self.CHUNK])
+                 for i in range(0, len(prefixes), self.CHUNK)]
+        return tuple(np.concatenate([part[j] for part in parts]) for j in range(3))
+
+    @staticmethod
+    def _current(offers, count, pointer, rows) -> np.ndarray:
+        """Offer each row's pointer is at, -1 once it has passed them all"""
+        at = pointer[rows]
+        live = at < count[rows]
+        return np.where(live, offers[rows, np.where(live, at, 0)], -1)
+
+    def _prefixes(self, x, y, skill) -> np.ndarray:
+        """Index row of each seeker's qualifying prefix in its cell and the 8 around it
+
+        Cells with no qualifying employer point at the all -1 last row.
+        """
+        none = len(self._best) - 1
+        prefixes = np.empty((len(x), 9), dtype=np.int32)
+        offsets = np.array([-1, 0, 1])
+        for i in range(0, len(x), self.CHUNK):
+            cx = np.floor(x[i:i + self.CHUNK] / self.cell_size).astype(np.int64)
+            cy = np.floor(y[i:i + self.CHUNK] / self.cell_size).astype(np.int64)
+            keys = self._keys(np.repeat(cx[:, None] + offsets, 3, axis=1),
+                              np.tile(cy[:, None] + offsets, (1, 3)))
+            cell = np.minimum(np.searchsorted(self._cells, keys), len(self._cells) - 1)
+            has_cell = self._cells[cell] == keys
+            # End of each cell's qualifying prefix: the first employer needing more skill
+            rank = np.searchsorted(self._skills, skill[i:i + self.CHUNK] + self.skill_tolerance, side='right')
+            end = np.searchsorted(self._composite, cell * (len(self._skills) + 1) + rank[:, None])
+            has_prefix = has_cell & (end > self._cell_start[cell])
+            prefixes[i:i + self.CHUNK] = np.where(has_prefix, end - 1, none)
+        return prefixes
+
+    def _cell_keys(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        return self._keys(np.floor(x / self.cell_size).astype(np.int64),
+                          np.floor(y / self.cell_size).astype(np.int64))
+
+    @staticmethod
+    def _keys(cx: np.ndarray, cy: np.ndarray) -> np.ndarray:
+        return (cx << 32) ^ (cy & 0xFFFFFFFF)
+
+    def _build_index(self):
+        """Index the open employers by cell and required skill
+
+        `_best[i]` holds the best-paying `candidates` open employers (best
+        first, -1 padded) among positions start..i of i's cell in skill order.
+        """
+        hiring = np.flatnonzero(self.openings > 0)
+        keys = self._cell_keys(self.employer_x[hiring], self.employer_y[hiring])
+        # Skills as ranks, so (cell, skill) orders as one integer
+        skills, skill_rank = np.unique(self.required_skill[hiring], return_inverse=True)
+        cells, cell_index = np.unique(keys, return_inverse=True)
+        composite = cell_index * (len(skills) + 1) + skill_rank
+        order = np.argsort(composite, kind='stable')
+        self._employers = hiring[order]
+        self._cell_of = np.full(len(self.openings), -1, dtype=np.int64)
+        self._cell_of[hiring] = cell_index
+
+        cell_start = np.searchsorted(cell_index[order], np.arange(len(cells)))
+        self._cell_length = np.diff(np.append(cell_start, len(order)))
+        # One extra all -1 row stands for "no qualifying employer"
+        self._best = np.full((len(order) + 1, self.candidates), -1, dtype=np.int32)
+
+        # Per-employer columns for scoring, with a last entry that pads
+        # missing candidates (index -1) and never passes the wage test
+        self._position = np.append(self.employer_x + 1j * self.employer_y, 0.0).astype(np.complex64)
+        self._skill = np.append(self.required_skill, 0.0).astype(np.float32)
+        self._wage = np.append(self.wage, -np.inf)
+        self._cells = cells
+        self._skills = skills
+        self._composite = composite[order]
+        self._cell_start = cell_start
+        self._rank(np.arange(len(cells)))
+
+    def _rank(self, cells: np.ndarray):
+        """Recompute `_best` over every prefix of the given cells, skipping full employers"""
+        k = self.candidates
+        best = self._best
+        starts = self._cell_start[cells]
+        lengths = self._cell_length[cells]
+        for depth in range(int(lengths.max(initial=0))):
+            rows = starts[lengths > depth] + depth
+            own = self._employers[rows]
+            own = np.where(self.openings[own] > 0, own, -1)
+            if depth == 0:
+                best[rows] = -1
+                best[rows, 0] = own
+                continue
+            merged = np.concatenate((best[rows - 1], own[:, None]), axis=1)
+            top = np.argsort(-self._wage[merged], axis=1, kind='stable')[:, :k]
+            best[rows] = np.take_along_axis(merged, top, axis=1)
+
+    def _score_candidates(self, prefixes, position, skill, reservation_wage):
+        """Eligible offers of the qualifying prefixes (best first, -1 padded), their count and more flag"""
+        k = self.candidates
+        n = len(prefixes)
+        candidates = self._best[prefixes]
+        # A cell whose list is full may hold more eligible employers past
+        # it, unless its lowest listed wage is already below the reservation
+        last = candidates[:, :, k - 1]
+        more = ((last >= 0) & (self._wage[last] >= reservation_wage[:, None])).any(axis=1)
+        candidates = candidates.reshape(n, 9 * k)
+
+        # Skill eligibility is exact from the prefix and padding (-1) has
+        # wage -inf, so the wage test leaves only real, acceptable offers
+        valid = self._wage[candidates] >= reservation_wage[:, None]
+        scores = self._score(candidates, position, skill)
+        scores[~valid] = -np.inf
+        order = np.argsort(-scores, axis=1, kind='stable')
+        offers = np.take_along_axis(candidates, order, axis=1)
+        return offers, valid.sum(axis=1), more
+
+    def _score(self, candidates, position, skill) -> np.ndarray:
+        """float32 score of each seeker (row) for each candidate employer (column)
+
+        float32 halves the memory traffic of the seekers x 9k pass; offers
+        and proposals are scored by this same function, so they rank alike.
+        """
+        scores = self._wage[candidates].astype(np.float32)
+        scores *= np.float32(self.wage_weight)
+        scores -= np.float32(self.distance_weight) * np.abs(self._position[candidates] - position[:, None])
+        if self.skill_tolerance > 0:
+            # Without tolerance no candidate needs more skill than the seeker has
+            skill_gap = self._skill[candidates] - skill.astype(np.float32)[:, None]
+            scores -= np.float32(self.skill_weight) * np.maximum(skill_gap, np.float32(0.0))
+        return scores
@@ -0,0 +1,212 @@
+# src/economy/market.py
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+import numpy as np
+
+BUY = 0
+SELL = 1
+
+@dataclass
+class ClearingResult:
+    """Outcome of one batch auction for a single good"""
+    good: int
+    price: float = np.nan
+    volume: float = 0.0
+    order_ids: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    agents: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    sides: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int8))
+    quantities: np.ndarray = field(default_factory=lambda: np.empty(0))
+
+    def trades(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Pair buy fills with sell fills as (buyer, seller, quantity) arrays
+
+        Both sides' fills, in priority order, are laid end to end along the
+        executed volume; every stretch where one buy fill overlaps one sell
+        fill is a trade at the clearing price.
+        """
+        buys = self.sides == BUY
+        buy_end = np.cumsum(self.quantities[buys])
+        sell_end = np.cumsum(self.quantities[~buys])
+        if len(buy_end) == 0 or len(sell_end) == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, np.empty(0)
+        # Both sides sum to the volume; drop their (rounded) totals and use it once
+        ends = np.append(np.union1d(buy_end[:-1], sell_end[:-1]), self.volume)
+        starts = np.concatenate(([0.0], ends[:-1]))
+        quantities = ends - starts
+        keep = quantities > 1e-12
+        middle = (starts[keep] + ends[keep]) / 2
+        buyer = np.minimum(np.searchsorted(buy_end, middle), len(buy_end) - 1)
+        seller = np.minimum(np.searchsorted(sell_end, middle), len(sell_end) - 1)
+        return self.agents[buys][buyer], self.agents[~buys][seller], quantities[keep]
+
+class OrderBook:
+    """Limit order book for one good, cleared by a uniform-price batch auction
+
+    Orders are kept in parallel NumPy arrays. The order id doubles as the
+    arrival sequence, so sorting by (price, id) gives price-time priority.
+    Unfilled quantity rests in the book for the next auction.
+    """
+
+    _FIELDS = (('ids', np.int64), ('agents', np.int64), ('sides', np.int8),
+               ('prices', np.float64), ('quantities', np.float64))
+
+    def __init__(self, good: int):
+        self.good = good
+        self.last_price = np.nan
+        for name, dtype in self._FIELDS:
+            setattr(self, name, np.empty(0, dtype=dtype))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add_orders(self, ids: np.ndarray, agents: np.ndarray, sides: np.ndarray,
+                   prices: np.ndarray, quantities: np.ndarray):
+        """Append a batch of orders; `ids` must be increasing across calls"""
+        for (name, dtype), values in zip(self._FIELDS, (ids, agents, sides, prices, quantities)):
+            setattr(self, name, np.concatenate((getattr(self, name), np.asarray(values, dtype=dtype))))
+
+    def cancel(self, order_ids) -> int:
+        """Remove orders by id, returning how many were removed"""
+        keep = ~np.isin(self.ids, order_ids)
+        removed = len(self.ids) - int(keep.sum())
+        if removed:
+            self._select(keep)
+        return removed
+
+    def best_bid(self) -> float:
+        bids = self.prices[self.sides == BUY]
+        return float(bids.max()) if len(bids) else np.nan
+
+    def best_ask(self) -> float:
+        asks = self.prices[self.sides == SELL]
+        return float(asks.min()) if len(asks) else np.nan
+
+    def clear(self) -> ClearingResult:
+        """Run one batch auction and remove filled quantity from the book
+
+        The clearing price maximises executed volume; ties are broken by the
+        smallest order imbalance and then by the midpoint of the tied prices.
+        Orders that can trade are filled in price-time priority.
+        """
+        result = ClearingResult(self.good)
+        is_bid = self.sides == BUY
+        bid_idx = np.flatnonzero(is_bid)
+        ask_idx = np.flatnonzero(~is_bid)
+        if len(bid_idx) == 0 or len(ask_idx) == 0:
+            return result
+
+        # Priority order: bids by price desc, asks by price asc, then by arrival
+        bid_idx = bid_idx[np.lexsort((self.ids[bid_idx], -self.prices[bid_idx]))]
+        ask_idx = ask_idx[np.lexsort((self.ids[ask_idx], self.prices[ask_idx]))]
+        bid_prices, ask_prices = self.prices[bid_idx], self.prices[ask_idx]
+        if bid_prices[0] < ask_prices[0]:
+            return result
+
+        bid_cum = np.cumsum(self.quantities[bid_idx])
+        ask_cum = np.cumsum(self.quantities[ask_idx])
+
+        # Demand/supply at every candidate price
+        candidates = np.unique(np.concatenate((bid_prices, ask_prices)))
+        n_bids = np.searchsorted(-bid_prices, -candidates, side='right')
+        n_asks = np.searchsorted(ask_prices, candidates, side='right')
+        demand = np.where(n_bids > 0, bid_cum[np.maximum(n_bids - 1, 0)], 0.0)
+        supply = np.where(n_asks > 0, ask_cum[np.maximum(n_asks - 1, 0)], 0.0)
+        volume = np.minimum(demand, supply)
+
+        best_volume = volume.max()
+        if best_volume <= 0:
+            return result
+        tied = volume == best_volume
+        imbalance = np.abs(demand - supply)
+        tied &= imbalance == imbalance[tied].min()
+        price = float(candidates[tied].mean())
+
+        bid_fill = np.clip(best_volume - (bid_cum - self.quantities[bid_idx]), 0, self.quantities[bid_idx])
+        ask_fill = np.clip(best_volume - (ask_cum - self.quantities[ask_idx]), 0, self.quantities[ask_idx])
+        filled_idx = np.concatenate((bid_idx, ask_idx))
+        fills = np.concatenate((bid_fill, ask_fill))
+        traded = fills > 0
+        filled_idx, fills = filled_idx[traded], fills[traded]
+
+        result.price = price
+        result.volume = float(best_volume)
+        result.order_ids = self.ids[filled_idx]
+        result.agents = self.agents[filled_idx]
+        result.sides = self.sides[filled_idx]
+        result.quantities = fills
+
+        self.quantities[filled_idx] -= fills
+        self._select(self.quantities > 1e-12)
+        self.last_price = price
+        return result
+
+    def _select(self, mask: np.ndarray):
+        for name, _ in self._FIELDS:
+            setattr(self, name, getattr(self, name)[mask])
+
+class Market:
+    """Order books for every good, cleared together once per simulation tick"""
+
+    def __init__(self, goods: int):
+        self.books = [OrderBook(good) for good in range(goods)]
+        self._next_id = 0
+        self.clear_count = 0    # number of clear() calls
+        self.price_version = 0  # bumped when an auction trades, lets readers skip unchanged prices
+
+    @property
+    def last_prices(self) -> np.ndarray:
+        return np.array([book.last_price for book in self.books])
+
+    def submit(self, agents, goods, sides, prices, quantities) -> np.ndarray:
+        """Submit a batch of limit orders and return their ids
+
+        All arguments are equal-length arrays (scalars are broadcast).
+        """
+        agents, goods, sides, prices, quantities = np.broadcast_arrays(
+            *np.atleast_1d(agents, goods, sides, prices, quantities)
+        )
+        if len(goods) == 0:
+            return np.empty(0, dtype=np.int64)
+        if np.any(quantities <= 0):
+            raise ValueError("Order quantities must be positive")
+        if goods.min() < 0 or goods.max() >= len(self.books):
+            raise ValueError(f"Good index out of range (market has {len(self.books)} goods)")
+        ids = np.arange(self._next_id, self._next_id + len(goods), dtype=np.int64)
+        self._next_id += len(goods)
+
+        order = np.argsort(goods, kind='stable')
+        bounds = np.searchsorted(goods[order], np.arange(len(self.books) + 1))
+        for good, (lo, hi) in enumerate(zip(bounds[:-1], bounds[1:])):
+            if lo == hi:
+                continue
+            sel = order[lo:hi]
+            self.books[good].add_orders(ids[sel], agents[sel], sides[sel], prices[sel], quantities[sel])
+        return ids
+
+    def submit_order(self, agent: int, good: int, side: int, price: float, quantity: float) -> int:
+        """Submit a single limit order"""
+        return int(self.submit([agent], [good], [side], [price], [quantity])[0])
+
+    def cancel(self, order_ids, good: Optional[int] = None) -> int:
+        """Cancel orders by id, optionally only in one good's book"""
+        books = self.books if good is None else [self.books[good]]
+        return sum(book.cancel(order_ids) for book in books)
+
+    def clear(self) -> Dict[int, ClearingResult]:
+        """Run the batch auction of every good with trades, keyed by good"""
+        results = {}
+        self.clear_count += 1
+        for book in self.books:
+            if len(book) == 0:
+                continue
+            result = book.clear()
+            if result.volume > 0:
+                results[book.good] = result
+        if results:
+            self.price_version += 1
+        return results
+
+    def depth(self) -> np.ndarray:
+        """Number of resting orders per good"""
+        return np.array([len(book) for book in self.books])
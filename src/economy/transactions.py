@@ -0,0 +1,250 @@
+# src/economy/transactions.py
+import itertools
+import os
+import shutil
+import tempfile
+import weakref
+from typing import Dict, List, Optional
+import numpy as np
+
+# Source of TransactionLedger.generation; never reused, unlike id()
+_generations = itertools.count()
+
+# Transaction kinds
+TRANSFER = 0
+PURCHASE = 1
+WAGE = 2
+TAX = 3
+
+COLUMNS = {
+    'tick': np.int64,
+    'payer': np.int64,
+    'payee': np.int64,
+    'amount': np.float64,
+    'kind': np.int16,
+}
+
+class LedgerChunk:
+    """Fixed-capacity block of ledger rows stored column by column"""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.length = 0
+        self.columns: Dict[str, np.ndarray] = {
+            name: np.empty(capacity, dtype=dtype) for name, dtype in COLUMNS.items()
+        }
+        self.spilled = False
+
+    @property
+    def full(self) -> bool:
+        return self.length == self.capacity
+
+    @property
+    def first_tick(self) -> int:
+        return int(self.columns['tick'][0])
+
+    @property
+    def last_tick(self) -> int:
+        return int(self.columns['tick'][self.length - 1])
+
+    def append(self, values: Dict[str, np.ndarray], start: int, stop: int) -> int:
+        """Copy rows [start, stop) of `values` in, returning how many fitted"""
+        count = min(stop - start, self.capacity - self.length)
+        end = self.length + count
+        for name, column in self.columns.items():
+            column[self.length:end] = values[name][start:start + count]
+        self.length = end
+        return count
+
+    def view(self, name: str) -> np.ndarray:
+        return self.columns[name][:self.length]
+
+    def spill(self, directory: str, index: int):
+        """Move the chunk's columns to .npy files and map them read-only"""
+        for name in COLUMNS:
+            path = os.path.join(directory, f"chunk{index:06d}_{name}.npy")
+            np.save(path, self.view(name))
+            self.columns[name] = np.load(path, mmap_mode='r')
+        self.spilled = True
+
+class TransactionLedger:
+    """Append-only ledger of transfers in chunked NumPy columns
+
+    Rows are appended to preallocated chunks of `chunk_size`; once more than
+    `max_memory_chunks` full chunks are held in RAM the oldest are written to
+    `spill_dir` and memory-mapped. Balances per agent and totals per tick are
+    maintained on append, so those queries never scan the history. Ticks
+    must be non-decreasing, which lets range queries skip whole chunks.
+    Agent ids index the balance table and must be non-negative.
+
+    A spill directory created by the ledger is deleted by close(), or when
+    the ledger is garbage collected or the interpreter exits.
+    """
+
+    def __init__(self, chunk_size: int = 1 << 20, max_memory_chunks: int = 8,
+                 spill_dir: Optional[str] = None):
+        self.chunk_size = chunk_size
+        self.max_memory_chunks = max_memory_chunks
+        self.spill_dir = spill_dir
+        self._owns_spill_dir = False
+        self._cleanup: Optional[weakref.finalize] = None
+        self.chunks: List[LedgerChunk] = [LedgerChunk(chunk_size)]
+        self.length = 0
+        self.last_tick = -1
+
+        self._balances = np.zeros(0)
+        self._agents = 0
+        self._tick_volume = np.zeros(0)
+        self._tick_count = np.zeros(0, dtype=np.int64)
+        # Unique per ledger in this process; identifies it in cache keys
+        self.generation = next(_generations)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def record(self, tick: int, payer: int, payee: int, amount: float, kind: int = TRANSFER):
+        """Record a single transfer"""
+        self.record_batch(tick, [payer], [payee], [amount], kind)
+
+    def record_batch(self, tick, payers, payees, amounts, kinds=TRANSFER):
+        """Record many transfers; `tick` and `kinds` may be scalars or arrays"""
+        payers = np.asarray(payers, dtype=np.int64)
+        count = len(payers)
+        if count == 0:
+            return
+        values = {
+            'tick': np.broadcast_to(np.asarray(tick, dtype=np.int64), (count,)),
+            'payer': payers,
+            'payee': np.asarray(payees, dtype=np.int64),
+            'amount': np.asarray(amounts, dtype=np.float64),
+            'kind': np.broadcast_to(np.asarray(kinds, dtype=np.int16), (count,)),
+        }
+        ticks = values['tick']
+        if ticks[0] < self.last_tick or np.any(np.diff(ticks) < 0):
+            raise ValueError("Ledger ticks must be non-decreasing")
+        if min(payers.min(), values['payee'].min()) < 0:
+            raise ValueError("Ledger agent ids must be non-negative")
+        if len(values['payee']) != count or len(values['amount']) != count:
+            raise ValueError("payers, payees and amounts must have the same length")
+
+        written = 0
+        while written < count:
+            chunk = self.chunks[-1]
+            if chunk.full:
+                chunk = self._new_chunk()
+            written += chunk.append(values, written, count)
+        self.length += count
+        self.last_tick = int(ticks[-1])
+        self._update_aggregates(values)
+
+    def balance(self, agent: int) -> float:
+        """Net amount received minus paid by an agent"""
+        return float(self._balances[agent]) if agent < self._agents else 0.0
+
+    def balances(self) -> np.ndarray:
+        """Net balance of every agent id seen so far (read-only view)"""
+        view = self._balances[:self._agents]
+        view.flags.writeable = False
+        return view
+
+    def tick_volume(self, tick: int) -> float:
+        """Total amount transferred during a tick"""
+        return float(self._tick_volume[tick]) if tick < len(self._tick_volume) else 0.0
+
+    def tick_count(self, tick: int) -> int:
+        """Number of transfers recorded during a tick"""
+        return int(self._tick_count[tick]) if tick < len(self._tick_count) else 0
+
+    def tick_totals(self, start: int, stop: int) -> Dict[str, np.ndarray]:
+        """Per-tick volume and count for ticks [start, stop)"""
+        volume = np.zeros(stop - start)
+        count = np.zeros(stop - start, dtype=np.int64)
+        hi = min(stop, len(self._tick_volume))
+        if hi > start:
+            volume[:hi - start] = self._tick_volume[start:hi]
+            count[:hi - start] = self._tick_count[start:hi]
+        return {'volume': volume, 'count': count}
+
+    def transactions(self, start: int, stop: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """All rows with start <= tick < stop, as a dict of columns
+
+        Only chunks whose tick range overlaps the query are read.
+        """
+        stop = self.last_tick + 1 if stop is None else stop
+        parts = {name: [] for name in COLUMNS}
+        for chunk in self.chunks:
+            if chunk.length == 0 or chunk.last_tick < start or chunk.first_tick >= stop:
+                continue
+            ticks = chunk.view('tick')
+            lo, hi = np.searchsorted(ticks, (start, stop))
+            for name in COLUMNS:
+                parts[name].append(chunk.view(name)[lo:hi])
+        return {name: np.concatenate(p) if p else np.empty(0, dtype=COLUMNS[name])
+                for name, p in parts.items()}
+
+    def column(self, name: str) -> np.ndarray:
+        """One column over the whole ledger, in row order"""
+        parts = [chunk.view(name) for chunk in self.chunks if chunk.length]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=COLUMNS[name])
+
+    def take(self, name: str, rows) -> np.ndarray:
+        """Values of one column at ledger row numbers, touching only the chunks involved"""
+        rows = np.asarray(rows, dtype=np.int64)
+        chunk_ids, offsets = np.divmod(rows, self.chunk_size)
+        out = np.empty(len(rows), dtype=COLUMNS[name])
+        for chunk_id in np.unique(chunk_ids).tolist():
+            selected = chunk_ids == chunk_id
+            out[selected] = self.chunks[chunk_id].columns[name][offsets[selected]]
+        return out
+
+    def close(self):
+        """Drop all chunks and delete a spill directory created by the ledger
+
+        The ledger must not be used after closing; it reads as empty, so a
+        view still holding it shows no rows instead of unmapped chunks.
+        """
+        self.chunks = [LedgerChunk(self.chunk_size)]
+        self.length = 0
+        self.last_tick = -1
+        if self._owns_spill_dir and self.spill_dir:
+            self._cleanup()
+            self.spill_dir = None
+            self._owns_spill_dir = False
+
+    def _new_chunk(self) -> LedgerChunk:
+        in_memory = [c for c in self.chunks if not c.spilled]
+        if len(in_memory) >= self.max_memory_chunks:
+            if self.spill_dir is None:
+                self.spill_dir = tempfile.mkdtemp(prefix="ledger_")
+                self._owns_spill_dir = True
+                self._cleanup = weakref.finalize(self, shutil.rmtree, self.spill_dir, True)
+            oldest = in_memory[0]
+            oldest.spill(self.spill_dir, self.chunks.index(oldest))
+        chunk = LedgerChunk(self.chunk_size)
+        self.chunks.append(chunk)
+        return chunk
+
+    def _update_aggregates(self, values: Dict[str, np.ndarray]):
+        payers, payees, amounts = values['payer'], values['payee'], values['amount']
+        agents = int(max(payers.max(), payees.max())) + 1
+        if agents > len(self._balances):
+            self._balances = _grow(self._balances, agents)
+        self._agents = max(self._agents, agents)
+        np.subtract.at(self._balances, payers, amounts)
+        np.add.at(self._balances, payees, amounts)
+
+        ticks = values['tick']
+        first = int(ticks[0])
+        offsets = ticks - first
+        span = int(offsets[-1]) + 1
+        if first + span > len(self._tick_volume):
+            self._tick_volume = _grow(self._tick_volume, first + span)
+            self._tick_count = _grow(self._tick_count, first + span)
+        self._tick_volume[first:first + span] += np.bincount(offsets, weights=amounts, minlength=span)
+        self._tick_count[first:first + span] += np.bincount(offsets, minlength=span)
+
+def _grow(array: np.ndarray, minimum: int) -> np.ndarray:
+    """Zero-extend an array to at least `minimum` entries, doubling capacity"""
+    grown = np.zeros(max(minimum, 2 * len(array)), dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
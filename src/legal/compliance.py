@@ -0,0 +1,113 @@
+# src/legal/compliance.py
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+from .regulations import DEFAULT_REGULATIONS, ENTITIES, TRANSACTIONS, Regulation
+
+class RuleResult:
+    """Cached outcome of one regulation"""
+    __slots__ = ('key', 'checked', 'violations', 'mask')
+
+    def __init__(self, key, checked: int, violations: int, mask: np.ndarray):
+        self.key = key
+        self.checked = checked
+        self.violations = violations
+        self.mask = mask
+
+class ComplianceEngine:
+    """Evaluate regulations as vectorized masks over entity and ledger columns
+
+    Each regulation is evaluated over whole columns at once, and
+    subexpressions shared between rules are computed once per pass. A rule
+    result is cached under the versions of the columns it reads (and the
+    store's generation and structure version), so a rule whose inputs did
+    not change since the last tick costs nothing. Transaction rules are
+    checked against the current tick's transfers.
+    """
+
+    def __init__(self, regulations: Optional[List[Regulation]] = None):
+        self.regulations = list(DEFAULT_REGULATIONS if regulations is None else regulations)
+        self.results: Dict[str, RuleResult] = {}
+        self.compliance = 1.0
+        self.evaluations = 0  # rules actually evaluated, for cache diagnostics
+
+    def add_regulation(self, regulation: Regulation):
+        if any(r.name == regulation.name for r in self.regulations):
+            raise ValueError(f"Regulation '{regulation.name}' already exists")
+        self.regulations.append(regulation)
+
+    def remove_regulation(self, name: str):
+        self.regulations = [r for r in self.regulations if r.name != name]
+        self.results.pop(name, None)
+
+    def evaluate(self, entities=None, ledger=None, tick: int = 0) -> float:
+        """Check all regulations and return the weighted compliance rate
+
+        The rate is 1 - Σ(w * violations) / Σ(w * rows checked) over all
+        rules, so an empty city is fully compliant.
+        """
+        entity_data = transaction_data = None
+        entity_memo: Dict[str, np.ndarray] = {}
+        transaction_memo: Dict[str, np.ndarray] = {}
+        checked = violations = 0.0
+
+        for regulation in self.regulations:
+            if regulation.applies_to == ENTITIES:
+                if entities is None:
+                    continue
+                key = self._entity_key(entities, regulation)
+                result = self.results.get(regulation.name)
+                if result is None or result.key != key:
+                    if entity_data is None:
+                        entity_data, alive = self._entity_columns(entities)
+                    result = self._run(regulation, key, entity_data, entity_memo, alive)
+            elif regulation.applies_to == TRANSACTIONS:
+                if ledger is None:
+                    continue
+                # A tick with no transfers gives the same (empty) result every time
+                count = ledger.tick_count(tick)
+                key = (ledger.generation, tick, count) if count else (ledger.generation, None)
+                result = self.results.get(regulation.name)
+                if result is None or result.key != key:
+                    if transaction_data is None:
+                        transaction_data = ledger.transactions(tick, tick + 1)
+                    result = self._run(regulation, key, transaction_data, transaction_memo)
+            else:
+                raise ValueError(f"Unknown regulation target: {regulation.applies_to}")
+
+            checked += regulation.weight * result.checked
+            violations += regulation.weight * result.violations
+
+        self.compliance = 1.0 - violations / checked if checked else 1.0
+        return self.compliance
+
+    def violations(self, name: str) -> np.ndarray:
+        """Row indices violating a regulation at the last evaluation"""
+        return np.flatnonzero(~self.results[name].mask)
+
+    def report(self) -> Dict[str, Tuple[int, int]]:
+        """(violations, rows checked) per regulation at the last evaluation"""
+        return {name: (r.violations, r.checked) for name, r in self.results.items()}
+
+    def _run(self, regulation: Regulation, key, data, memo, alive=None) -> RuleResult:
+        mask = np.broadcast_to(regulation.condition.evaluate(data, memo), len(next(iter(data.values()))))
+        if alive is not None:
+            mask = mask | ~alive
+            checked = int(alive.sum())
+        else:
+            checked = len(mask)
+        result = RuleResult(key, checked, int(len(mask) - np.count_nonzero(mask)), mask)
+        self.results[regulation.name] = result
+        self.evaluations += 1
+        return result
+
+    @staticmethod
+    def _entity_key(entities, regulation: Regulation):
+        versions = entities.column_versions
+        return (entities.generation, entities.structure_version,
+                tuple([versions[name] for name in regulation.columns]))
+
+    @staticmethod
+    def _entity_columns(entities):
+        data = {name: entities.column(name) for name in entities.columns}
+        return data, entities.alive[:entities.size]
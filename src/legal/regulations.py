@@ -0,0 +1,144 @@
+# src/legal/regulations.py
+"""Declarative regulations
+
+A regulation is a predicate over named columns, built from `col()` and
+constants with the usual operators:
+
+    Regulation('solvent', col('wealth') >= 0)
+    Regulation('in_bounds', (col('x') >= 0) & (col('x') <= 1000))
+
+Predicates are expression trees, so the compliance engine knows which
+columns each rule reads and can evaluate rules as whole-column array ops.
+"""
+import operator
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, Optional
+import numpy as np
+
+ENTITIES = 'entities'
+TRANSACTIONS = 'transactions'
+
+class Expr:
+    """Node of a predicate expression over columns"""
+    key: str
+
+    def columns(self) -> FrozenSet[str]:
+        raise NotImplementedError
+
+    def evaluate(self, data: Dict[str, np.ndarray], memo: Dict[str, np.ndarray]):
+        """Evaluate against a dict of columns; `memo` shares common subexpressions"""
+        raise NotImplementedError
+
+    def _binary(self, other, symbol: str, func: Callable) -> 'BinOp':
+        return BinOp(symbol, func, self, _wrap(other))
+
+    def __and__(self, other): return self._binary(other, '&', np.logical_and)
+    def __or__(self, other): return self._binary(other, '|', np.logical_or)
+    def __invert__(self): return UnaryOp('~', np.logical_not, self)
+    def __lt__(self, other): return self._binary(other, '<', operator.lt)
+    def __le__(self, other): return self._binary(other, '<=', operator.le)
+    def __gt__(self, other): return self._binary(other, '>', operator.gt)
+    def __ge__(self, other): return self._binary(other, '>=', operator.ge)
+    def __eq__(self, other): return self._binary(other, '==', operator.eq)
+    def __ne__(self, other): return self._binary(other, '!=', operator.ne)
+    def __add__(self, other): return self._binary(other, '+', operator.add)
+    def __sub__(self, other): return self._binary(other, '-', operator.sub)
+    def __mul__(self, other): return self._binary(other, '*', operator.mul)
+    def __truediv__(self, other): return self._binary(other, '/', operator.truediv)
+    def __abs__(self): return UnaryOp('abs', np.abs, self)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return self.key
+
+class Col(Expr):
+    def __init__(self, name: str):
+        self.name = name
+        self.key = name
+
+    def columns(self) -> FrozenSet[str]:
+        return frozenset((self.name,))
+
+    def evaluate(self, data, memo):
+        return data[self.name]
+
+class Const(Expr):
+    def __init__(self, value):
+        self.value = value
+        self.key = repr(value)
+
+    def columns(self) -> FrozenSet[str]:
+        return frozenset()
+
+    def evaluate(self, data, memo):
+        return self.value
+
+class UnaryOp(Expr):
+    def __init__(self, symbol: str, func: Callable, operand: Expr):
+        self.func = func
+        self.operand = operand
+        self.key = f"{symbol}({operand.key})"
+
+    def columns(self) -> FrozenSet[str]:
+        return self.operand.columns()
+
+    def evaluate(self, data, memo):
+        result = memo.get(self.key)
+        if result is None:
+            result = memo[self.key] = self.func(self.operand.evaluate(data, memo))
+        return result
+
+class BinOp(Expr):
+    def __init__(self, symbol: str, func: Callable, left: Expr, right: Expr):
+        self.func = func
+        self.left = left
+        self.right = right
+        self.key = f"({left.key} {symbol} {right.key})"
+        self._columns = left.columns() | right.columns()
+
+    def columns(self) -> FrozenSet[str]:
+        return self._columns
+
+    def evaluate(self, data, memo):
+        result = memo.get(self.key)
+        if result is None:
+            result = memo[self.key] = self.func(self.left.evaluate(data, memo),
+                                                self.right.evaluate(data, memo))
+        return result
+
+def _wrap(value) -> Expr:
+    return value if isinstance(value, Expr) else Const(value)
+
+def col(name: str) -> Col:
+    """Reference a column by name"""
+    return Col(name)
+
+@dataclass
+class Regulation:
+    """A named rule; rows where `condition` is False are violations"""
+    name: str
+    condition: Expr
+    applies_to: str = ENTITIES
+    weight: float = 1.0
+    description: Optional[str] = None
+
+    @property
+    def columns(self) -> FrozenSet[str]:
+        return self.condition.columns()
+
+CITY_SIZE = 1000.0
+
+DEFAULT_REGULATIONS = [
+    Regulation('solvency', col('wealth') >= 0,
+               description="Entities may not hold negative wealth"),
+    Regulation('city_bounds',
+               (col('x') >= 0) & (col('x') <= CITY_SIZE) & (col('y') >= 0) & (col('y') <= CITY_SIZE),
+               description="Entities stay inside the city limits"),
+    Regulation('speed_limit', col('vx') * col('vx') + col('vy') * col('vy') <= 25.0,
+               description="Entities move at most 5 units per tick"),
+    Regulation('positive_amount', col('amount') > 0, applies_to=TRANSACTIONS,
+               description="Transfers move a positive amount"),
+    Regulation('no_self_dealing', col('payer') != col('payee'), applies_to=TRANSACTIONS,
+               description="Agents may not pay themselves"),
+]
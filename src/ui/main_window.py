@@ -1,11 +1,15 @@
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QTabWidget, QLabel, QStatusBar, QGroupBox, QSplitter, QFrame
+    QTabWidget, QLabel, QStatusBar, QGroupBox, QSplitter, QFrame,
+    QTableView, QLineEdit, QHeaderView
 )
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve
+from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QTimer, QEvent, QPoint
 from PyQt6.QtGui import QColor
 
-from src.core.simulation_engine import SimulationEngine
+from src.ui.time_series_chart import TimeSeriesChart
+
+SIMULATION_HZ = 1000.0
+UI_REFRESH_HZ = 30.0
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -19,52 +23,112 @@ class MainWindow(QMainWindow):
         with open(style_path, 'r') as f:
             style = f.read()
             self.setStyleSheet(style)
-            self.simulation_engine = SimulationEngine()
+            # The engine pulls in SciPy and friends; it is created after the
+            # first paint (or on first use) by ensure_engine()
+            self.simulation_engine = None
+            self._engine_scheduled = False
+            self.scheduler = None
+            self.ui_events = None
+            self.ui_timer = QTimer(self)
+            self.ui_timer.setInterval(int(1000 / UI_REFRESH_HZ))
+            self.ui_timer.timeout.connect(self.refresh_from_scheduler)
+            self.entity_view = None
+            self.transaction_view = None
+            self._hover_animations = {}
+            self._hover_rest = {}
             self.setWindowTitle("Virtual City Simulation")
             self.setGeometry(100, 100, 1200, 800)
             self.setup_ui()
 
-    def setup_animations(self):
-        # For buttons
-        for button in self.findChildren(QPushButton):
-            button.enterEvent = lambda e, b=button: self.start_hover_animation(b, True)
-            button.leaveEvent = lambda e, b=button: self.start_hover_animation(b, False)
+    def ensure_engine(self):
+        """Create the engine and scheduler on first call"""
+        if self.simulation_engine is None:
+            from src.core.simulation_engine import SimulationEngine
+            from src.core.scheduler import FixedStepScheduler
+            self.simulation_engine = SimulationEngine()
+            self.scheduler = FixedStepScheduler(
+                self.simulation_engine, sim_hz=SIMULATION_HZ, ui_hz=UI_REFRESH_HZ
+            )
+            self.ui_events = self.simulation_engine.subscribe()
+            self.metrics_chart.add_history(self.simulation_engine.history,
+                                           self.simulation_engine.history.names)
+        return self.simulation_engine
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.simulation_engine is None and not self._engine_scheduled:
+            # The whole window is painted in this pass; build the engine right after
+            self._engine_scheduled = True
+            QTimer.singleShot(0, self.ensure_engine)
+
+    def setup_animations(self, root):
+        """Give every button under `root` a hover lift, one reusable animation each"""
+        for button in root.findChildren(QPushButton):
+            if button in self._hover_animations:
+                continue
+            anim = QPropertyAnimation(button, b"pos", button)
+            anim.setDuration(200)
+            anim.setEasingCurve(QEasingCurve.Type.OutCubic)
+            anim.finished.connect(lambda b=button: self._settle_hover(b))
+            self._hover_animations[button] = anim
+            button.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.Type.Enter, QEvent.Type.Leave) and obj in self._hover_animations:
+            self.start_hover_animation(obj, event.type() == QEvent.Type.Enter)
+        return super().eventFilter(obj, event)
 
     def start_hover_animation(self, widget, hover_in):
-        # Create animation
-        anim = QPropertyAnimation(widget, b"pos")
-        anim.setDuration(200)
-        anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-        
-        if hover_in:
-            anim.setEndValue(widget.pos().y() - 2)
-        else:
-            anim.setEndValue(widget.pos().y() + 2)
-        
+        # Retarget the widget's animation from wherever it is now, relative to
+        # the resting position, so quick enter/leave sequences never drift
+        anim = self._hover_animations[widget]
+        anim.stop()
+        rest = self._hover_rest.setdefault(widget, widget.pos())
+        anim.setEndValue(QPoint(rest.x(), rest.y() - 2) if hover_in else rest)
         anim.start()
 
+    def _settle_hover(self, widget):
+        if not widget.underMouse():
+            self._hover_rest.pop(widget, None)
 
     def setup_ui(self):
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         main_layout = QVBoxLayout(central_widget)
-        self.setup_animations()
-
-        # Create main tab widget
-        self.tabs = QTabWidget()
-        main_layout.addWidget(self.tabs)
-
-        # Add tabs
-        self.tabs.addTab(self.create_simulation_tab(), "Simulation")
-        self.tabs.addTab(self.create_ai_tab(), "AI Systems")
-        self.tabs.addTab(self.create_economy_tab(), "Economy")
-        self.tabs.addTab(self.create_legal_tab(), "Legal Framework")
 
         # Status bar
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("System Ready")
 
+        # Create main tab widget; tab contents are built on first activation
+        self.tabs = QTabWidget()
+        main_layout.addWidget(self.tabs)
+        self._tab_builders = {}
+
+        self.add_lazy_tab(self.create_simulation_tab, "Simulation")
+        self.add_lazy_tab(self.create_ai_tab, "AI Systems")
+        self.add_lazy_tab(self.create_economy_tab, "Economy")
+        self.add_lazy_tab(self.create_legal_tab, "Legal Framework")
+        self.tabs.currentChanged.connect(self.build_tab)
+        self.build_tab(self.tabs.currentIndex())
+
+    def add_lazy_tab(self, builder, title):
+        """Add an empty page whose contents `builder` creates when first shown"""
+        page = QWidget()
+        page_layout = QVBoxLayout(page)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        index = self.tabs.addTab(page, title)
+        self._tab_builders[index] = builder
+
+    def build_tab(self, index):
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        content = builder()
+        self.tabs.widget(index).layout().addWidget(content)
+        self.setup_animations(content)
+
     def create_simulation_tab(self):
         tab = QWidget()
         layout = QVBoxLayout(tab)
@@ -91,6 +155,10 @@ class MainWindow(QMainWindow):
 
         self.stop_btn = QPushButton("Stop")
         self.stop_btn.setProperty('class', 'danger-button')
+
+        self.start_btn.clicked.connect(self.start_simulation)
+        self.pause_btn.clicked.connect(self.pause_simulation)
+        self.stop_btn.clicked.connect(self.stop_simulation)
         
         buttons_layout.addWidget(self.start_btn)
         buttons_layout.addWidget(self.pause_btn)
@@ -115,7 +183,8 @@ class MainWindow(QMainWindow):
         vis_group = QGroupBox("Visualization")
         vis_group.setProperty('class', 'sliding-widget')
         vis_layout = QVBoxLayout()
-        # Add visualization widget here
+        self.metrics_chart = TimeSeriesChart("Metrics history")
+        vis_layout.addWidget(self.metrics_chart)
         vis_group.setLayout(vis_layout)
         center_layout.addWidget(vis_group)
         
@@ -137,6 +206,12 @@ class MainWindow(QMainWindow):
         self.economic_label.setProperty('class', 'metric-label')
         self.ai_label.setProperty('class', 'metric-label')
         self.legal_label.setProperty('class', 'metric-label')
+        self.metric_labels = {
+            'fidelity_index': (self.fidelity_label, "Fidelity Index"),
+            'economic_health': (self.economic_label, "Economic Health"),
+            'ai_evolution': (self.ai_label, "AI Evolution"),
+            'legal_compliance': (self.legal_label, "Legal Compliance"),
+        }
 
             
         
@@ -152,7 +227,22 @@ class MainWindow(QMainWindow):
         analysis_group = QGroupBox("Analysis")
         analysis_group.setProperty('class', 'sliding-widget')
         analysis_layout = QVBoxLayout()
-        # Add analysis widgets here
+
+        self.profile_btn = QPushButton("Enable Profiling")
+        self.profile_btn.setCheckable(True)
+        self.profile_btn.setProperty('class', 'primary-button')
+        self.profile_btn.toggled.connect(self.toggle_profiling)
+        analysis_layout.addWidget(self.profile_btn)
+
+        self.profile_label = QLabel("Profiling disabled")
+        self.profile_label.setProperty('class', 'metric-label')
+        self.profile_label.setStyleSheet("font-family: monospace;")
+        analysis_layout.addWidget(self.profile_label)
+
+        self.tick_chart = TimeSeriesChart("Tick time (ms)")
+        self.tick_chart.add_series('tick', self.tick_times)
+        analysis_layout.addWidget(self.tick_chart)
+
         analysis_group.setLayout(analysis_layout)
         right_layout.addWidget(analysis_group)
         
@@ -181,6 +271,7 @@ class MainWindow(QMainWindow):
         controls_layout = QVBoxLayout()
         add_agent_btn = QPushButton("Add AI Agent")
         add_agent_btn.setProperty('class', 'primary-button')
+        add_agent_btn.clicked.connect(self.add_ai_agent)
         add_entity_btn = QPushButton("Add AI Entity")
         add_entity_btn.setProperty('class', 'primary-button')
         
@@ -198,6 +289,16 @@ class MainWindow(QMainWindow):
         # Add visualization widget here
         vis_group.setLayout(vis_layout)
         center_layout.addWidget(vis_group)
+
+        from src.ui.table_models import EntityTableModel
+        entities_group = QGroupBox("Entities")
+        entities_layout = QVBoxLayout()
+        self.entity_model = EntityTableModel(self.ensure_engine().state.entities, self)
+        entities_layout.addWidget(self.create_filter_box(self.entity_model, "e.g. wealth > 100 & district == 2"))
+        self.entity_view = self.create_table_view(self.entity_model)
+        entities_layout.addWidget(self.entity_view)
+        entities_group.setLayout(entities_layout)
+        center_layout.addWidget(entities_group)
         
         # Right panel - Metrics
         right_panel = QWidget()
@@ -235,6 +336,17 @@ class MainWindow(QMainWindow):
         economic_data = QLabel("Economic Metrics")
         economic_data.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(economic_data)
+
+        from src.ui.table_models import TransactionTableModel
+        transactions_group = QGroupBox("Transactions")
+        transactions_layout = QVBoxLayout()
+        self.transaction_model = TransactionTableModel(self.ensure_engine().economy.ledger, self)
+        transactions_layout.addWidget(self.create_filter_box(self.transaction_model, "e.g. amount >= 50 & kind == 2"))
+        self.transaction_view = self.create_table_view(self.transaction_model)
+        transactions_layout.addWidget(self.transaction_view)
+        transactions_group.setLayout(transactions_layout)
+        layout.addWidget(transactions_group)
+        transactions_btn.clicked.connect(lambda: transactions_group.setVisible(not transactions_group.isVisible()))
         
         return tab
 
@@ -260,22 +372,129 @@ class MainWindow(QMainWindow):
         
         return tab
 
+    def create_table_view(self, model):
+        view = QTableView()
+        view.setModel(model)
+        view.verticalHeader().setVisible(False)
+        # Fixed row heights keep scrolling independent of the row count
+        view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        view.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        view.setSortingEnabled(True)
+        return view
+
+    def create_filter_box(self, model, placeholder):
+        from src.ui.table_models import parse_filter
+        box = QLineEdit()
+        box.setPlaceholderText(placeholder)
+
+        def apply():
+            try:
+                model.set_filter(parse_filter(box.text()))
+            except (ValueError, KeyError) as e:
+                self.status_bar.showMessage(f"Invalid filter: {e}")
+        box.returnPressed.connect(apply)
+        return box
+
+    def refresh_tables(self):
+        """Bring the tables on the visible tab up to date with the engine"""
+        if self.entity_view is not None and self.entity_view.isVisible():
+            entities = self.simulation_engine.state.entities
+            if self.entity_model.store is not entities:
+                self.entity_model.set_store(entities)
+            else:
+                self.entity_model.refresh()
+        if self.transaction_view is not None and self.transaction_view.isVisible():
+            ledger = self.simulation_engine.economy.ledger
+            if self.transaction_model.ledger is not ledger:
+                self.transaction_model.set_ledger(ledger)
+            else:
+                self.transaction_model.refresh()
+
     def start_simulation(self):
-        self.simulation_engine.start()
-        self.update_metrics()
+        self.ensure_engine()
+        self.scheduler.start()
+        self.ui_timer.start()
         self.status_bar.showMessage("Simulation Running")
 
     def pause_simulation(self):
-        self.simulation_engine.pause()
+        if self.scheduler is None:
+            return
+        self.scheduler.pause()
+        self.refresh_from_scheduler()
         self.status_bar.showMessage("Simulation Paused")
 
     def stop_simulation(self):
-        self.simulation_engine.pause()
+        if self.scheduler is None:
+            return
+        self.scheduler.stop()
+        self.ui_timer.stop()
+        self.refresh_from_scheduler()
         self.status_bar.showMessage("Simulation Stopped")
 
-    def update_metrics(self):
-        metrics = self.simulation_engine.get_metrics()
-        self.fidelity_label.setText(f"Fidelity Index: {metrics['fidelity_index']:.3f}")
-        self.economic_label.setText(f"Economic Health: {metrics['economic_health']:.3f}")
-        self.ai_label.setText(f"AI Evolution: {metrics['ai_evolution']:.3f}")
-        self.legal_label.setText(f"Legal Compliance: {metrics['legal_compliance']:.3f}")
\ No newline at end of file
+    def refresh_from_scheduler(self):
+        if self.ui_events is None:
+            return
+        # One merged update per frame; only changed metrics are in it
+        update = self.ui_events.drain()
+        if update is not None:
+            self.apply_update(update)
+        snapshot = self.scheduler.latest_snapshot()
+        if snapshot is not None and 'profile' in snapshot:
+            self.update_profile(snapshot['profile'])
+            self.tick_chart.update()
+
+    def apply_update(self, update):
+        if update.metrics:
+            self.update_metrics(update.metrics)
+        if update.ticks:
+            self.metrics_chart.update()
+        if update.ticks or update.added or update.removed:
+            self.refresh_tables()
+        if update.added or update.removed:
+            self.status_bar.showMessage(f"Entities: {len(self.simulation_engine.state.entities)}")
+
+    def toggle_profiling(self, enabled):
+        self.ensure_engine().profiler.enabled = enabled
+        self.profile_btn.setText("Disable Profiling" if enabled else "Enable Profiling")
+        if not enabled:
+            self.profile_label.setText("Profiling disabled")
+
+    def tick_times(self):
+        """Recent tick durations in ms for the tick chart"""
+        if self.simulation_engine is None:
+            return (), (), None, None  # an empty chart needs no NumPy yet
+        import numpy as np
+        ticks = self.simulation_engine.profiler.ticks
+        samples = ticks.ordered() * 1000.0
+        first = ticks.count - len(samples)
+        return np.arange(first, ticks.count), samples, None, None
+
+    def update_profile(self, profile):
+        lines = [f"{'phase':<10}{'p50':>8}{'p95':>8}{'p99':>8}  (ms)"]
+        for name, stats in profile.items():
+            lines.append(f"{name:<10}{stats['p50']:>8.3f}{stats['p95']:>8.3f}{stats['p99']:>8.3f}")
+        if 'tick' in profile and 'block_growth' in profile['tick']:
+            lines.append(f"live blocks/tick: {profile['tick']['block_growth']:+.1f}")
+        self.profile_label.setText("\n".join(lines))
+
+    def add_ai_agent(self):
+        agents = self.ensure_engine().agents
+        agents.add_agent()
+        self.status_bar.showMessage(f"AI agents: {len(agents)}")
+
+    def closeEvent(self, event):
+        if self.scheduler is not None:
+            self.scheduler.stop()
+            self.ui_events.close()
+        super().closeEvent(event)
+
+    def update_metrics(self, metrics=None):
+        """Relabel the given metrics; others keep their current text"""
+        if metrics is None:
+            metrics = self.ensure_engine().get_metrics()
+        for name, value in metrics.items():
+            entry = self.metric_labels.get(name)
+            if entry is not None:
+                label, title = entry
+                label.setText(f"{title}: {value:.3f}")
\ No newline at end of file
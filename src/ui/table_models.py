@@ -0,0 +1,303 @@
+# src/ui/table_models.py
+"""Virtualized Qt table models over the engine's NumPy storage
+
+The models never build per-row Python objects. When the view is sorted or
+filtered, a model holds an int64 array mapping view rows to source
+positions (plus the sort keys); otherwise it holds nothing. Cell values are read in blocks of BLOCK rows around
+the requested cell. Rows are handed to the view FETCH_BATCH at a time as
+the user scrolls (canFetchMore/fetchMore). Sorting is one NumPy argsort of
+the sort column. Filtering evaluates a regulations-style column expression
+over the source arrays.
+"""
+import re
+from typing import Dict, List, Optional
+
+import numpy as np
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from src.economy.transactions import TransactionLedger
+from src.legal.regulations import Expr, col
+
+FETCH_BATCH = 1000
+BLOCK = 256
+
+_FILTER = re.compile(r'^\s*(\w+)\s*(<=|>=|==|!=|<|>)\s*(\S+)\s*$')
+
+def parse_filter(text: str) -> Optional[Expr]:
+    """Parse 'column op value' (e.g. 'wealth >= 100') into a column expression
+
+    Several comparisons can be joined with '&'. Empty text means no filter.
+    Raises ValueError on anything else.
+    """
+    expr = None
+    for part in text.split('&'):
+        if not part.strip():
+            continue
+        match = _FILTER.match(part)
+        if match is None:
+            raise ValueError(f"Cannot parse filter: {part.strip()!r}")
+        name, op, value = match.groups()
+        try:
+            value = float(value)
+        except ValueError:
+            pass
+        term = {'<': col(name) < value, '<=': col(name) <= value, '>': col(name) > value,
+                '>=': col(name) >= value, '==': col(name) == value, '!=': col(name) != value}[op]
+        expr = term if expr is None else expr & term
+    return expr
+
+class ArrayTableModel(QAbstractTableModel):
+    """Read-only, lazily fetched table over a set of source positions
+
+    Subclasses define `headers`. `_count()` gives the number of source
+    positions and `_values(name, positions)` their column values, with
+    positions=None meaning all of them.
+    """
+
+    headers: List[str] = []
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._order: Optional[np.ndarray] = None  # view row -> source position; None is identity
+        self._total = 0
+        self._loaded = 0
+        self._sort: Optional[tuple] = None
+        self._keys: Optional[np.ndarray] = None  # sort keys in view order
+        self._filter: Optional[Expr] = None
+        self._block_start = -1
+        self._block: Dict[str, np.ndarray] = {}
+
+    # Source access, provided by subclasses
+    def _count(self) -> int:
+        raise NotImplementedError
+
+    def _values(self, name: str, positions: Optional[np.ndarray]) -> np.ndarray:
+        raise NotImplementedError
+
+    def _format(self, name: str, value) -> str:
+        if isinstance(value, (float, np.floating)):
+            return f"{value:.3f}"
+        return str(value)
+
+    # Qt interface
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        row = index.row()
+        start = row - row % BLOCK
+        if start != self._block_start:
+            self._load_block(start)
+        name = self.headers[index.column()]
+        return self._format(name, self._block[name][row - start])
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < self._total
+
+    def fetchMore(self, parent=QModelIndex()):
+        count = min(FETCH_BATCH, self._total - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def sort(self, column: int, order=Qt.SortOrder.AscendingOrder):
+        # Qt passes -1 for "no sort column", e.g. setSortIndicator(-1) before
+        # setSortingEnabled(True); headers[-1] would sort by the last column
+        self._sort = (self.headers[column], order) if 0 <= column < len(self.headers) else None
+        self.rebuild()
+
+    # Filtering and refresh
+    def set_filter(self, expr: Optional[Expr]):
+        """Show only rows where `expr` holds (None shows all rows)"""
+        self._filter = expr
+        self.rebuild()
+
+    def rebuild(self):
+        """Recompute the row mapping from the source and reset the view"""
+        self.beginResetModel()
+        count = self._count()
+        order = None
+        if self._filter is not None:
+            data = {name: self._values(name, None) for name in self._filter.columns()}
+            mask = np.broadcast_to(self._filter.evaluate(data, {}), (count,))
+            order = np.flatnonzero(mask)
+        self._keys = None
+        if self._sort is not None:
+            name, direction = self._sort
+            keys = self._values(name, order)
+            ranked = np.argsort(keys, kind='stable')
+            if direction == Qt.SortOrder.DescendingOrder:
+                ranked = ranked[::-1]
+            order = ranked if order is None else order[ranked]
+            self._keys = keys[ranked]
+        self._order = order
+        self._total = count if order is None else len(order)
+        self._loaded = min(self._total, max(self._loaded, FETCH_BATCH))
+        self._block_start = -1
+        self.endResetModel()
+
+    def append_source(self, start: int, stop: int):
+        """Merge source positions [start, stop), newly appended, into the view
+
+        Costs O(new rows) for the filter plus one O(rows) insert when sorted,
+        instead of re-sorting everything.
+        """
+        new = np.arange(start, stop)
+        if self._filter is not None:
+            data = {name: self._values(name, new) for name in self._filter.columns()}
+            new = new[np.broadcast_to(self._filter.evaluate(data, {}), (len(new),))]
+        if self._order is None:
+            self._total = stop
+        elif self._sort is None:
+            self._order = np.concatenate((self._order, new))
+        else:
+            keys = self._values(self._sort[0], new)
+            ranked = np.argsort(keys, kind='stable')
+            new, keys = new[ranked], keys[ranked]
+            if self._sort[1] == Qt.SortOrder.DescendingOrder:
+                # Later rows go first among equal keys, as with a reversed stable sort
+                new, keys = new[::-1], keys[::-1]
+                where = len(self._keys) - np.searchsorted(self._keys[::-1], keys, side='right')
+            else:
+                where = np.searchsorted(self._keys, keys, side='right')
+            self._order = np.insert(self._order, where, new)
+            self._keys = np.insert(self._keys, where, keys)
+        if self._order is not None:
+            self._total = len(self._order)
+        self._block_start = -1
+        if self._loaded:
+            self.dataChanged.emit(self.index(0, 0), self.index(self._loaded - 1, len(self.headers) - 1),
+                                  [Qt.ItemDataRole.DisplayRole])
+        if self._loaded < FETCH_BATCH:
+            self.fetchMore()
+
+    def values_changed(self):
+        """Source values changed in place; repaint visible cells without regrouping rows"""
+        self._block_start = -1
+        if self._loaded:
+            self.dataChanged.emit(self.index(0, 0), self.index(self._loaded - 1, len(self.headers) - 1),
+                                  [Qt.ItemDataRole.DisplayRole])
+
+    def positions(self, start: int, stop: int) -> np.ndarray:
+        """Source positions of view rows [start, stop)"""
+        if self._order is None:
+            return np.arange(start, min(stop, self._total))
+        return self._order[start:stop]
+
+    def _load_block(self, start: int):
+        positions = self.positions(start, start + BLOCK)
+        self._block = {name: self._values(name, positions) for name in self.headers}
+        self._block_start = start
+
+class EntityTableModel(ArrayTableModel):
+    """Live entities of an EntityStore, one row per entity
+
+    refresh() rebuilds the row set only when entities were added or
+    removed. Moving values (positions, wealth) repaint in place, so a
+    sorted view keeps its order until the next rebuild or sort.
+    """
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.headers = ['id'] + list(store.schema)
+        self._rows = np.empty(0, dtype=np.int64)
+        self._structure = None
+        self._columns = None
+        self.rebuild()
+
+    def set_store(self, store):
+        self.store = store
+        self.rebuild()
+
+    def refresh(self):
+        store = self.store
+        if store.structure_version != self._structure:
+            self.rebuild()
+            return
+        columns = tuple(store.column_versions.values())
+        if columns != self._columns:
+            self._columns = columns
+            self.values_changed()
+
+    def rebuild(self):
+        store = self.store
+        self._rows = store.active_rows()
+        self._structure = store.structure_version
+        self._columns = tuple(store.column_versions.values())
+        super().rebuild()
+
+    def entity_row(self, view_row: int) -> int:
+        """Store row shown at a view row"""
+        return int(self._rows[self.positions(view_row, view_row + 1)[0]])
+
+    def _count(self) -> int:
+        return len(self._rows)
+
+    def _values(self, name, positions):
+        rows = self._rows if positions is None else self._rows[positions]
+        if name == 'id':
+            ids = self.store._ids
+            return np.array([ids[row] for row in rows.tolist()], dtype=object)
+        return self.store.columns[name][rows]
+
+class TransactionTableModel(ArrayTableModel):
+    """Rows of a TransactionLedger, newest appended at the bottom
+
+    Values are gathered straight from the ledger chunks (including spilled,
+    memory-mapped ones) for the rows being displayed.
+    """
+
+    headers = ['tick', 'payer', 'payee', 'amount', 'kind']
+    KIND_NAMES = {0: 'transfer', 1: 'purchase', 2: 'wage', 3: 'tax'}
+
+    def __init__(self, ledger: TransactionLedger, parent=None):
+        super().__init__(parent)
+        self.ledger = ledger
+        self._length = 0
+        self.rebuild()
+
+    def set_ledger(self, ledger: TransactionLedger):
+        self.ledger = ledger
+        self.rebuild()
+
+    def refresh(self):
+        """Pick up appended transactions"""
+        length = len(self.ledger)
+        if length == self._length:
+            return
+        start, self._length = self._length, length
+        self.append_source(start, length)
+
+    def rebuild(self):
+        self._length = len(self.ledger)
+        super().rebuild()
+
+    def _count(self) -> int:
+        return self._length
+
+    def _values(self, name, positions):
+        if positions is None:
+            return self.ledger.column(name)[:self._length]
+        return self.ledger.take(name, positions)
+
+    def _format(self, name, value):
+        if name == 'kind':
+            return self.KIND_NAMES.get(int(value), str(value))
+        return super()._format(name, value)
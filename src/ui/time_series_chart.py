@@ -0,0 +1,173 @@
+# src/ui/time_series_chart.py
+"""QPainter line chart that draws straight from NumPy arrays
+
+Series are decimated to at most two points (min and max) per horizontal
+pixel before drawing, so paint cost depends on the widget width, not on the
+history length. Points are written straight into each series' reusable
+QPolygonF buffer. Data is pulled in paintEvent, so a chart on a hidden tab
+costs nothing. NumPy is imported on the first paint with data, so an empty
+chart can be shown before it is loaded.
+"""
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
+
+from PyQt6.QtCore import QPointF, QRectF, Qt
+from PyQt6.QtGui import QColor, QPainter, QPen, QPolygonF
+from PyQt6.QtWidgets import QSizePolicy, QWidget
+
+if TYPE_CHECKING:
+    import numpy as np
+
+SERIES_COLORS = ('#007bff', '#28a745', '#17a2b8', '#dc3545', '#ffc107', '#6f42c1')
+BACKGROUND = QColor('#f8f9fa')
+GRID = QColor('#dee2e6')
+TEXT = QColor('#6c757d')
+LEGEND_BACKGROUND = QColor(248, 249, 250, 220)
+
+# (x, y, low, high); low/high are None when there is no min/max envelope
+SeriesData = Tuple['np.ndarray', 'np.ndarray', Optional['np.ndarray'], Optional['np.ndarray']]
+
+def decimate(x: 'np.ndarray', low: 'np.ndarray', high: 'np.ndarray',
+             buckets: int) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+    """Reduce samples to `buckets` min/max pairs over equal index ranges
+
+    Returns (x, low, high) with one entry per bucket; x is the first x of
+    the bucket. Inputs with no more than `buckets` samples are returned
+    unchanged.
+    """
+    if len(x) <= buckets:
+        return x, low, high
+    import numpy as np
+    starts = (np.arange(buckets) * len(x)) // buckets
+    return x[starts], np.minimum.reduceat(low, starts), np.maximum.reduceat(high, starts)
+
+@dataclass
+class _Series:
+    name: str
+    color: QColor
+    source: Callable[[], SeriesData]
+    line: QPolygonF
+    latest: float = float('nan')
+
+class TimeSeriesChart(QWidget):
+    """Live multi-series line chart
+
+    Each series is a callable returning (x, y, low, high) arrays; low/high
+    are the per-sample min/max of a downsampled MetricsHistory tier, or None
+    for raw samples. Call update() to repaint.
+    """
+
+    def __init__(self, title: str = '', y_range: Optional[Tuple[float, float]] = None, parent=None):
+        super().__init__(parent)
+        self.title = title
+        self.y_range = y_range
+        self.margin = 6
+        self._series: List[_Series] = []
+        self.setMinimumHeight(120)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+
+    def add_series(self, name: str, source: Callable[[], SeriesData], color: Optional[str] = None):
+        """Plot the arrays returned by `source` on every repaint"""
+        color = QColor(color or SERIES_COLORS[len(self._series) % len(SERIES_COLORS)])
+        self._series.append(_Series(name, color, source, QPolygonF()))
+
+    def add_history(self, history, names, span: Optional[int] = None):
+        """Plot metrics from a MetricsHistory, showing the last `span` ticks"""
+        for name in names:
+            self.add_series(name, self._history_source(history, name, span))
+
+    def _history_source(self, history, name: str, span: Optional[int]):
+        def source() -> SeriesData:
+            series = history.window(name, span, max_points=max(2 * self.width(), 2))
+            if series.factor == 1:
+                return series.ticks, series.mean, None, None
+            return series.ticks, series.mean, series.min, series.max
+        return source
+
+    def clear(self):
+        self._series.clear()
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), BACKGROUND)
+        metrics = painter.fontMetrics()
+        line_height = metrics.height()
+        plot = QRectF(self.rect()).adjusted(self.margin, self.margin + line_height,
+                                            -self.margin, -self.margin - line_height)
+        if plot.width() < 2 or plot.height() < 2:
+            return
+
+        data = [(series, series.source()) for series in self._series]
+        data = [(series, d) for series, d in data if len(d[0])]
+        painter.setPen(QPen(GRID))
+        painter.drawRect(plot)
+        if not data:
+            painter.setPen(QPen(TEXT))
+            painter.drawText(plot, Qt.AlignmentFlag.AlignCenter, "No data")
+            return
+        import numpy as np
+
+        x0 = min(float(d[0][0]) for _, d in data)
+        x1 = max(float(d[0][-1]) for _, d in data)
+        if self.y_range is not None:
+            y0, y1 = self.y_range
+        else:
+            y0 = min(float((d[1] if d[2] is None else d[2]).min()) for _, d in data)
+            y1 = max(float((d[1] if d[3] is None else d[3]).max()) for _, d in data)
+        if y1 <= y0:
+            y0, y1 = y0 - 0.5, y1 + 0.5
+        sx = plot.width() / max(x1 - x0, 1.0)
+        sy = plot.height() / (y1 - y0)
+
+        buckets = max(int(plot.width()), 1)
+        for series, (x, y, low, high) in data:
+            series.latest = float(y[-1])
+            px = plot.left() + (np.asarray(x, dtype=np.float64) - x0) * sx
+            # Each bucket contributes its min then its max, drawn as a vertical
+            # stroke; downsampled tiers feed their block min/max in, so the
+            # envelope matches what the raw samples would draw
+            if low is None:
+                low = high = y
+            lx, llow, lhigh = decimate(px, low, high, buckets)
+            points = np.empty((2 * len(lx), 2))
+            points[0::2, 0] = points[1::2, 0] = lx
+            points[0::2, 1] = llow
+            points[1::2, 1] = lhigh
+            points[:, 1] = plot.bottom() - (points[:, 1] - y0) * sy
+            _fill(series.line, points)
+            pen = QPen(series.color, 0)  # cosmetic 1px pen takes Qt's fast line path
+            painter.setPen(pen)
+            painter.drawPolyline(series.line)
+
+        painter.setPen(QPen(TEXT))
+        painter.drawText(QPointF(plot.left(), plot.top() - 2), self.title)
+        painter.drawText(QRectF(plot.left(), plot.top(), plot.width(), line_height),
+                         Qt.AlignmentFlag.AlignRight, f"{y1:.3g}")
+        painter.drawText(QRectF(plot.left(), plot.bottom() - line_height, plot.width(), line_height),
+                         Qt.AlignmentFlag.AlignRight, f"{y0:.3g}")
+        painter.drawText(QPointF(plot.left(), plot.bottom() + line_height), f"{x0:.0f}")
+        painter.drawText(QRectF(plot.left(), plot.bottom(), plot.width(), line_height),
+                         Qt.AlignmentFlag.AlignRight, f"{x1:.0f}")
+
+        # Legend in the top-left corner of the plot, with each series' latest value
+        labels = [f"{series.name} {series.latest:.3f}" for series, _ in data]
+        width = max(metrics.horizontalAdvance(label) for label in labels) + 8
+        painter.fillRect(QRectF(plot.left() + 1, plot.top() + 1, width, line_height * len(labels) + 4),
+                         LEGEND_BACKGROUND)
+        y = plot.top() + line_height
+        for (series, _), label in zip(data, labels):
+            painter.setPen(QPen(series.color))
+            painter.drawText(QPointF(plot.left() + 4, y), label)
+            y += line_height
+
+def _fill(polygon: QPolygonF, points: 'np.ndarray'):
+    """Copy an (n, 2) float64 array into a QPolygonF without per-point objects"""
+    if polygon.size() != len(points):
+        polygon.resize(len(points))
+    if not len(points):
+        return
+    import numpy as np
+    buffer = polygon.data()
+    buffer.setsize(len(points) * 2 * 8)
+    np.frombuffer(buffer, dtype=np.float64).reshape(-1, 2)[:] = points
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from src.ai.agent_system import AgentSystem
+
+class _Argmax:
+    """Scores are the states themselves, so the action is the largest feature"""
+
+    def scores(self, states):
+        return states
+
+def _system():
+    agents = AgentSystem(n_features=3, n_actions=3, rng=np.random.default_rng(0))
+    agents.register_policy('argmax', _Argmax())
+    return agents
+
+def test_decide_batches_every_live_agent():
+    agents = _system()
+    ids = agents.add_agents('argmax', np.eye(3))
+    assert ids.tolist() == [0, 1, 2]
+    assert agents.decide().tolist() == [0, 1, 2]
+
+def test_remove_moves_last_row_and_keeps_ids():
+    agents = _system()
+    agents.add_agents('argmax', np.eye(3))
+    agents.remove_agent(0)
+    assert len(agents) == 2
+    assert agents.states('argmax').tolist() == [[0, 0, 1], [0, 1, 0]]
+    agents.set_state(2, [1.0, 0.0, 0.0])
+    agents.set_state(1, [0.0, 0.0, 1.0])
+    actions = agents.decide()
+    assert actions[1] == 2 and actions[2] == 0
+
+def test_set_state_rejects_removed_and_unknown_ids():
+    agents = _system()
+    agents.add_agents('argmax', np.eye(3))
+    agents.remove_agent(0)
+    # Row 0 now holds agent 2; writing through the stale id must not reach it
+    with pytest.raises(KeyError):
+        agents.set_state(0, [0.0, 5.0, 0.0])
+    assert agents.states('argmax')[0].tolist() == [0, 0, 1]
+    for agent_id in (-1, 3):
+        with pytest.raises(KeyError):
+            agents.set_state(agent_id, [0.0, 0.0, 0.0])
+    with pytest.raises(KeyError):
+        agents.remove_agent(0)
+    with pytest.raises(ValueError):
+        agents.set_state(1, [1.0, 2.0])
@@ -0,0 +1,87 @@
+import numpy as np
+
+from src.core.run import populate
+from src.core.simulation_engine import SimulationEngine
+
+def _engine():
+    engine = SimulationEngine(seed=3)
+    populate(engine, 50, engine.stream('entities'))
+    engine.consciousness.random_graph(200, 4)
+    engine.agents.add_agents('mlp', engine.stream('ai').normal(size=(10, 8)))
+    engine.agents.remove_agent(3)
+    engine.economy.labor.set_employers([0.0, 30.0], [0.0, 0.0], [0.0, 0.5], [15.0, 25.0], [3, 2])
+    engine.set_fidelity_param('data.error_rate', 0.3)
+    engine.start()
+    return engine
+
+def _advance(engine, steps):
+    """Steps with market and labor activity drawn from the engine's own streams"""
+    rng = engine.stream('economy')
+    for _ in range(steps):
+        n = 6
+        engine.economy.market.submit(rng.integers(0, 20, n), rng.integers(0, 3, n), rng.integers(0, 2, n),
+                                     np.round(rng.normal(10.0, 1.0, n), 2), rng.integers(1, 5, n).astype(float))
+        if engine.state.time_step % 5 == 0:
+            engine.economy.labor.match(rng.random(3) * 40, np.zeros(3), rng.random(3), np.full(3, 10.0))
+        engine.step()
+
+def _snapshot(engine):
+    economy = engine.economy
+    return {
+        'metrics': dict(engine.get_metrics()),
+        'indicators': economy.get_indicators(),
+        'balances': economy.ledger.balances().tolist(),
+        'rows': len(economy.ledger),
+        'awareness': engine.consciousness.awareness.tolist(),
+        'actions': engine.agents.actions.tolist(),
+        'x': engine.state.entities.column('x').tolist(),
+        'depth': economy.market.depth().tolist(),
+        'openings': economy.labor.openings.tolist(),
+    }
+
+def test_restore_and_rerun_matches_uninterrupted_run(tmp_path):
+    engine = _engine()
+    _advance(engine, 20)
+    engine.save_checkpoint(str(tmp_path / "step20"))
+    _advance(engine, 20)
+    expected = _snapshot(engine)
+
+    # Drift every kind of state before restoring
+    engine.set_fidelity_param('data.error_rate', 0.9)
+    engine.set_fidelity_param('physics.1.weight', 0.1)
+    _advance(engine, 7)
+
+    engine.load_checkpoint(str(tmp_path / "step20"))
+    assert engine.state.time_step == 20
+    assert engine.consciousness.nodes == 200
+    _advance(engine, 20)
+    assert _snapshot(engine) == expected
+
+def test_restore_into_fresh_engine(tmp_path):
+    engine = _engine()
+    _advance(engine, 12)
+    engine.save_checkpoint(str(tmp_path / "cp"))
+    _advance(engine, 8)
+    expected = _snapshot(engine)
+
+    restored = SimulationEngine(seed=99)
+    restored.load_checkpoint(str(tmp_path / "cp"))
+    assert len(restored.agents) == 9
+    assert restored.fidelity_params['data']['error_rate'] == 0.3
+    _advance(restored, 8)
+    assert _snapshot(restored) == expected
+
+def test_empty_store_round_trip_accepts_new_entities(tmp_path):
+    engine = SimulationEngine(seed=1)
+    engine.start()
+    engine.save_checkpoint(str(tmp_path / "empty"))
+
+    restored = SimulationEngine(seed=1)
+    restored.load_checkpoint(str(tmp_path / "empty"))
+    store = restored.state.entities
+    assert len(store) == 0
+    assert all(len(column) == store.capacity for column in store.columns.values())
+    restored.add_entity('a', {'x': 2.0, 'wealth': 5.0})
+    restored.add_entity('b', {'x': 3.0})
+    assert store.get('a')['wealth'] == 5.0
+    assert store.column('x').tolist() == [2.0, 3.0]
@@ -0,0 +1,41 @@
+import numpy as np
+
+from src.core.entity_store import EntityStore
+from src.economy.transactions import TransactionLedger
+from src.legal.compliance import ComplianceEngine
+from src.legal.regulations import TRANSACTIONS, Regulation, col
+
+def _store(wealth):
+    store = EntityStore()
+    for i, value in enumerate(wealth):
+        store.add(f"e{i}", {'wealth': value})
+    return store
+
+def test_cache_is_reused_while_inputs_are_unchanged():
+    compliance = ComplianceEngine([Regulation('solvency', col('wealth') >= 0)])
+    store = _store([1.0, -1.0])
+    assert compliance.evaluate(store) == 0.5
+    assert compliance.evaluate(store) == 0.5
+    assert compliance.evaluations == 1
+
+def test_new_store_with_same_versions_is_evaluated_again():
+    compliance = ComplianceEngine([Regulation('solvency', col('wealth') >= 0)])
+    assert compliance.evaluate(_store([1.0, -1.0])) == 0.5
+    # A store built the same way has the same structure and column
+    # versions, and may even reuse the first one's address
+    replacement = _store([1.0, 1.0])
+    assert compliance.evaluate(replacement) == 1.0
+
+    restored = EntityStore.from_arrays({'wealth': np.array([-1.0, -1.0])}, np.array([True, True]),
+                                       ['a', 'b'])
+    assert compliance.evaluate(restored) == 0.0
+    assert compliance.evaluations == 3
+
+def test_new_ledger_with_same_tick_count_is_evaluated_again():
+    compliance = ComplianceEngine([Regulation('positive', col('amount') > 0, applies_to=TRANSACTIONS)])
+    ledger = TransactionLedger()
+    ledger.record(1, 0, 1, 5.0)
+    assert compliance.evaluate(ledger=ledger, tick=1) == 1.0
+    replacement = TransactionLedger()
+    replacement.record(1, 0, 1, -5.0)
+    assert compliance.evaluate(ledger=replacement, tick=1) == 0.0
@@ -0,0 +1,54 @@
+import pytest
+
+from src.core.economy_system import EconomySystem
+from src.core.simulation_engine import SimulationEngine
+from src.economy.market import BUY, SELL
+
+def _trade(economy, price, quantity=1.0, good=0):
+    economy.market.submit([1, 2], [good, good], [BUY, SELL], [price, price], [quantity, quantity])
+
+def test_health_tracks_employment_from_labor_system():
+    economy = EconomySystem()
+    economy.labor.set_employers([10.0], [10.0], [0.0], [20.0], [2])
+    baseline = economy.update(1).economic_health
+
+    economy.labor.match([10.0] * 4, [10.0] * 4, [1.0] * 4, [0.0] * 4)
+    indicators = economy.update(2)
+    assert indicators.unemployment == 0.5
+    assert indicators.economic_health == pytest.approx(baseline - 0.4 * 0.5)
+
+    economy.labor.release([0])
+    economy.labor.match([10.0] * 2, [10.0] * 2, [1.0] * 2, [0.0] * 2)
+    assert economy.update(3).unemployment == pytest.approx(1 / 3)
+
+def test_health_tracks_output_growth_and_inflation():
+    economy = EconomySystem()
+    _trade(economy, 10.0)
+    flat = economy.update(1).economic_health
+
+    # Output grows at constant prices: growth lifts health
+    _trade(economy, 10.0, quantity=2.0)
+    growing = economy.update(2)
+    assert growing.gdp == 30.0
+    assert growing.gdp_growth > 0
+    assert growing.economic_health > flat
+    health = growing.economic_health
+
+    # Prices jump at the same output: inflation pulls health down
+    _trade(economy, 15.0, quantity=2.0 * 10.0 / 15.0)
+    inflating = economy.update(3)
+    assert inflating.price_index == 1.5
+    assert inflating.inflation > 0
+    assert inflating.economic_health < health
+
+def test_engine_metric_follows_economy():
+    engine = SimulationEngine(seed=0)
+    engine.start()
+    engine.step()
+    idle = engine.get_metrics()['economic_health']
+    engine.economy.labor.set_employers([0.0], [0.0], [0.0], [10.0], [1])
+    engine.economy.labor.match([0.0, 0.0], [0.0, 0.0], [1.0, 1.0], [0.0, 0.0])
+    _trade(engine.economy, 20.0)
+    engine.step()
+    assert engine.get_metrics()['economic_health'] != idle
+    assert engine.get_metrics()['economic_health'] == engine.economy.indicators.economic_health
@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.core.entity_store import EntityStore
+
+def test_add_reads_mappings_and_attributes():
+    store = EntityStore()
+    assert store.add("a", {'x': 1.0, 'wealth': 5.0}) == 0
+    assert store.add("b", SimpleNamespace(x=2.0, y=3.0, district=4)) == 1
+    assert store.add("c", "opaque payload") == 2
+    assert store.get("a")['wealth'] == 5.0
+    assert store.get("b") == {'x': 2.0, 'y': 3.0, 'vx': 0.0, 'vy': 0.0, 'wealth': 0.0, 'district': 4}
+    assert store["c"] == "opaque payload" and store.get("c")['x'] == 0.0
+    # Adding an existing id updates its row in place
+    assert store.add("a", {'x': 9.0}) == 0
+    assert len(store) == 3 and store.column('x').tolist() == [9.0, 2.0, 0.0]
+
+def test_remove_frees_the_row_for_reuse():
+    store = EntityStore()
+    for name in "abcd":
+        store.add(name, {'x': 1.0})
+    version = store.structure_version
+    assert store.remove("b") and store.remove("c")
+    assert not store.remove("b")
+    assert store.structure_version == version + 2
+    assert "b" not in store and store.entity_id(1) is None
+    # Freed rows hold defaults and are skipped by active_rows
+    assert store.column('x').tolist() == [1.0, 0.0, 0.0, 1.0]
+    assert store.active_rows().tolist() == [0, 3]
+    # The most recently freed row is reused first; columns do not grow
+    assert store.add("e") == 2 and store.add("f") == 1
+    assert store.size == 4 and store.rows(["e", "f", "d"]).tolist() == [2, 1, 3]
+    assert list(store) == ["a", "d", "e", "f"]
+
+def test_grow_keeps_rows_and_defaults():
+    store = EntityStore(capacity=2, schema={'x': (np.float64, 0.0), 'level': (np.int32, 7)})
+    for i in range(5):
+        store.add(f"e{i}", {'x': float(i)})
+    assert store.capacity == 8 and store.size == 5
+    assert len(store.columns['x']) == len(store.alive) == 8
+    assert store.column('x').tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert store.column('level').tolist() == [7] * 5
+    assert store.columns['level'][5:].tolist() == [7] * 3
+    assert [store.entity_id(row) for row in range(5)] == [f"e{i}" for i in range(5)]
+
+def test_add_column_and_clear():
+    store = EntityStore(capacity=2)
+    store.add("a")
+    store.add("b")
+    store.add_column('age', np.int64, default=3)
+    assert store.column('age').tolist() == [3, 3]
+    store.column('age')[0] = 10
+    store.clear()
+    assert len(store) == 0 and store.size == 0 and store.capacity == 2
+    assert store.add("c") == 0 and store.get("c")['age'] == 3
@@ -0,0 +1,89 @@
+import numpy as np
+
+from src.ai.entity_system import EntitySystem, SpatialGrid
+from src.core.entity_store import EntityStore
+
+def _store(points):
+    store = EntityStore()
+    for i, (x, y) in enumerate(points):
+        store.add(f"e{i}", {'x': x, 'y': y})
+    return store
+
+def test_sync_moves_only_changed_rows(monkeypatch):
+    store = _store([(1.0, 1.0), (25.0, 5.0), (40.0, 40.0)])
+    system = EntitySystem(cell_size=10.0)
+    system.sync(store)
+    assert system.within(1.0, 1.0, 1.0).tolist() == [0]
+
+    replaced = []
+    monkeypatch.setattr(system.grid, 'set_points', lambda *args: replaced.append(args))
+    store.column('x')[1] = 2.0
+    store.touch('x')
+    system.sync(store)
+    assert not replaced
+    assert sorted(system.within(1.0, 1.0, 5.0).tolist()) == [0, 1]
+
+    # Nothing touched: nothing to do
+    system.sync(store)
+    assert not replaced
+
+def test_sync_replaces_points_when_rows_change():
+    store = _store([(1.0, 1.0)])
+    system = EntitySystem(cell_size=10.0)
+    system.sync(store)
+    store.add("late", {'x': 2.0, 'y': 2.0})
+    system.sync(store)
+    assert sorted(system.within(1.0, 1.0, 5.0).tolist()) == [0, 1]
+    store.remove("e0")
+    system.sync(store)
+    assert system.within(1.0, 1.0, 5.0).tolist() == [1]
+
+def test_grid_does_not_write_into_store_columns():
+    store = _store([(1.0, 1.0), (2.0, 2.0)])
+    system = EntitySystem()
+    system.sync(store)
+    assert system.within(1.0, 1.0, 0.5).tolist() == [0]
+    system.grid.move(np.array([0]), np.array([50.0]), np.array([50.0]))
+    assert store.column('x').tolist() == [1.0, 2.0]
+
+def test_engine_step_keeps_index_in_step_with_positions():
+    from src.core.simulation_engine import SimulationEngine
+    engine = SimulationEngine(seed=0)
+    engine.add_entity("a", {'x': 0.0, 'y': 0.0, 'vx': 3.0, 'vy': 0.0})
+    engine.add_entity("b", {'x': 20.0, 'y': 0.0})
+    engine.start()
+    for _ in range(5):
+        engine.step()
+    assert engine.entity_system.within(15.0, 0.0, 0.5).tolist() == [0]
+    distances, rows = engine.entity_system.nearest(1)
+    assert rows[:, 0].tolist() == [1, 0]
+    np.testing.assert_allclose(distances[:, 0], [5.0, 5.0])
+
+def test_knn_on_empty_grid():
+    grid = SpatialGrid()
+    distances, points = grid.query_knn(np.array([0.0, 1.0]), np.array([0.0, 1.0]), 3)
+    assert points.shape == (2, 3) and np.all(points == -1)
+    assert np.all(np.isinf(distances))
+    grid.set_points([1.0, 2.0], [1.0, 2.0], [False, False])
+    assert np.all(grid.query_knn(np.array([0.0]), np.array([0.0]), 1)[1] == -1)
+
+def test_nearest_never_returns_self_for_co_located_entities():
+    store = _store([(5.0, 5.0)] * 4 + [(9.0, 5.0)])
+    system = EntitySystem()
+    system.sync(store)
+    distances, rows = system.nearest(2)
+    for row in range(4):
+        assert row not in rows[row].tolist()
+        assert set(rows[row].tolist()) <= {0, 1, 2, 3}
+        assert distances[row].tolist() == [0.0, 0.0]
+    assert 4 not in rows[4].tolist()
+
+def test_nearest_skips_removed_rows():
+    store = _store([(1.0, 0.0), (2.0, 0.0), (3.0, 0.0), (10.0, 0.0)])
+    store.remove("e1")
+    system = EntitySystem()
+    system.sync(store)
+    distances, rows = system.nearest(1)
+    assert rows[:, 0].tolist() == [2, -1, 0, 2]
+    assert np.isinf(distances[1, 0])
+    np.testing.assert_allclose(distances[[0, 2, 3], 0], [2.0, 2.0, 7.0])
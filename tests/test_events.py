@@ -0,0 +1,83 @@
+import pytest
+
+from src.core.events import ENTITIES, METRICS, TICK, EventBus
+from src.core.simulation_engine import SimulationEngine
+
+def test_events_coalesce_until_drained():
+    bus = EventBus()
+    subscription = bus.subscribe()
+    assert not subscription.pending and subscription.drain() is None
+    for tick in (1, 2, 3):
+        bus.publish_tick(tick)
+    bus.publish_metrics({'a': 1.0, 'b': 2.0})
+    bus.publish_metrics({'a': 3.0})
+    bus.publish_metrics({})
+    assert subscription.pending
+
+    update = subscription.drain()
+    assert (update.time_step, update.ticks) == (3, 3)
+    assert update.metrics == {'a': 3.0, 'b': 2.0}
+    assert not subscription.pending and subscription.drain() is None
+    bus.publish_tick(4)
+    assert subscription.drain().ticks == 1
+
+def test_entity_churn_within_a_batch():
+    bus = EventBus()
+    subscription = bus.subscribe([ENTITIES])
+    bus.publish_entity_added("new")
+    bus.publish_entity_removed("new")      # added and removed: never seen
+    bus.publish_entity_removed("old")
+    bus.publish_entity_added("old")        # removed and re-added: in both
+    update = subscription.drain()
+    assert update.added == {"old"} and update.removed == {"old"}
+
+def test_notify_once_per_batch_and_topic_filtering():
+    bus = EventBus()
+    calls = []
+    ticks = bus.subscribe([TICK], notify=lambda: calls.append('tick'))
+    metrics = bus.subscribe([METRICS])
+    for tick in range(5):
+        bus.publish_tick(tick)
+    assert calls == ['tick'] and not metrics.pending
+    ticks.drain()
+    bus.publish_tick(5)
+    assert calls == ['tick', 'tick']
+
+    metrics.close()
+    assert not bus.has_subscribers(METRICS)
+    bus.publish_metrics({'a': 1.0})
+    assert metrics.drain() is None
+    with pytest.raises(ValueError):
+        bus.subscribe(['weather'])
+
+def test_published_metrics_are_not_retained():
+    bus = EventBus()
+    subscription = bus.subscribe([METRICS])
+    changed = {'a': 1.0}
+    bus.publish_metrics(changed)
+    changed['a'] = 2.0
+    assert subscription.drain().metrics == {'a': 1.0}
+
+def test_engine_sends_current_metrics_then_only_changes():
+    engine = SimulationEngine(seed=0)
+    engine.add_entity("a", {'x': 1.0})
+    subscription = engine.subscribe()
+    first = subscription.drain()
+    assert set(first.metrics) == set(engine.get_metrics())
+    assert first.added == set()  # entities added before subscribing are not replayed
+
+    engine.start()
+    for _ in range(3):
+        engine.step()
+    update = subscription.drain()
+    assert (update.time_step, update.ticks) == (3, 3)
+    assert update.metrics == dict(engine.get_metrics())
+    # Fidelity, economy and compliance hold still; only the random metric moves
+    engine.step()
+    update = subscription.drain()
+    assert update.metrics == {'ai_evolution': engine.get_metrics()['ai_evolution']}
+
+    engine.add_entity("b", None)
+    engine.remove_entity("a")
+    update = subscription.drain()
+    assert update.added == {"b"} and update.removed == {"a"}
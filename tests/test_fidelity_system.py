@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from src.core.fidelity_system import FidelitySystem
+
+ROWS = 200
+
+@pytest.fixture
+def inputs():
+    rng = np.random.default_rng(0)
+    uniform = lambda low=0.0, high=1.0: rng.uniform(low, high, ROWS)
+    return {
+        'structural': {'material_correctness': uniform(), 'architectural_fidelity': uniform(),
+                       'deviation_reference': uniform(0.0, 1.5)},
+        'behavioral': {'social_response': uniform(), 'cultural_dynamics': uniform(),
+                       'human_baseline': uniform(0.0, 1.5), 'emergent_factor': uniform(),
+                       'beta': uniform()},
+        'cognitive': {'reasoning_capability': uniform(), 'learning_efficiency': uniform(),
+                      'consciousness_emergence': uniform(), 'theoretical_ceiling': uniform(0.0, 1.5)},
+        'data': {'data_accuracy': uniform(), 'update_frequency': uniform(),
+                 'error_rate': uniform(), 'quality_factor': uniform()},
+        'physics': {'scale_weights': rng.uniform(0, 1, (ROWS, 3)),
+                    'physical_accuracy': rng.uniform(0, 1, (ROWS, 3)),
+                    'interaction_complexity': rng.uniform(0, 1, (ROWS, 3)),
+                    'energy_drift': rng.uniform(0, 2, (ROWS, 3))},
+    }
+
+def _scalar_args(component, arrays, row):
+    if component == 'physics':
+        return {name: dict(enumerate(values[row].tolist())) for name, values in arrays.items()}
+    args = {name: float(values[row]) for name, values in arrays.items()}
+    if component == 'structural':
+        args['level'] = 1
+    return args
+
+@pytest.mark.parametrize('component', ['physics', 'structural', 'behavioral', 'cognitive', 'data'])
+def test_scalar_matches_batch(inputs, component):
+    """The per-tick scalar formulas must stay identical to the batch kernels"""
+    arrays = inputs[component]
+    expected = getattr(FidelitySystem, f"batch_{component}_fidelity")(**arrays)
+    system = FidelitySystem()
+    calculate = getattr(system, f"calculate_{component}_fidelity")
+    scalar = [calculate(**_scalar_args(component, arrays, row)) for row in range(ROWS)]
+    np.testing.assert_array_equal(scalar, expected)
+
+def test_total_matches_batch(inputs):
+    system = FidelitySystem()
+    system.update_weights({'physics': 0.1, 'structural': 0.3, 'behavioral': 0.2,
+                           'cognitive': 0.25, 'data': 0.15})
+    scores = system.calculate_batch(**inputs)
+    for row in range(ROWS):
+        for component, arrays in inputs.items():
+            getattr(system, f"calculate_{component}_fidelity")(**_scalar_args(component, arrays, row))
+        assert system.calculate_total_fidelity() == scores['total'][row]
+
+def test_cache_recomputes_on_change():
+    system = FidelitySystem()
+    first = system.calculate_data_fidelity(0.9, 0.8, 0.1, 0.9)
+    assert system.calculate_data_fidelity(0.9, 0.8, 0.1, 0.9) == first
+    assert system.calculate_data_fidelity(0.9, 0.8, 0.5, 0.9) < first
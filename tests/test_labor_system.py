@@ -0,0 +1,85 @@
+import numpy as np
+
+from src.economy.labor_system import LaborSystem
+
+def test_matches_employer_in_neighbouring_cell():
+    labor = LaborSystem(cell_size=50.0)
+    labor.set_employers([50.5], [10.0], [0.0], [20.0], [1])
+    result = labor.match([49.5], [10.0], [0.5], [0.0])
+    assert result.employer.tolist() == [0]
+    assert result.wage.tolist() == [20.0]
+
+def test_does_not_reach_beyond_neighbouring_cells():
+    labor = LaborSystem(cell_size=50.0)
+    labor.set_employers([160.0], [10.0], [0.0], [20.0], [1])
+    assert labor.match([10.0], [10.0], [0.5], [0.0]).matched == 0
+
+def test_filters_by_skill_before_taking_top_candidates():
+    labor = LaborSystem(cell_size=50.0, candidates=2)
+    # The two best-paying slots need more skill than the seeker has
+    labor.set_employers([10.0, 11.0, 12.0], [10.0, 10.0, 10.0],
+                        [0.9, 0.9, 0.1], [40.0, 35.0, 20.0], [1, 1, 1])
+    result = labor.match([10.0], [10.0], [0.2], [0.0])
+    assert result.employer.tolist() == [2]
+
+def test_offers_below_reservation_wage_are_never_taken():
+    labor = LaborSystem(cell_size=50.0, candidates=2)
+    labor.set_employers([10.0, 60.0], [10.0, 10.0], [0.0, 0.0], [30.0, 10.0], [1, 1])
+    result = labor.match([10.0, 10.0, 10.0], [10.0, 10.0, 10.0], [1.0, 1.0, 1.0], [25.0, 15.0, 5.0])
+    # Only the third seeker accepts the 10 offer once the 30 slot is gone
+    assert result.employer.tolist() == [0, -1, 1]
+
+def test_openings_are_respected_and_filled():
+    labor = LaborSystem(cell_size=50.0)
+    labor.set_employers([10.0, 60.0], [10.0, 10.0], [0.0, 0.0], [30.0, 20.0], [2, 1])
+    result = labor.match(np.full(5, 20.0), np.full(5, 10.0), np.ones(5), np.zeros(5))
+    assert result.matched == 3
+    assert np.bincount(result.employer[result.employer >= 0]).tolist() == [2, 1]
+    assert labor.vacancies() == 0
+    assert labor.match([20.0], [10.0], [1.0], [0.0]).matched == 0
+    labor.release([1])
+    assert labor.match([20.0], [10.0], [1.0], [0.0]).employer.tolist() == [1]
+
+def test_best_prefix_candidates_match_brute_force():
+    rng = np.random.default_rng(3)
+    labor = LaborSystem(cell_size=100.0, candidates=3, rounds=1)
+    n = 300
+    labor.set_employers(rng.random(n) * 500, rng.random(n) * 500, rng.random(n),
+                        rng.uniform(10, 50, n), np.ones(n, dtype=np.int64))
+    x, y, skill = rng.random(50) * 500, rng.random(50) * 500, rng.random(50)
+    reservation = rng.uniform(10, 40, 50)
+    labor._build_index()
+    position = (x + 1j * y).astype(np.complex64)
+    offers, count, more = labor._candidates(labor._prefixes(x, y, skill), position, skill, reservation)
+    cx, cy = np.floor(labor.employer_x / 100), np.floor(labor.employer_y / 100)
+    for i in range(50):
+        near = ((np.abs(cx - np.floor(x[i] / 100)) <= 1) & (np.abs(cy - np.floor(y[i] / 100)) <= 1)
+                & (labor.required_skill <= skill[i]) & (labor.wage >= reservation[i]))
+        eligible = set(np.flatnonzero(near).tolist())
+        found = offers[i, :count[i]]
+        assert set(found.tolist()) <= eligible and len(set(found.tolist())) == count[i]
+        # Without `more` the list is every eligible employer in reach
+        assert len(found) >= min(3, len(eligible))
+        if not more[i]:
+            assert len(found) == len(eligible)
+        # Offers come best first
+        scores = labor._score(found[None, :], position[i:i + 1], skill[i:i + 1])[0]
+        assert np.all(np.diff(scores) <= 0)
+
+def test_match_runs_until_no_proposals_remain():
+    # Every seeker first proposes to the best-paying employer, which fills one
+    # opening per round, so a fixed handful of rounds would leave most unfilled
+    n = 12
+    labor = LaborSystem(cell_size=50.0, candidates=2)
+    labor.set_employers(np.full(n, 10.0), np.full(n, 10.0), np.zeros(n),
+                        100.0 - np.arange(n), np.ones(n, dtype=np.int64))
+    result = labor.match(np.full(n, 10.0), np.full(n, 10.0), np.ones(n), np.zeros(n))
+    assert result.matched == n and labor.vacancies() == 0
+    assert sorted(result.employer.tolist()) == list(range(n))
+
+def test_rounds_caps_proposals():
+    n = 12
+    labor = LaborSystem(cell_size=50.0, candidates=2, rounds=4)
+    labor.set_employers(np.full(n, 10.0), np.full(n, 10.0), np.zeros(n),
+                        100.0 - np.arange(n), np.ones(n, dtype=np.int64))
+    assert labor.match(np.full(n, 10.0), np.full(n, 10.0), np.ones(n), np.zeros(n)).matched == 4
@@ -0,0 +1,28 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip('PyQt6.QtWidgets')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_first_paint_does_not_load_numpy():
+    # A fresh interpreter: this one has NumPy loaded by the other tests
+    script = (
+        "import sys\n"
+        "from PyQt6.QtWidgets import QApplication\n"
+        "app = QApplication([])\n"
+        "from src.ui.main_window import MainWindow\n"
+        "window = MainWindow()\n"
+        "window.show()\n"
+        "window.repaint()\n"
+        "assert window.simulation_engine is None\n"
+        "print('numpy' in sys.modules)\n"
+    )
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+    result = subprocess.run([sys.executable, '-c', script], cwd=ROOT, env=env,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == 'False'
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from src.core.economy_system import EconomySystem
+from src.core.simulation_engine import SimulationEngine
+from src.economy.market import BUY, SELL, Market
+from src.economy.transactions import PURCHASE
+
+def test_batch_auction_price_and_priority():
+    market = Market(1)
+    market.submit([1, 2, 3, 4], 0, [BUY, BUY, SELL, SELL], [11.0, 10.0, 9.0, 10.0], [5, 5, 4, 4])
+    result = market.clear()[0]
+    assert result.volume == 8
+    assert result.price == 10.0
+    # The 11 bid fills first; the 10 bid gets what is left
+    buyers = dict(zip(result.agents[result.sides == BUY].tolist(),
+                      result.quantities[result.sides == BUY].tolist()))
+    assert buyers == {1: 5.0, 2: 3.0}
+    assert market.depth().tolist() == [1]
+
+def test_trades_pair_fills_and_conserve_quantity():
+    rng = np.random.default_rng(1)
+    market = Market(1)
+    n = 200
+    market.submit(rng.integers(0, 50, n), 0, rng.integers(0, 2, n),
+                  np.round(rng.normal(100, 3, n), 1), rng.integers(1, 10, n).astype(float))
+    result = market.clear()[0]
+    buyers, sellers, quantities = result.trades()
+    assert quantities.sum() == pytest.approx(result.volume)
+    assert np.all(quantities > 0)
+    buy_fills = result.quantities[result.sides == BUY]
+    bought = np.bincount(buyers, weights=quantities, minlength=50)
+    expected = np.bincount(result.agents[result.sides == BUY], weights=buy_fills, minlength=50)
+    np.testing.assert_allclose(bought, expected)
+    sold = np.bincount(sellers, weights=quantities, minlength=50)
+    expected = np.bincount(result.agents[result.sides == SELL],
+                           weights=result.quantities[result.sides == SELL], minlength=50)
+    np.testing.assert_allclose(sold, expected)
+
+def test_update_settles_auction_into_ledger():
+    economy = EconomySystem(goods=2)
+    economy.market.submit([1, 2], [0, 0], [BUY, SELL], [10.0, 10.0], [3.0, 3.0])
+    economy.update(5)
+    ledger = economy.ledger
+    rows = ledger.transactions(5, 6)
+    assert rows['kind'].tolist() == [PURCHASE]
+    assert (rows['payer'][0], rows['payee'][0], rows['amount'][0]) == (1, 2, 30.0)
+    assert ledger.balance(1) == -30.0 and ledger.balance(2) == 30.0
+    assert economy.indicators.gdp == 30.0
+    # Nothing left to trade: the next tick records nothing
+    economy.update(6)
+    assert ledger.tick_count(6) == 0
+
+def test_engine_clears_market_every_tick():
+    engine = SimulationEngine(seed=0)
+    engine.start()
+    engine.economy.market.submit([7, 8], [0, 0], [BUY, SELL], [5.0, 4.0], [1.0, 1.0])
+    engine.step()
+    assert engine.economy.market.clear_count == 1
+    assert engine.economy.ledger.tick_count(1) == 1
+    assert engine.economy.ledger.balance(8) == 4.5
+
+def test_restart_starts_a_new_ledger():
+    engine = SimulationEngine(seed=0)
+    engine.start()
+    engine.economy.market.submit([1, 2], [0, 0], [BUY, SELL], [1.0, 1.0], [1.0, 1.0])
+    for _ in range(3):
+        engine.step()
+    engine.start()
+    assert len(engine.economy.ledger) == 0
+    engine.economy.market.submit([1, 2], [0, 0], [BUY, SELL], [1.0, 1.0], [1.0, 1.0])
+    engine.step()  # tick 1 again must not be rejected as going back in time
+    assert len(engine.economy.ledger) == 1
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from src.core.metrics_history import MetricsHistory
+
+def _history(ticks, capacity=6, factors=(1, 4)):
+    history = MetricsHistory(['a', 'b'], capacity=capacity, factors=factors)
+    for tick in range(ticks):
+        history.append(tick, {'a': float(tick), 'b': -float(tick), 'unused': 0.0})
+    return history
+
+def test_raw_tier_wraps_around_keeping_the_newest():
+    history = _history(30)
+    assert len(history) == 30
+    raw = history.series('a')
+    assert raw.ticks.tolist() == list(range(24, 30))
+    assert raw.mean.tolist() == [float(t) for t in range(24, 30)]
+    assert history.latest() == {'a': 29.0, 'b': -29.0}
+
+def test_coarse_tier_keeps_block_min_mean_max():
+    history = _history(30)
+    # 30 ticks make 7 blocks of 4; the ring keeps the newest 6. Capacity 6
+    # is not a multiple of 4, so some blocks straddle the raw ring's end
+    coarse = history.series('a', tier=1)
+    starts = list(range(4, 28, 4))
+    assert coarse.factor == 4
+    assert coarse.ticks.tolist() == starts
+    assert coarse.mean.tolist() == [start + 1.5 for start in starts]
+    assert coarse.min.tolist() == starts
+    assert coarse.max.tolist() == [start + 3.0 for start in starts]
+    assert history.series('b', tier=1).min.tolist() == [-(start + 3.0) for start in starts]
+
+def test_cascade_through_several_tiers():
+    history = _history(1000, capacity=16, factors=(1, 10, 100))
+    top = history.series('a', tier=2)
+    assert top.ticks.tolist() == list(range(0, 1000, 100))
+    np.testing.assert_allclose(top.mean, np.arange(0, 1000, 100) + 49.5)
+    assert top.max.tolist() == list(range(99, 1000, 100))
+
+def test_series_since_and_window_pick_a_tier():
+    history = _history(30)
+    assert history.series('a', since=27).ticks.tolist() == [27, 28, 29]
+    assert history.series('a', tier=1, since=15).ticks.tolist() == [16, 20, 24]
+    assert history.window('a', span=4).factor == 1
+    # The raw tier no longer reaches back 20 ticks, so the coarse one is used
+    assert history.window('a', span=20).factor == 4
+    assert history.window('a', span=6, max_points=2).factor == 4
+
+def test_clear_and_validation():
+    history = _history(10)
+    history.clear()
+    assert len(history) == 0 and history.latest() == {}
+    assert len(history.series('a', tier=1).ticks) == 0
+    with pytest.raises(KeyError):
+        history.append(0, {'a': 1.0})
+    with pytest.raises(ValueError):
+        MetricsHistory(['a'], factors=(10, 100))
+    with pytest.raises(ValueError):
+        MetricsHistory(['a'], capacity=8, factors=(1, 3, 10))
+    with pytest.raises(ValueError):
+        MetricsHistory(['a'], capacity=8, factors=(1, 10))
@@ -0,0 +1,51 @@
+import tracemalloc
+
+from src.core.profiler import TickProfiler
+from src.core.simulation_engine import SimulationEngine
+
+def test_summary_reports_block_growth():
+    engine = SimulationEngine(seed=0)
+    engine.profiler.enabled = True
+    engine.start()
+    for _ in range(50):
+        engine.step()
+    summary = engine.profiler.summary()
+    assert summary['tick']['count'] == 50
+    assert 'block_growth' in summary['tick']
+    assert 'allocations' not in summary['tick']
+    assert set(name for name, _ in engine.phases) <= set(summary)
+
+def test_retained_objects_show_as_block_growth():
+    profiler = TickProfiler()
+    kept = []
+    for _ in range(10):
+        profiler.begin_tick()
+        kept.extend(object() for _ in range(100))
+        profiler.end_tick()
+    assert profiler.summary()['tick']['block_growth'] >= 100
+
+def _capture(profiler, mode, ticks=3):
+    profiler.capture(ticks, mode)
+    assert profiler.enabled
+    for _ in range(ticks):
+        profiler.begin_tick()
+        profiler.end_tick()
+
+def test_capture_restores_enabled_state():
+    for enabled in (False, True):
+        for mode in ('cprofile', 'tracemalloc'):
+            profiler = TickProfiler(enabled=enabled)
+            _capture(profiler, mode)
+            assert profiler.enabled is enabled
+            assert profiler.last_capture is not None
+
+def test_tracemalloc_capture_leaves_an_outer_trace_running():
+    profiler = TickProfiler()
+    tracemalloc.start()
+    try:
+        _capture(profiler, 'tracemalloc')
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    _capture(profiler, 'tracemalloc')
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,32 @@
+import subprocess
+import sys
+
+import pytest
+
+from src.core.run import main, run
+
+def test_run_returns_stats_and_metrics():
+    result = run(20, seed=1, entities=10)
+    assert result['steps'] == 20 and result['elapsed'] > 0
+    assert result['steps_per_sec'] > 0
+    assert 0.0 <= result['legal_compliance'] <= 1.0
+
+def test_main_prints_throughput_and_metrics(capsys):
+    main(['--steps', '5', '--seed', '1', '--entities', '3'])
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith("5 steps in ")
+    assert [line.split(':')[0] for line in lines[1:]] == [
+        'fidelity_index', 'economic_health', 'ai_evolution', 'legal_compliance']
+
+def test_cli_exit_status():
+    ok = subprocess.run([sys.executable, '-m', 'src.core.run', '--steps', '3', '--seed', '0'],
+                        capture_output=True, text=True)
+    assert ok.returncode == 0 and "3 steps in" in ok.stdout
+    bad = subprocess.run([sys.executable, '-m', 'src.core.run', '--steps', 'many'],
+                         capture_output=True, text=True)
+    assert bad.returncode == 2 and "--steps" in bad.stderr
+
+def test_main_rejects_unknown_options():
+    with pytest.raises(SystemExit) as error:
+        main(['--frobnicate'])
+    assert error.value.code == 2
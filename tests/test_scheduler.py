@@ -0,0 +1,71 @@
+import threading
+import time
+
+from src.core.scheduler import FixedStepScheduler
+from src.core.simulation_engine import SimulationEngine
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+def _workers():
+    return [thread for thread in threading.enumerate() if thread.name == "simulation"]
+
+def test_start_pause_resume_stop():
+    engine = SimulationEngine(seed=0)
+    scheduler = FixedStepScheduler(engine, sim_hz=0, ui_hz=0)
+    scheduler.start()
+    assert scheduler.running
+    _wait_for(lambda: engine.state.time_step > 10)
+
+    scheduler.pause()
+    assert not scheduler.running
+    _wait_for(lambda: scheduler.latest_snapshot() is not None)
+    paused_at = engine.state.time_step
+    time.sleep(0.02)
+    assert engine.state.time_step == paused_at
+
+    scheduler.start()  # resumes rather than restarting the engine
+    _wait_for(lambda: engine.state.time_step > paused_at + 10)
+    assert scheduler.stop()
+    assert not scheduler.running and not _workers()
+    assert scheduler.latest_snapshot()['time_step'] == engine.state.time_step
+
+def test_restart_after_stop_starts_a_fresh_run():
+    engine = SimulationEngine(seed=0)
+    scheduler = FixedStepScheduler(engine, sim_hz=0, ui_hz=0)
+    scheduler.start()
+    _wait_for(lambda: engine.state.time_step > 100)
+    assert scheduler.stop()
+    scheduler.start()
+    _wait_for(lambda: engine.state.time_step > 0)
+    assert len(_workers()) == 1
+    assert scheduler.stop()
+
+def test_restart_waits_for_a_tick_that_outlived_stop():
+    engine = SimulationEngine(seed=0)
+    inside, release = threading.Event(), threading.Event()
+    active, overlaps = [0], []
+
+    def slow_phase():
+        active[0] += 1
+        overlaps.append(active[0])
+        inside.set()
+        release.wait()
+        active[0] -= 1
+
+    engine.phases.append(('slow', slow_phase))
+    scheduler = FixedStepScheduler(engine, sim_hz=0, ui_hz=0)
+    scheduler.start()
+    assert inside.wait(5.0)
+    assert not scheduler.stop(timeout=0.01)
+    assert len(_workers()) == 1
+
+    threading.Timer(0.05, release.set).start()
+    scheduler.start()  # joins the old worker before spawning the new one
+    _wait_for(lambda: engine.state.time_step > 5)
+    assert len(_workers()) == 1
+    assert scheduler.stop()
+    assert max(overlaps) == 1
@@ -0,0 +1,94 @@
+from multiprocessing import shared_memory
+
+import pytest
+
+from src.core import run as run_module
+from src.core.sharding import ShardedSimulation
+from src.core.simulation_engine import SimulationEngine
+
+def _engine(ids):
+    engine = SimulationEngine(seed=0)
+    for i, entity_id in enumerate(ids):
+        engine.add_entity(entity_id, {'x': 40.0 + i * 5.0, 'y': 0.0, 'vx': 4.0, 'vy': 0.0,
+                                      'tag': entity_id})
+    engine.start()
+    return engine
+
+def _released(names):
+    for name in names.values():
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+    return True
+
+def test_ids_and_payloads_survive_a_sharded_run():
+    # Long and non-ASCII ids, crossing shard boundaries while sharded
+    ids = [f"entity_{i}_" + "x" * 40 for i in range(4)] + ["Zürich-Straße", "東京"]
+    engine = _engine(ids)
+    sharded = ShardedSimulation(engine, shards=2, district_width=10.0)
+    sharded.start()
+    sharded.step(5)
+    sharded.stop()
+    store = engine.state.entities
+    assert sorted(store) == sorted(ids)
+    for entity_id in ids:
+        assert store[entity_id]['tag'] == entity_id
+    assert sorted(store.column('x')[store.active_rows()].tolist()) == [60.0 + i * 5.0 for i in range(6)]
+
+def test_ids_with_nul_are_rejected():
+    sharded = ShardedSimulation(_engine(["bad\0"]), shards=2)
+    with pytest.raises(ValueError):
+        sharded.start()
+    assert not sharded.running
+
+def test_stop_releases_shared_memory_when_a_worker_died():
+    sharded = ShardedSimulation(_engine(["a", "b"]), shards=2)
+    sharded.start()
+    names = dict(sharded._buffers.names)
+    sharded._workers[0].kill()
+    sharded._workers[0].join()
+    with pytest.raises((EOFError, OSError)):
+        sharded.stop()
+    assert not sharded.running
+    assert _released(names)
+    # The entities fall back to the store the engine had at start()
+    assert sorted(sharded.engine.state.entities) == ["a", "b"]
+
+def test_failed_step_gives_the_entities_back():
+    engine = _engine(["a", "b", "c"])
+    sharded = ShardedSimulation(engine, shards=2)
+    sharded.start()
+    sharded._workers[1].kill()
+    sharded._workers[1].join()
+    with pytest.raises((EOFError, OSError)):
+        sharded.step()
+    assert not sharded.running
+    assert sorted(engine.state.entities) == ["a", "b", "c"]
+    sharded.stop()
+
+def test_entity_migrates_into_a_shard_that_started_empty():
+    engine = SimulationEngine(seed=0)
+    for i in range(5):
+        engine.add_entity(f"e{i}", {'x': 1.0 + i, 'vx': 0.0})
+    engine.add_entity("mover", {'x': 8.0, 'vx': 3.0})
+    engine.start()
+    # Every entity starts in district 0, so shard 1 starts empty
+    sharded = ShardedSimulation(engine, shards=2, district_width=10.0)
+    sharded.start()
+    sharded.step(3)
+    # Counts are taken after each step, before that tick's exchange
+    assert sharded.entity_counts().tolist() == [5, 1]
+    sharded.stop()
+    store = engine.state.entities
+    assert len(store) == 6
+    assert store.get("mover")['x'] == 17.0
+
+def test_failed_run_stops_workers(monkeypatch):
+    names = {}
+
+    def fail(self, steps=1):
+        names.update(self._buffers.names)
+        raise RuntimeError("step failed")
+    monkeypatch.setattr(ShardedSimulation, 'step', fail)
+    with pytest.raises(RuntimeError):
+        run_module.run(3, seed=0, entities=10, shards=2)
+    assert _released(names)
@@ -0,0 +1,38 @@
+import csv
+
+from src.core.sweep import SweepRunner, run_config
+
+def _rows(path):
+    with open(path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    for row in rows:
+        del row['elapsed']
+    return sorted(rows, key=lambda row: row['run_id'])
+
+def test_replicates_fill_one_row_each_and_resume(tmp_path):
+    output = tmp_path / "sweep.csv"
+    configs = [{'data.error_rate': 0.1}, {'data.error_rate': 0.2}]
+    runner = SweepRunner(str(output), steps=20, workers=2, replicates=3, entities=50)
+    assert runner.run(configs) == 6
+    rows = _rows(output)
+    assert len({row['run_id'] for row in rows}) == 6
+    assert sorted((row['data.error_rate'], row['replicate']) for row in rows) == [
+        (rate, str(replicate)) for rate in ('0.1', '0.2') for replicate in range(3)]
+    assert {row['entities'] for row in rows} == {'50'}
+    # Replicates share their configuration's base seed but not their outcome
+    first = [row for row in rows if row['data.error_rate'] == '0.1']
+    assert len({row['seed'] for row in first}) == 1
+    assert len({row['ai_evolution'] for row in first}) == 3
+    assert runner.run(configs) == 0
+
+def test_sweeps_are_reproducible(tmp_path):
+    configs = [{'weights.physics': 0.3}]
+    for name in ("a.csv", "b.csv"):
+        SweepRunner(str(tmp_path / name), steps=20, workers=1, replicates=2, entities=50).run(configs)
+    assert _rows(tmp_path / "a.csv") == _rows(tmp_path / "b.csv")
+
+def test_entities_reach_the_run():
+    empty = run_config({}, 50, seed=1)
+    populated = run_config({}, 50, seed=1, entities=500)
+    assert empty['legal_compliance'] == 1.0
+    assert populated['legal_compliance'] < 1.0
@@ -0,0 +1,31 @@
+import pytest
+
+pytest.importorskip('PyQt6.QtCore')
+from PyQt6.QtCore import Qt
+
+from src.core.entity_store import EntityStore
+from src.ui.table_models import EntityTableModel
+
+def _model():
+    store = EntityStore()
+    for entity_id, wealth, district in (('a', 3.0, 2), ('b', 1.0, 0), ('c', 2.0, 1)):
+        store.add(entity_id, {'wealth': wealth, 'district': district})
+    return EntityTableModel(store)
+
+def _ids(model):
+    return [model.data(model.index(row, 0)) for row in range(model.rowCount())]
+
+def test_sort_by_column():
+    model = _model()
+    model.sort(model.headers.index('wealth'))
+    assert _ids(model) == ['b', 'c', 'a']
+    model.sort(model.headers.index('wealth'), Qt.SortOrder.DescendingOrder)
+    assert _ids(model) == ['a', 'c', 'b']
+
+def test_negative_column_means_unsorted():
+    model = _model()
+    model.sort(model.headers.index('wealth'))
+    # What a view sends for setSortIndicator(-1) with sorting enabled
+    model.sort(-1)
+    assert _ids(model) == ['a', 'b', 'c']
+    assert model._sort is None
@@ -0,0 +1,69 @@
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip('PyQt6.QtWidgets')
+from PyQt6.QtGui import QPolygonF
+from PyQt6.QtWidgets import QApplication
+
+from src.core.metrics_history import MetricsHistory
+from src.ui.time_series_chart import TimeSeriesChart, _fill, decimate
+
+@pytest.fixture(scope='module')
+def app():
+    if not os.environ.get('QT_QPA_PLATFORM'):
+        os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+    return QApplication.instance() or QApplication([])
+
+def test_decimate_keeps_each_bucket_envelope():
+    x = np.arange(10.0)
+    y = np.array([0, 5, 1, 1, -3, 2, 2, 2, 9, 0], dtype=float)
+    dx, low, high = decimate(x, y, y, 5)
+    assert dx.tolist() == [0, 2, 4, 6, 8]
+    assert low.tolist() == [0, 1, -3, 2, 0]
+    assert high.tolist() == [5, 1, 2, 2, 9]
+    # Short inputs come back untouched
+    assert decimate(x, y, y, 10)[1] is y
+
+def test_fill_copies_points_into_the_polygon():
+    polygon = QPolygonF()
+    points = np.array([[0.0, 1.0], [2.0, 3.0], [4.0, 5.0]])
+    _fill(polygon, points)
+    assert [(p.x(), p.y()) for p in polygon] == [(0, 1), (2, 3), (4, 5)]
+    _fill(polygon, points[:1])
+    assert polygon.size() == 1
+
+def test_paint_decimates_to_the_plot_width(app):
+    chart = TimeSeriesChart('test')
+    chart.resize(200, 150)
+    x = np.arange(100_000, dtype=float)
+    chart.add_series('sine', lambda: (x, np.sin(x / 1000), None, None))
+    chart.grab()
+    series = chart._series[0]
+    # Two points (min, max) per horizontal pixel of the plot, not per sample
+    assert 0 < series.line.size() <= 2 * chart.width()
+    assert series.latest == pytest.approx(np.sin(99.999))
+
+def test_paint_history_with_and_without_envelope(app):
+    history = MetricsHistory(['m'], capacity=64, factors=(1, 8))
+    for tick in range(200):
+        history.append(tick, {'m': float(tick % 10)})
+    chart = TimeSeriesChart()
+    chart.resize(100, 120)
+    chart.add_history(history, ['m'], span=40)
+    x, y, low, high = chart._series[0].source()
+    assert low is None and x.tolist() == list(range(160, 200))
+    chart.clear()
+    chart.add_history(history, ['m'])  # the whole run: only the coarse tier reaches back
+    x, y, low, high = chart._series[0].source()
+    assert x[0] == 0 and low is not None and high.max() == 9.0
+    chart.grab()
+    assert chart._series[0].latest == y[-1]
+
+def test_empty_chart_paints(app):
+    chart = TimeSeriesChart('empty')
+    chart.resize(100, 100)
+    chart.add_series('none', lambda: (np.empty(0), np.empty(0), None, None))
+    chart.grab()
+    assert chart._series[0].line.size() == 0
@@ -0,0 +1,70 @@
+import gc
+import os
+
+import numpy as np
+import pytest
+
+from src.economy.transactions import PURCHASE, TRANSFER, TransactionLedger
+
+def test_balances_and_tick_totals():
+    ledger = TransactionLedger(chunk_size=4)
+    ledger.record_batch(0, [0, 1, 2], [1, 2, 0], [10.0, 5.0, 1.0])
+    ledger.record_batch(2, [1, 1], [3, 3], [2.0, 3.0], PURCHASE)
+    assert len(ledger) == 5
+    assert ledger.balance(1) == 10.0 - 5.0 - 5.0
+    assert ledger.balance(3) == 5.0
+    assert ledger.balance(99) == 0.0
+    assert ledger.tick_volume(0) == 16.0 and ledger.tick_count(2) == 2
+    rows = ledger.transactions(1, 3)
+    assert rows['kind'].tolist() == [PURCHASE, PURCHASE]
+    np.testing.assert_array_equal(ledger.take('amount', [0, 4]), [10.0, 3.0])
+
+def test_rejects_ticks_going_back():
+    ledger = TransactionLedger()
+    ledger.record(5, 0, 1, 1.0)
+    with pytest.raises(ValueError):
+        ledger.record(4, 0, 1, 1.0)
+
+@pytest.mark.parametrize('payer, payee', [(-1, 3), (3, -1)])
+def test_rejects_negative_agent_ids(payer, payee):
+    ledger = TransactionLedger()
+    ledger.record(0, 2, 3, 7.0)
+    with pytest.raises(ValueError):
+        ledger.record(0, payer, payee, 1.0, TRANSFER)
+    # Nothing was written and no other balance was touched
+    assert len(ledger) == 1
+    np.testing.assert_array_equal(ledger.balances(), [0.0, 0.0, -7.0, 7.0])
+
+def _spilled_ledger():
+    ledger = TransactionLedger(chunk_size=2, max_memory_chunks=1)
+    for tick in range(4):
+        ledger.record_batch(tick, [0, 1], [1, 0], [1.0, 2.0])
+    assert any(chunk.spilled for chunk in ledger.chunks)
+    return ledger
+
+def test_spilled_rows_stay_readable():
+    ledger = _spilled_ledger()
+    assert ledger.column('amount').tolist() == [1.0, 2.0] * 4
+    assert ledger.balance(0) == 4.0
+    ledger.close()
+
+def test_spill_dir_removed_on_close():
+    ledger = _spilled_ledger()
+    directory = ledger.spill_dir
+    assert os.path.isdir(directory)
+    ledger.close()
+    assert not os.path.exists(directory)
+
+def test_closed_ledger_reads_as_empty():
+    ledger = _spilled_ledger()
+    ledger.close()
+    assert len(ledger) == 0 and ledger.last_tick == -1
+    assert ledger.column('amount').tolist() == []
+    assert ledger.transactions(0)['payer'].tolist() == []
+
+def test_spill_dir_removed_when_ledger_is_dropped():
+    ledger = _spilled_ledger()
+    directory = ledger.spill_dir
+    del ledger
+    gc.collect()
+    assert not os.path.exists(directory)